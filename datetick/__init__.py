@@ -1 +1,5 @@
-from datetick.datetick import datetick
\ No newline at end of file
+from datetick.datetick import datetick, datetick_figure
+from datetick.plan import tickplan, TickPlan
+from datetick.ticker import DatetickLocator, DatetickFormatter
+from datetick.scroll import Scroller
+from datetick.rules import load_rules, compile_rules
@@ -0,0 +1,83 @@
+'''
+Command line interface.
+
+    python -m datetick render [jobs.jsonl] [-j N]
+
+renders the jobs in jobs.jsonl (default: stdin), one JSON job per line,
+and writes one JSON result per line to stdout as jobs complete. See
+datetick.render.render() for the job and result format.
+
+    python -m datetick plan [requests.jsonl] [--batch] [-j N] [--dpi DPI] [--rules FILE]
+
+reads {"start", "end", "width_px"} requests (default: stdin), one per
+line, and writes one JSON tick plan per line to stdout, in order. Each
+plan is written as soon as its request is read. With --batch, requests
+are processed in chunks by N worker processes (default: number of CPUs)
+and output is buffered. See datetick.service.plan() for the format.
+'''
+
+import os
+import sys
+import json
+import argparse
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m datetick')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    p = commands.add_parser('render', help='render time ranges to image files')
+    p.add_argument('jobs', nargs='?', default='-',
+                   help='JSONL file of jobs (default: stdin)')
+    p.add_argument('-j', '--processes', type=int, default=None,
+                   help='number of worker processes (default: number of CPUs)')
+
+    p = commands.add_parser('plan', help='write tick plans for time ranges as JSONL')
+    p.add_argument('requests', nargs='?', default='-',
+                   help='JSONL file of requests (default: stdin)')
+    p.add_argument('--batch', action='store_true',
+                   help='use worker processes and buffer output')
+    p.add_argument('-j', '--processes', type=int, default=None,
+                   help='number of worker processes for --batch (default: number of CPUs)')
+    p.add_argument('--dpi', type=float, default=96,
+                   help='pixels per inch of width_px (default: 96)')
+    p.add_argument('--rules', default=None,
+                   help='JSON or TOML rule file (see datetick.load_rules)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'render':
+        from datetick.render import render
+        with _open(args.jobs) as f:
+            ok = True
+            for result in render(_jsonl(f), processes=args.processes):
+                ok = ok and result['ok']
+                print(json.dumps(result), flush=True)
+        return 0 if ok else 1
+
+    if args.command == 'plan':
+        from datetick.service import plans
+        processes = 1
+        if args.batch:
+            processes = args.processes or os.cpu_count() or 1
+        with _open(args.requests) as f:
+            for line in plans(f, rules=args.rules, dpi=args.dpi, processes=processes):
+                sys.stdout.write(line + '\n')
+                if not args.batch:
+                    sys.stdout.flush()
+        return 0
+
+def _open(path):
+    if path == '-':
+        return open(sys.stdin.fileno(), 'r', closefd=False)
+    return open(path, 'r')
+
+def _jsonl(f):
+    # Lines are parsed by render(), so that a line that is not valid JSON
+    # gives a result with ok False instead of stopping the stream.
+    for line in f:
+        line = line.strip()
+        if line:
+            yield line
+
+if __name__ == '__main__':
+    sys.exit(main())
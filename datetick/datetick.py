@@ -1,44 +1,16 @@
-import warnings
 from datetime import datetime
 import numpy as np
 
-import matplotlib
 import matplotlib.dates as mpld
-from matplotlib.ticker import FuncFormatter
-
-if matplotlib.get_backend() == 'MacOSX':
-    # With MacOSX backend, draw() does not update the ticks
-    # See warning at
-    # https://matplotlib.org/3.3.0/tutorials/advanced/blitting.html#sphx-glr-tutorials-advanced-blitting-py
-    import sys
-    if sys.version_info[0:2] < (3, 6):
-        # warnings.filterwarnings("ignore", '.*backend.*', category=UserWarning)
-        # the above should work and is better because more specific.
-        warnings.simplefilter("ignore", category=UserWarning)
-    gui_env = ['Qt5Agg', 'QT4Agg', 'GTKAgg', 'TKAgg', 'WXAgg']
-    for gui in gui_env:
-        try:
-            #print('Trying ' + gui)
-            matplotlib.use(gui, force=True)
-            import matplotlib.pyplot as plt
-            #print('Success with ' + gui)
-            break
-        except:
-            #print('Failure with ' + gui)
-            continue
-else:
-    try:
-        import matplotlib.pyplot as plt
-    except:
-        #print('Failed: import matplotlib.pyplot as plt')
-        gui_env = ['Qt5Agg','QT4Agg','GTKAgg','TKAgg','WXAgg']
-        for gui in gui_env:
-            try:
-                matplotlib.use(gui, force=True)
-                import matplotlib.pyplot as plt
-                break
-            except:
-                continue
+
+from datetick.plan import _context
+from datetick.rules import _rule, _locator, _formatter, _labels
+from datetick.ticker import DatetickLocator, DatetickFormatter
+from datetick.scroll import Scroller
+from datetick.profile import _Recorder
+from datetick.metrics import _space, textsize
+from datetick.zones import _zone
+from datetick.epochs import _epoch
 
 def datetick(*args, **kwargs):
     '''
@@ -46,7 +18,60 @@ def datetick(*args, **kwargs):
     of the current figure.
 
     datetick('x', axes=ax) or datetick('y', axes=ax) formats the given
-    axes `ax`.
+    axes `ax`. pyplot is then not used, so figures created with
+    matplotlib.figure.Figure may be ticked and rendered in several threads
+    at once (one figure per thread).
+
+    datetick('x', draw=False) computes the tick positions and labels
+    directly from the axis limits and the selected locator and formatter
+    instead of rendering the figure to read them back. The labels are the
+    same; the canvas is not drawn.
+
+    datetick('x', lazy=True) installs a DatetickLocator and
+    DatetickFormatter on the axis instead. Ticks and labels are then
+    computed by Matplotlib when the axis is drawn, so no limit-change
+    callback is needed.
+
+    datetick('x', scroll=True) installs a datetick.scroll.Scroller on the
+    axis for views that slide a little at a time (e.g., a strip chart
+    updated by a timer). Ticks and labels still in view are kept and only
+    those that enter the view are computed. Use Scroller(ax, blit=True)
+    directly to redraw only the axis and animated artists each frame.
+
+    datetick('x', rules=load_rules('rules.toml')) uses the span rules in
+    rules.toml instead of datetick.rules.DEFAULT_RULES.
+
+    datetick('x', tz='America/New_York') aligns ticks to and labels them in
+    local time in the given time zone (a name or a tzinfo), e.g., day ticks
+    are at local midnight and the context row marks local day changes. The
+    axis values are still UTC datenums. Across a change to or from
+    daylight saving time, ticks follow the local clock.
+
+    datetick('x', epoch='gps') labels an axis whose values are seconds
+    since an epoch, here GPS seconds, as for data plotted with
+    ax.plot(t, y) where t is an array of float or int64 seconds. The data
+    is not converted; only the axis limits and ticks are. epoch is one of
+    the names in datetick.epochs.EPOCHS ('unix', 'gps', 'tai', 'j2000') or
+    an ISO 8601 time, datetime, or datetime64.
+
+    For axes that share an axis (e.g., plt.subplots(n, sharex=True)),
+    datetick() is applied to the group: ticks are planned for and labels
+    read from the bottom (x) or left-most (y) axes, and the shared
+    locators and formatters tick the others. A limit change in any of them
+    re-ticks the group once.
+
+    By default, a callback is connected that re-applies datetick() when
+    the axis limits change. Calling datetick() again on the same axes
+    replaces that callback. With coalesce=s, the callback is delayed until
+    no limit change has occurred for s seconds, so that a burst of changes
+    (e.g., while panning) leads to a single re-tick. coalesce requires a
+    backend with an event loop (timers do not run with, e.g., Agg).
+
+    datetick('x', profile=hook) calls hook(record) at the end of the call,
+    where record is a dict with the time spent in each phase of the call,
+    the number of canvas draws, the rule used, and the number of ticks.
+    See datetick.profile.Collector for a hook that collects records and
+    exports them as a Chrome trace.
 
     Example:
     --------
@@ -65,8 +90,6 @@ def datetick(*args, **kwargs):
     # Based on spacepy/plot/utils.py on 07/10/2017, but many additions.
     # See also https://github.com/JouleCai/geospacelab/blob/master/geospacelab/visualization/mpl/axis_ticks.py
 
-    # TODO: Use numsize() to determine if figure width and height
-    #       will cause overlap when default number major tick labels is used.
     # TODO: If time[0].day > 28, need to make first tick at time[0].day = 28
     #       as needed.
     # TODO: If first data point has fractional seconds, the plot won't have
@@ -75,17 +98,6 @@ def datetick(*args, **kwargs):
     #       "bymicroseconds".
     # TODO: Adjust lower and upper limits as in 366*8 span
 
-    def millis(x, pos):
-        x = matplotlib.dates.num2date(x)
-        label = x.strftime('.%f')
-        label = label[0:3]
-        #label = label.rstrip(".")
-        return label
-
-    def on_xlims_change(ax): datetick('x', **{**kwargs, 'set_cb': False})
-    def on_ylims_change(ax): datetick('y', **{**kwargs, 'set_cb': False})
-    def draw(fig): fig.canvas.draw()
-
     if len(args) == 0:
         dir = 'x'
     else:
@@ -95,6 +107,14 @@ def datetick(*args, **kwargs):
     DOPTS.update({'debug': False})
     DOPTS.update({'set_cb': True})
     DOPTS.update({'axes': None})
+    DOPTS.update({'draw': True})
+    DOPTS.update({'lazy': False})
+    DOPTS.update({'scroll': False})
+    DOPTS.update({'coalesce': 0})
+    DOPTS.update({'rules': None})
+    DOPTS.update({'tz': None})
+    DOPTS.update({'epoch': None})
+    DOPTS.update({'profile': None})
 
     # Override defaults
     for key, value in kwargs.items():
@@ -103,28 +123,79 @@ def datetick(*args, **kwargs):
         else:
             print('Warning: Keyword option "%s" is not valid.' % key)
 
-    if 'axes' in kwargs:
-        axes = kwargs['axes']
+    if DOPTS['axes'] is not None:
+        axes = DOPTS['axes']
         fig = axes.figure
     else:
+        # pyplot is only imported when the current axes are needed.
+        import matplotlib.pyplot as plt
         axes = plt.gca()
         fig = plt.gcf()
 
+    # Axes that share this axis (e.g., plt.subplots(n, sharex=True)) share
+    # its locators and formatters, and each of them gets a limit-change
+    # callback when any of them is zoomed or panned. So that ticks are
+    # planned and the figure is rendered once per change, datetick() is
+    # applied only to the bottom (x) or left-most (y) axes of the group,
+    # which is the one that shows the tick labels.
+    group = _group(axes, dir)
+    axes = group[0]
+    for other in group[1:]:
+        _disconnect(other, dir)
+
     debug = DOPTS['debug']
+    zone = _zone(DOPTS['tz'])
+    tzinfo = None if zone is None else zone.tz
+    epoch = _epoch(DOPTS['epoch'])
 
-    draw(fig)
+    profile = _Recorder(DOPTS['profile'], dir)
+    profile.mark('setup')
+
+    if DOPTS['lazy']:
+        if dir == 'x':
+            axis = axes.xaxis
+        else:
+            axis = axes.yaxis
+        axis.set_major_locator(DatetickLocator(tz=tzinfo, rules=DOPTS['rules'], epoch=epoch))
+        axis.set_minor_locator(DatetickLocator(minor=True, tz=tzinfo, rules=DOPTS['rules'], epoch=epoch))
+        axis.set_major_formatter(DatetickFormatter(rules=DOPTS['rules'], tz=tzinfo, epoch=epoch))
+        _disconnect(axes, dir)
+        profile.mark('locate')
+        profile.finish()
+        return
+
+    if DOPTS['scroll']:
+        Scroller(axes, dir=dir, rules=DOPTS['rules'], tz=tzinfo, epoch=epoch)
+        _disconnect(axes, dir)
+        profile.mark('locate')
+        profile.finish()
+        return
+
+    if DOPTS['draw']:
+        _draw(fig)
+        profile.mark('draw')
+    # Only the data limits and view limits are used; line data, which may
+    # have millions of points, is never accessed.
     bbox = axes.dataLim
 
     if dir == 'x':
         datamin = bbox.x0
         datamax = bbox.x1
         lim = axes.get_xlim()
-        ticks = axes.get_xticks()
     else:
         datamin = bbox.y0
         datamax = bbox.y1
         lim = axes.get_ylim()
-        ticks = axes.get_yticks()
+
+    if not (np.isfinite(datamin) and np.isfinite(datamax)) or datamin > datamax:
+        # No data (e.g., only the limits were set), so dataLim is empty.
+        datamin = min(lim)
+        datamax = max(lim)
+
+    if epoch is not None:
+        # Axis values are seconds since epoch; ticks are planned in datenums.
+        lim = tuple(epoch.todatenum(lim).tolist())
+        datamin, datamax = epoch.todatenum([datamin, datamax]).tolist()
 
     try:
         mpld.num2date(lim[0])
@@ -151,253 +222,42 @@ def datetick(*args, **kwargs):
     tmax = lim[1]
 
     time = mpld.num2date((tmin,tmax))
+    profile.mark('validate')
 
     if datamin == datamax:
-        axes.set_xticks([mpld.num2date(datamin)])
-        axes.set_xticklabels([datetime.strftime(mpld.num2date(datamin),'%Y-%m-%dT%H:%M:%S')])
+        label = datetime.strftime(mpld.num2date(datamin, tz=tzinfo),'%Y-%m-%dT%H:%M:%S')
+        tick = mpld.num2date(datamin) if epoch is None else float(epoch.fromdatenum(datamin))
+        if dir == 'x':
+            axes.set_xticks([tick])
+            axes.set_xticklabels([label])
+        else:
+            axes.set_yticks([tick])
+            axes.set_yticklabels([label])
+        profile.mark('apply')
+        profile.set(major_ticks=1)
+        profile.finish()
         return
 
     deltaT = time[-1] - time[0]
-    nDays  = deltaT.days
-    nHours = deltaT.days * 24.0 + deltaT.seconds/3600.0
-    nSecs  = deltaT.total_seconds()
     if debug:
         print("Total seconds: %s" % deltaT.total_seconds())
 
-    # fmt1 is format of the tick labels
-    # fmt2 contains additional information that is used for the first tick label
-    # or when there is a major change. For example, if
-    #   fmt1 = %M:%S and fmt2 = %H,
-    # the labels will have only minute and hour and the first tick will have a
-    # label of %M:%S\n%H. If there is a change in hour somewhere on the axis,
-    # that label will include the new hour.
-
-    # Note that interval=... is specified even when it would seem to be
-    # redundant. It is needed to workaround the bug discussed at
-    # https://stackoverflow.com/q/31072589
-
-    if deltaT.total_seconds() < 0.1:
-        # < 0.1 second
-        Mtick = mpld.MicrosecondLocator(interval=10000)
-        mtick = mpld.MicrosecondLocator(interval=2000)
-        fmt1 = FuncFormatter(millis)
-        fmt2  = '%H:%M:%S\n%Y-%m-%d'
-    if deltaT.total_seconds() < 0.5:
-        # < 0.5 seconds
-        # Locators don't locate at this resolution.
-        # Need to do this manually. See comment above.
-        Mtick = mpld.MicrosecondLocator(interval=50000)
-        mtick = mpld.MicrosecondLocator(interval=10000)
-        fmt1 = FuncFormatter(millis)
-        fmt2  = '%H:%M:%S\n%Y-%m-%d'
-    if deltaT.total_seconds() < 1:
-        # < 1 second
-        # https://matplotlib.org/api/dates_api.html#matplotlib.dates.MicrosecondLocator
-        # MircosecondLocator() does not have a "bymicrosecond" option. If
-        # first point is not at zero microseconds, it won't be labeled.
-        Mtick = mpld.MicrosecondLocator(interval=100000)
-        mtick = mpld.MicrosecondLocator(interval=20000)
-        fmt1 = FuncFormatter(millis)
-        #fmt1  = mpld.DateFormatter('%M:%S.%f')
-        fmt2  = '%H:%M:%S\n%Y-%m-%d'
-    elif deltaT.total_seconds() < 5:
-        # < 5 seconds
-        Mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 1)) )
-        mtick = mpld.MicrosecondLocator(interval=200000)
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 10:
-        # < 10 seconds
-        Mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 1)) )
-        mtick = mpld.MicrosecondLocator(interval=500000)
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 20:
-        # < 20 seconds
-        Mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 2)) )
-        mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 1)) )
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 30:
-        # < 30 seconds
-        Mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 5)) )
-        mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 1)) )
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 60:
-        # < 1 minute
-        Mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 10)) )
-        mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 2)) )
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 60*2:
-        # < 2 minutes
-        Mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 20)) )
-        mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 5)) )
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 60*3:
-        # < 3 minutes
-        Mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 20)) )
-        mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 5)) )
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 60*5:
-        # < 5 minutes
-        Mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 30)) )
-        mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 10)) )
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 60*10:
-        # < 10 minutes
-        Mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 1)) )
-        mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 15)) )
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 60*20:
-        # < 20 minutes
-        Mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 2)) )
-        mtick = mpld.SecondLocator(bysecond=list(range(0, 60, 30)) )
-        fmt1  = mpld.DateFormatter('%M:%S')
-        fmt2  = '%Y-%m-%dT%H'
-    elif deltaT.total_seconds() < 60*30:
-        # < 30 minutes
-        Mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 5)) )
-        mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 1)) )
-        fmt1  = mpld.DateFormatter('%H:%M')
-        fmt2  = '%Y-%m-%d'
-    elif deltaT.total_seconds() < 60*60:
-        # < 60 minutes
-        Mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 10)) )
-        mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 2)) )
-        fmt1  = mpld.DateFormatter('%H:%M')
-        fmt2  = '%Y-%m-%d'
-    elif nHours < 2:
-        Mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 15)) )
-        mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 5)) )
-        fmt1  = mpld.DateFormatter('%H:%M')
-        fmt2  = '%Y-%m-%d'
-    elif nHours < 4:
-        Mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 20)) )
-        mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 5)) )
-        fmt1  = mpld.DateFormatter('%H:%M')
-        fmt2  = '%Y-%m-%d'
-    elif nHours < 6:
-        Mtick = mpld.HourLocator(byhour=list(range(0,24,1)) )
-        mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 10)) )
-        fmt1  = mpld.DateFormatter('%H:%M')
-        fmt2  = '%Y-%m-%d'
-    elif nHours < 12:
-        Mtick = mpld.HourLocator(byhour=list(range(0,24,2)) )
-        mtick = mpld.MinuteLocator(byminute=list(range(0, 60, 30)) )
-        fmt1  = mpld.DateFormatter('%H:%M')
-        fmt2  = '%Y-%m-%d'
-    elif nHours < 24:
-        # < 1 day
-        Mtick = mpld.HourLocator(byhour=list(range(0, 24, 3)) )
-        mtick = mpld.HourLocator(byhour=list(range(0, 24, 1)) )
-        fmt1  = mpld.DateFormatter('%H')
-        fmt2  = '%Y-%m-%d'
-    elif nHours < 48:
-        # < 2 days
-        Mtick = mpld.HourLocator(byhour=list(range(0, 24, 4)) )
-        mtick = mpld.HourLocator(byhour=list(range(0, 24, 2)) )
-        fmt1  = mpld.DateFormatter('%H')
-        fmt2  = '%Y-%m-%d'
-    elif nHours < 72:
-        # < 3 days
-        Mtick = mpld.HourLocator(byhour = list(range(0, 24, 6)))
-        mtick = mpld.HourLocator(byhour = list(range(0, 24, 3)))
-        fmt1  = mpld.DateFormatter('%H')
-        fmt2  = '%Y-%m-%d'
-    elif nHours < 96:
-        # < 4 days
-        Mtick = mpld.HourLocator(byhour = list(range(0, 24, 12)))
-        mtick = mpld.HourLocator(byhour = list(range(0, 24, 3)))
-        fmt1  = mpld.DateFormatter('%H')
-        fmt2  = '%Y-%m-%d'
-    elif deltaT.days < 8:
-        Mtick = mpld.DayLocator(bymonthday=list(range(1, 32, 1)))
-        mtick = mpld.HourLocator(byhour=list(range(0, 24, 4)))
-        fmt1  = mpld.DateFormatter('%d')
-        fmt2  = '%Y-%m'
-    elif deltaT.days < 16:
-        Mtick = mpld.DayLocator(bymonthday=list(range(1, 32, 1)))
-        mtick = mpld.DayLocator(bymonthday=list(range(1, 32, 1)))
-        fmt1  = mpld.DateFormatter('%d')
-        fmt2  = '%Y-%m'
-    elif deltaT.days < 32:
-        Mtick = mpld.DayLocator(bymonthday=list(range(1, 32, 4)))
-        mtick = mpld.DayLocator(bymonthday=list(range(1, 32, 1)))
-        fmt1  = mpld.DateFormatter('%d')
-        fmt2  = '%Y-%m'
-    elif deltaT.days < 60:
-        Mtick = mpld.DayLocator(bymonthday=list(range(1, 32, 7)))
-        mtick = mpld.DayLocator(bymonthday=list(range(1, 32, 1)))
-        fmt1  = mpld.DateFormatter('%d')
-        fmt2  = '%Y-%m'
-    elif deltaT.days < 183:
-        Mtick = mpld.MonthLocator(bymonth=list(range(1, 13, 1)))
-        mtick = mpld.DayLocator(bymonthday=list(range(1, 32, 7)))
-        fmt1  = mpld.DateFormatter('%m')
-        fmt2  = '%Y'
-    elif deltaT.days < 367:
-        Mtick = mpld.MonthLocator(bymonth=list(range(1, 13, 1)))
-        mtick = mpld.MonthLocator(bymonth=list(range(1, 13, 1)))
-        fmt1  = mpld.DateFormatter('%m')
-        fmt2  = '%Y'
-    elif deltaT.days < 366*2:
-        Mtick = mpld.MonthLocator(bymonth=list(range(1, 13, 2)))
-        mtick = mpld.MonthLocator(bymonth=list(range(1, 13, 1)))
-        fmt1  = mpld.DateFormatter('%m')
-        fmt2  = '%Y'
-    elif deltaT.days < 366*8:
-        Mtick = mpld.YearLocator(1)
-        mtick = mpld.MonthLocator(bymonth=list(range(1, 13, 4)))
-        fmt1  = mpld.DateFormatter('%Y')
-        fmt2  = ''
-    elif deltaT.days < 366*15:
-        to = axes.lines[0].get_xdata()[0]
-        tf = axes.lines[0].get_xdata()[-1]
-        # Ideally would set byyear=list(range(to.year, tf.year,2)) but
-        # byyear is not a kwarg. Would need to something like
-        # https://stackoverflow.com/questions/48428729/matplotlib-dates-yearlocator-with-odd-intervals
-        Mtick = mpld.YearLocator(1)
-        mtick = mpld.YearLocator(1)
-        fmt1  = mpld.DateFormatter('%Y')
-        fmt2  = ''
-        if False:
-            xl = axes.get_xlim()
-            a = mpld.num2date(xl[0])
-            print(a)
-            import pdb;pdb.set_trace()
-            a = mpld.date2num(a.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0))
-            b = mpld.num2date(xl[1])
-            b = mpld.date2num(b.replace(year=(b.year+1), month=1, day=1, hour=0, minute=0, second=0, microsecond=0))
-            axes.set_xlim([a, b])
-
-    elif deltaT.days < 366*40:
-        Mtick = mpld.YearLocator(5)
-        mtick = mpld.YearLocator(1)
-        fmt1  = mpld.DateFormatter('%Y')
-        fmt2  = ''
-    elif deltaT.days < 366*100:
-        Mtick = mpld.YearLocator(10)
-        mtick = mpld.YearLocator(2)
-        fmt1  = mpld.DateFormatter('%Y')
-        fmt2  = ''
-    elif deltaT.days < 366*200:
-        Mtick = mpld.YearLocator(20)
-        mtick = mpld.YearLocator(5)
-        fmt1  = mpld.DateFormatter('%Y')
-        fmt2  = ''
+    # Use a rule for a larger span if labels would overlap.
+    if dir == 'x':
+        length, prop = _space(axes.xaxis)
     else:
-        Mtick = mpld.YearLocator(50)
-        mtick = mpld.YearLocator(10)
-        fmt1  = mpld.DateFormatter('%Y')
-        fmt2  = ''
+        length, prop = _space(axes.yaxis)
+    rule = _rule(tmin, tmax, rules=DOPTS['rules'], length=length, prop=prop, dir=dir, zone=zone)
+    fmt2 = rule.fmt2
+    profile.mark('rule')
+    profile.set(rule={'span': rule.span, 'major': rule.major, 'minor': rule.minor,
+                      'fmt1': rule.fmt1, 'fmt2': rule.fmt2})
 
     if debug:
+        if dir == 'x':
+            ticks = axes.get_xticks()
+        else:
+            ticks = axes.get_yticks()
         print(f'{dir} data min:         {mpld.num2date(datamin)}')
         print(f'Default {dir}lim[0]:    {mpld.num2date(lim[0])}')
         print(f'Default {dir}ticks[0]:  {mpld.num2date(ticks[0])}')
@@ -408,25 +268,73 @@ def datetick(*args, **kwargs):
         for i in range(0,len(ticks)):
             print(f' {mpld.num2date(ticks[i])}')
 
+    # Ticks and labels computed from the rule and the view limits. If they
+    # are those already applied to the axis (e.g., after a small pan), the
+    # axis is left as it is, which keeps Matplotlib's text layout.
     if dir == 'x':
-        axes.xaxis.set_major_locator(Mtick)
-        axes.xaxis.set_minor_locator(mtick)
-        axes.xaxis.set_major_formatter(fmt1)
-        draw(fig) # Render new labels so updated for next line
-        labels = [item.get_text() for item in axes.get_xticklabels()]
-        ticks = axes.get_xticks()
-        time = mpld.num2date(ticks)
+        axis = axes.xaxis
     else:
-        axes.yaxis.set_major_locator(Mtick)
-        axes.yaxis.set_minor_locator(mtick)
-        axes.yaxis.set_major_formatter(fmt1)
-        draw(fig) # Render new labels so updated for next line
-        labels = [item.get_text() for item in axes.get_yticklabels()]
-        ticks = axes.get_yticks()
-        time = mpld.num2date(ticks)
+        axis = axes.yaxis
+    state = axes.__dict__.setdefault('_datetick', {})
+    Mtick = rule.Mtick if zone is None and epoch is None else _locator(rule.major, zone, epoch)
+    planned = Mtick._values(lim[0], lim[1], axis)
+    plabels = _labels(planned, rule.fmt1, zone)
+    if fmt2 != '' and len(plabels) > 0:
+        plabels = _context(plabels, planned, (min(lim), max(lim)), fmt2, dir=dir, zone=zone)
+    profile.mark('plan')
+    if _unchanged(axis, state.get(dir + 'plan'), rule, planned, plabels):
+        if debug:
+            print('Ticks and labels are unchanged')
+        if DOPTS['set_cb']:
+            if dir == 'x':
+                _connect(axes, 'x', _Retick('x', kwargs), DOPTS['coalesce'])
+            else:
+                _connect(axes, 'y', _Retick('y', kwargs), DOPTS['coalesce'])
+            profile.mark('callbacks')
+        profile.set(unchanged=True)
+        profile.finish()
+        return
+
+    if dir == 'x':
+        axes.xaxis.set_major_locator(_locator(rule.major, zone, epoch))
+        axes.xaxis.set_minor_locator(_locator(rule.minor, zone, epoch))
+        axes.xaxis.set_major_formatter(_formatter(rule.fmt1, zone, epoch))
+        profile.mark('locate')
+        if DOPTS['draw']:
+            _draw(fig) # Render new labels so updated for next line
+            profile.mark('draw')
+            labels = [item.get_text() for item in axes.get_xticklabels()]
+            ticks = axes.get_xticks()
+            if epoch is not None:
+                ticks = epoch.todatenum(ticks)
+        else:
+            # Same ticks and labels that draw() would produce.
+            ticks = planned
+            labels = plabels
+        profile.mark('labels')
+        if profile.hook is not None:
+            profile.set(major_ticks=len(ticks), minor_ticks=len(axes.xaxis.get_minorticklocs()))
+    else:
+        axes.yaxis.set_major_locator(_locator(rule.major, zone, epoch))
+        axes.yaxis.set_minor_locator(_locator(rule.minor, zone, epoch))
+        axes.yaxis.set_major_formatter(_formatter(rule.fmt1, zone, epoch))
+        profile.mark('locate')
+        if DOPTS['draw']:
+            _draw(fig) # Render new labels so updated for next line
+            profile.mark('draw')
+            labels = [item.get_text() for item in axes.get_yticklabels()]
+            ticks = axes.get_yticks()
+            if epoch is not None:
+                ticks = epoch.todatenum(ticks)
+        else:
+            ticks = planned
+            labels = plabels
+        profile.mark('labels')
+        if profile.hook is not None:
+            profile.set(major_ticks=len(ticks), minor_ticks=len(axes.yaxis.get_minorticklocs()))
 
     if debug:
-        xl = axes.get_xlim()
+        xl = lim
         print(f'New {dir}ticks:')
         for i in range(0,len(ticks)):
             note = ''
@@ -437,46 +345,13 @@ def datetick(*args, **kwargs):
     if len(labels) == 0:
         if debug:
             print('No labels to format')
+        profile.finish()
         return
 
     if fmt2 != '':
-        first = 0
-        if ticks[0] < lim[0]:
-            # Work-around for bug in Matplotlib where left-most tick is less than
-            # lower x-limit.
-            first = 1
-
-        # Always apply fmt2 to first tick label
-        labels[first] = '%s\n%s' % (labels[first], datetime.strftime(time[first], fmt2))
-
-        for i in range(first+1,len(time)):
-            # First label will always have fmt1 applied.
-            # Modify labels after first under certain conditions.
-            modify = False
-
-            if time[i].year > time[i-1].year:
-                modify = True
-            if nDays < 60 and time[i].month > time[i-1].month:
-                modify = True
-            if nDays < 4 and time[i].day > time[i-1].day:
-                modify = True
-            if nSecs < 60*30 and time[i].hour > time[i-1].hour:
-                modify = True
-            if nSecs < 1 and time[i].minute > time[i-1].minute:
-                modify = True
-            if nSecs < 1 and time[i].second > time[i-1].second:
-                modify = True
-
-            if not modify: continue
-
-            if i == first + 1 and dir == 'x':
-                # If first two major tick labels have fmt2 applied, the will
-                # likely run together. This keeps fmt2 label for second major
-                # tick.
-                #labels[i] = '%s\n%s' % (labels[i], datetime.strftime(mpld.num2date(ticks[i]), fmt2))
-                pass
-            else:
-                labels[i] = '%s\n%s' % (labels[i], datetime.strftime(mpld.num2date(ticks[i]), fmt2))
+        if DOPTS['draw']:
+            labels = _context(labels, ticks, (min(lim), max(lim)), fmt2, dir=dir, zone=zone)
+        profile.mark('decorate')
 
         # Without the set_xticks(), warning is generated:
         #   UserWarning: set_ticklabels() should only be used.
@@ -490,24 +365,187 @@ def datetick(*args, **kwargs):
         if dir == 'y':
             axes.set_yticks(axes.get_yticks())
             axes.set_yticklabels(labels)
+        profile.mark('apply')
+
+    state[dir + 'plan'] = (rule, _installed(axis), planned, plabels)
 
     # Trigger update of ticks when limits change due to user interaction.
     if DOPTS['set_cb']:
         if dir == 'x':
-            axes.callbacks.connect('xlim_changed', on_xlims_change)
+            _connect(axes, 'x', _Retick('x', kwargs), DOPTS['coalesce'])
         else:
-            axes.callbacks.connect('ylim_changed', on_ylims_change)
-
-def numsize():
-    '''Returns (width, height) of number '0' in pixels'''
-    # Not used.
-    # Based on https://stackoverflow.com/q/5320205
-    # TODO: numsize(fig, dir) should inspect fig to get used fonts
-    # for dir='x' and dir='y' and get bounding box for x and y labels.
-    r = plt.figure().canvas.get_renderer()
-    t = plt.text(0.5, 0.5, '0')
-    bb = t.get_window_extent(renderer=r)
-    w = bb.width
-    h = bb.height
-    plt.close()
-    return (w,h)
+            _connect(axes, 'y', _Retick('y', kwargs), DOPTS['coalesce'])
+        profile.mark('callbacks')
+
+    profile.finish()
+
+def datetick_figure(fig=None, dirs='xy', **kwargs):
+    '''
+    datetick_figure(fig) applies datetick() to every axis in figure `fig`
+    that has date values. The figure is not rendered; tick labels are
+    computed as with datetick(..., draw=False).
+
+    datetick_figure(fig, dirs='x') only considers x axes. Other keyword
+    arguments are passed to datetick(). Axes that share an axis (e.g.,
+    plt.subplots(n, sharex=True)) are ticked once as a group.
+
+    Example:
+    --------
+        fig, axes = plt.subplots(20)
+        for ax in axes:
+            ax.plot(x, y)
+        datetick_figure(fig)
+    '''
+
+    if fig is None:
+        import matplotlib.pyplot as plt
+        fig = plt.gcf()
+
+    for axes in fig.axes:
+        for dir in dirs:
+            if dir == 'x':
+                axis = axes.xaxis
+            else:
+                axis = axes.yaxis
+            if _isdate(axis) and _group(axes, dir)[0] is axes:
+                datetick(dir, **{**kwargs, 'axes': axes, 'draw': False})
+
+def _isdate(axis):
+    '''Returns True if axis has date values'''
+
+    if isinstance(axis.get_major_locator(), mpld.DateLocator):
+        return True
+    if hasattr(axis, 'get_converter'):
+        converter = axis.get_converter()
+    else:
+        converter = axis.converter
+    # Older Matplotlib versions have no _SwitchableDateConverter.
+    switchable = getattr(mpld, '_SwitchableDateConverter', ())
+    return isinstance(converter, (mpld.DateConverter, switchable))
+
+def _group(axes, dir):
+    '''
+    Returns list of axes in the figure of `axes` that share its dir axis,
+    starting with the bottom (dir='x') or left-most (dir='y') one; [axes]
+    if it shares none.
+    '''
+
+    if dir == 'x':
+        shared = axes.get_shared_x_axes()
+    else:
+        shared = axes.get_shared_y_axes()
+    group = [a for a in shared.get_siblings(axes) if a.figure is axes.figure]
+    if len(group) < 2:
+        return [axes]
+
+    def key(a):
+        # Ties (e.g., twinx() axes) go to `axes`.
+        box = a.get_position()
+        if dir == 'x':
+            return (box.y0, box.x0, a is not axes)
+        return (box.x0, box.y0, a is not axes)
+
+    return sorted(group, key=key)
+
+def _installed(axis):
+    '''Returns the major and minor locators and major formatter of axis'''
+
+    return (axis.get_major_locator(), axis.get_minor_locator(), axis.get_major_formatter())
+
+def _unchanged(axis, applied, rule, ticks, labels):
+    '''Returns True if rule, ticks, and labels are those last applied to axis'''
+
+    if applied is None or applied[0] is not rule:
+        return False
+    # The locators and formatter may have been replaced since.
+    if any(a is not b for a, b in zip(applied[1], _installed(axis))):
+        return False
+    return np.array_equal(applied[2], ticks) and list(applied[3]) == list(labels)
+
+def _draw(fig):
+    fig.canvas.draw()
+
+class _Retick:
+    '''
+    Limit-change callback that re-applies datetick(dir, **options).
+
+    The callbacks, like the locators and formatters, are module-level
+    objects so that a figure and its datetick() configuration can be
+    pickled (e.g., to render it in another process). Matplotlib only
+    pickles callbacks connected with _connect_picklable().
+    '''
+
+    def __init__(self, dir, options):
+        self.dir = dir
+        self.options = options
+
+    def __call__(self, axes):
+        datetick(self.dir, **{**self.options, 'axes': axes, 'set_cb': False})
+
+    def __getstate__(self):
+        # A profile hook reports to the process that connected it.
+        return {**self.__dict__, 'options': {k: v for k, v in self.options.items() if k != 'profile'}}
+
+class _Coalesce:
+    '''
+    Limit-change callback that calls callback(axes) once no limit change
+    has occurred for `seconds`. The timer is created on the first change,
+    from the canvas of the figure at that time, and is not pickled.
+    '''
+
+    def __init__(self, callback, seconds):
+        self.callback = callback
+        self.seconds = seconds
+        self.timer = None
+
+    def __call__(self, axes):
+        if self.timer is None:
+            self.timer = axes.figure.canvas.new_timer(interval=int(1000*self.seconds))
+            self.timer.single_shot = True
+            self.timer.add_callback(self.callback, axes)
+        self.timer.stop()
+        self.timer.start()
+
+    def stop(self):
+        if self.timer is not None:
+            self.timer.stop()
+
+    def __getstate__(self):
+        return {**self.__dict__, 'timer': None}
+
+def _connect(axes, dir, callback, coalesce):
+    '''Connects callback to dir + 'lim_changed', replacing any earlier one'''
+
+    _disconnect(axes, dir)
+    state = axes.__dict__.setdefault('_datetick', {})
+
+    if coalesce > 0:
+        callback = _Coalesce(callback, coalesce)
+        state[dir + 'timer'] = callback
+    # _connect_picklable() keeps the callback when the figure is pickled;
+    # Matplotlib versions without it drop callbacks on pickling.
+    connect = getattr(axes.callbacks, '_connect_picklable', axes.callbacks.connect)
+    state[dir + 'cid'] = connect(dir + 'lim_changed', callback)
+
+def _disconnect(axes, dir):
+    '''Disconnects the callback connected by _connect(), if any'''
+
+    state = axes.__dict__.get('_datetick', {})
+    cid = state.pop(dir + 'cid', None)
+    if cid is not None:
+        axes.callbacks.disconnect(cid)
+    timer = state.pop(dir + 'timer', None)
+    if timer is not None:
+        timer.stop()
+
+def numsize(prop=None, dpi=None):
+    '''
+    Returns (width, height) of number '0' in pixels for font properties
+    `prop` (default: rcParams font) and `dpi` (default: rcParams['figure.dpi'])
+    '''
+
+    import matplotlib
+    if dpi is None:
+        dpi = matplotlib.rcParams['figure.dpi']
+    w, h = textsize('0', prop)
+    return (w*dpi/72.0, h*dpi/72.0)
@@ -0,0 +1,125 @@
+import datetime
+
+import numpy as np
+import matplotlib.dates as mpld
+from matplotlib.ticker import Formatter
+
+# Named epochs for axis values that are seconds since an epoch. The second
+# element is TAI - (time scale) in seconds for time scales that count leap
+# seconds, or None for scales that do not (as POSIX time does not).
+#
+#   unix:  seconds since 1970-01-01T00:00:00 UTC, without leap seconds
+#   gps:   GPS seconds since 1980-01-06T00:00:00 (GPS = TAI - 19 s)
+#   tai:   TAI seconds since 1958-01-01T00:00:00 TAI
+#   j2000: TT seconds since 2000-01-01T12:00:00 TT (TT = TAI + 32.184 s)
+EPOCHS = {
+    'unix': ('1970-01-01T00:00:00', None),
+    'gps': ('1980-01-06T00:00:00', 19.0),
+    'tai': ('1958-01-01T00:00:00', 0.0),
+    'j2000': ('2000-01-01T12:00:00', -32.184)
+}
+
+# Dates from which TAI - UTC has the given number of seconds. Before 1972,
+# TAI - UTC is taken to be 10 s.
+LEAPSECONDS = [
+    ('1972-01-01', 10), ('1972-07-01', 11), ('1973-01-01', 12), ('1974-01-01', 13),
+    ('1975-01-01', 14), ('1976-01-01', 15), ('1977-01-01', 16), ('1978-01-01', 17),
+    ('1979-01-01', 18), ('1980-01-01', 19), ('1981-07-01', 20), ('1982-07-01', 21),
+    ('1983-07-01', 22), ('1985-07-01', 23), ('1988-01-01', 24), ('1990-01-01', 25),
+    ('1991-01-01', 26), ('1992-07-01', 27), ('1993-07-01', 28), ('1994-07-01', 29),
+    ('1996-01-01', 30), ('1997-07-01', 31), ('1999-01-01', 32), ('2006-01-01', 33),
+    ('2009-01-01', 34), ('2012-07-01', 35), ('2015-07-01', 36), ('2017-01-01', 37)
+]
+
+# POSIX seconds of the dates in LEAPSECONDS, TAI - UTC before the first
+# date and from each date, TAI seconds (since 1970-01-01T00:00:00 TAI) at
+# which each value starts to apply, and the date following each interval.
+_DATES = np.array([d for d, _ in LEAPSECONDS], dtype='datetime64[s]').astype(np.int64).astype(float)
+_DAT = np.array([10.0] + [n for _, n in LEAPSECONDS])
+_STARTS = _DATES + _DAT[1:]
+_NEXT = np.append(_DATES, np.inf)
+
+def _epoch(epoch):
+    '''Returns the _Epoch for epoch (see _Epoch); None for None'''
+
+    if epoch is None or isinstance(epoch, _Epoch):
+        return epoch
+    return _Epoch(epoch)
+
+class _Epoch:
+    '''
+    Axis values that are seconds since `epoch`, which is one of the names
+    in EPOCHS, or an ISO 8601 string, datetime, or datetime64 (UTC, no
+    leap seconds).
+
+    todatenum() and fromdatenum() convert arrays of axis values to and from
+    Matplotlib datenums. Only the axis limits and the ticks are converted;
+    data plotted in these units is used as it is.
+    '''
+
+    def __init__(self, epoch='unix'):
+        self.name = epoch
+        shift = None
+        if isinstance(epoch, str) and epoch.lower() in EPOCHS:
+            epoch, shift = EPOCHS[epoch.lower()]
+        if isinstance(epoch, datetime.datetime) and epoch.tzinfo is not None:
+            epoch = epoch.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        try:
+            t = np.datetime64(epoch, 'us')
+        except ValueError:
+            raise ValueError('Epoch must be one of %s or an ISO 8601 time (got "%s")'
+                             % (', '.join(EPOCHS), epoch))
+        # Seconds since 1970-01-01 of the epoch, in the epoch's scale.
+        self.origin = float((t - np.datetime64('1970-01-01', 'us'))/np.timedelta64(1, 'us'))/1e6
+        self.shift = shift
+
+    def todatenum(self, x):
+        '''Returns datenums for axis values x'''
+
+        u = np.asarray(x, dtype=float) + self.origin
+        if self.shift is not None:
+            u = _utc(u + self.shift)
+        return u/86400.0 + _unix()
+
+    def fromdatenum(self, d):
+        '''Returns axis values for datenums d'''
+
+        u = (np.asarray(d, dtype=float) - _unix())*86400.0
+        if self.shift is not None:
+            u = _tai(u) - self.shift
+        return u - self.origin
+
+class _EpochFormatter(Formatter):
+    '''Formatter that converts axis values in _Epoch epoch to datenums for formatter'''
+
+    def __init__(self, formatter, epoch):
+        self.formatter = formatter
+        self.epoch = epoch
+
+    def __call__(self, x, pos=None):
+        return self.formatter(float(self.epoch.todatenum(x)), pos)
+
+    def format_ticks(self, values):
+        self.set_locs(values)
+        return self.formatter.format_ticks(self.epoch.todatenum(values))
+
+def _unix():
+    '''Returns the datenum of 1970-01-01'''
+
+    epoch = np.datetime64(mpld.get_epoch(), 's')
+    return float((np.datetime64('1970-01-01', 's') - epoch).astype(np.int64))/86400.0
+
+def _utc(t):
+    '''
+    Converts TAI seconds since 1970-01-01 to POSIX seconds. Times in a leap
+    second are converted to the end of the leap second.
+    '''
+
+    i = np.searchsorted(_STARTS, t, side='right')
+    return np.minimum(t - _DAT[i], _NEXT[i])
+
+def _tai(u):
+    '''Converts POSIX seconds to TAI seconds since 1970-01-01'''
+
+    i = np.searchsorted(_DATES, u, side='right')
+    return u + _DAT[i]
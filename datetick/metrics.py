@@ -0,0 +1,170 @@
+import threading
+
+import numpy as np
+import matplotlib
+
+from datetick.ticks import _SECONDS, _CYCLES, _todatetime64
+from datetick.rules import _label
+from datetick.plan import _contextunit
+
+# Character widths in points for a font size of 1 point, keyed by the font
+# file that the font properties resolve to. Widths are measured from the
+# font's glyphs once per process; no figure is created. _LOCK is held
+# while a width is measured and stored so that datetick() can be used
+# from several threads.
+_WIDTHS = {}
+_LOCK = threading.Lock()
+
+# Height of a line of text, relative to the font size, as used by
+# Matplotlib (linespacing = 1.2).
+LINEHEIGHT = 1.2
+
+# Size at which glyphs are measured; widths scale linearly with size.
+_SIZE = 100.0
+
+# Shortest length in seconds of each _contextunit() unit.
+_CONTEXTSECONDS = {'s': 1, 'h': 3600, 'D': 86400, 'M': 28*86400, 'Y': 365*86400}
+
+def textsize(text, prop=None):
+    '''
+    Returns (width, height) in points of text rendered with font properties
+    `prop` (a FontProperties; default: rcParams font). Kerning is ignored,
+    so the width is a slight overestimate.
+    '''
+
+    if prop is None:
+        from matplotlib.font_manager import FontProperties
+        prop = FontProperties()
+    return _textsize(text, prop, _widths(prop))
+
+def _textsize(text, prop, widths):
+    '''textsize() given the character widths for prop'''
+
+    size = prop.get_size_in_points()
+    lines = text.split('\n')
+    width = 0.0
+    for line in lines:
+        w = 0.0
+        for c in line:
+            if c not in widths:
+                with _LOCK:
+                    if c not in widths:
+                        widths[c] = _measure(c, prop)
+            w += widths[c]
+        width = max(width, w)
+
+    return size*width, size*LINEHEIGHT*len(lines)
+
+def _widths(prop):
+    from matplotlib.font_manager import findfont
+    # findfont() is cached by Matplotlib.
+    key = findfont(prop)
+    with _LOCK:
+        return _WIDTHS.setdefault(key, {})
+
+def _measure(c, prop):
+    from matplotlib.textpath import text_to_path
+    prop = prop.copy()
+    prop.set_size(_SIZE)
+    w, _, _ = text_to_path.get_text_width_height_descent(c, prop, ismath=False)
+    return w/_SIZE
+
+def _mingap(spec, tmin, tmax, zone=None):
+    '''
+    Returns the least time in seconds between adjacent ticks for a (unit,
+    step[, anchor]) spec within datenums tmin and tmax. Ticks are step
+    units apart except where the calendar field restarts, e.g., for
+    ('day', 7), the 29th of a 31-day month is 3 days before the 1st.
+    '''
+
+    unit, step = spec[:2]
+    seconds = step*_SECONDS[unit]
+    if step == 1 or len(spec) > 2:
+        return seconds
+
+    if unit != 'day':
+        cycle = _CYCLES[unit][0]
+        if cycle is None or cycle % step == 0:
+            return seconds
+        return min(seconds, ((cycle - 1) % step + 1)*_SECONDS[unit])
+
+    # The first of each month after tmin, the number of days in the month
+    # before it, and the days from the last tick of that month.
+    time = _todatetime64(np.sort(np.array([tmin, tmax], dtype=float)))
+    if zone is not None:
+        time = zone.tolocal(time)
+    months = np.arange(time[0].astype('datetime64[M]') + 1, time[1].astype('datetime64[M]') + 1)
+    firsts = months.astype('datetime64[D]')
+    days = (firsts - (months - 1).astype('datetime64[D]')).astype(np.int64)
+    gaps = (days - 1) % step + 1
+    gaps = gaps[firsts - gaps >= time[0]]
+    if len(gaps) == 0:
+        return seconds
+    return min(seconds, float(np.min(gaps))*_SECONDS['day'])
+
+def _space(axis):
+    '''
+    Returns (length, prop), where length is the length of `axis` in points
+    and prop is the font properties of its tick labels.
+    '''
+
+    axes = axis.axes
+    bbox = axes.get_window_extent()
+    if axis.axis_name == 'x':
+        pixels = bbox.width
+    else:
+        pixels = bbox.height
+    length = 72.0*pixels/axes.figure.dpi
+    prop = axis.majorTicks[0].label1.get_fontproperties()
+    return length, prop
+
+def _fits(rule, tmin, tmax, nSecs, length, prop=None, dir='x', zone=None):
+    '''
+    Returns True if the major tick labels of `rule` for axis limits tmin
+    and tmax, including their fmt2 rows, do not overlap on an axis that
+    is `length` points long.
+    Labels are written in _Zone zone (None for UTC).
+    '''
+
+    if prop is None:
+        from matplotlib.font_manager import FontProperties
+        prop = FontProperties(size=matplotlib.rcParams[dir + 'tick.labelsize'])
+
+    spacing = length*_mingap(rule.major, tmin, tmax, zone)/nSecs
+
+    # The fmt1 labels at the axis limits stand in for all labels.
+    widths = _widths(prop)
+    size = [0.0, 0.0]
+    for t in (tmin, tmax):
+        w, h = _textsize(_label(float(t), rule.fmt1, zone), prop, widths)
+        size = [max(size[0], w), max(size[1], h)]
+
+    # Leave a gap of one digit width between labels.
+    gap = _textsize('0', prop, widths)[0]
+    if dir == 'x':
+        if spacing < size[0] + gap:
+            return False
+        # The fmt2 context rows are below the fmt1 row, on the first label
+        # and on labels where the calendar field of _contextunit() changes.
+        # The first two of these are at least two ticks apart (_context()
+        # drops the row from the second label); later ones are at least
+        # one unit apart (e.g., a day for 12-hour ticks over 3 days).
+        if rule.fmt2 == '':
+            return True
+        unit = _contextunit(nSecs)
+        time = _todatetime64(np.array([tmin, tmax], dtype=float))
+        if zone is not None:
+            time = zone.tolocal(time)
+        time = time.astype('datetime64[%s]' % unit)
+        if time[0] == time[1]:
+            return True
+        width = max(_textsize(_label(float(t), rule.fmt2, zone), prop, widths)[0] for t in (tmin, tmax))
+        least = min(2*spacing, max(spacing, length*_CONTEXTSECONDS[unit]/nSecs))
+        return least >= width + gap
+
+    # On a y axis, the fmt2 rows make a label taller. Labels are centered
+    # on their tick, so a label with fmt2 rows and a label without them
+    # overlap if the spacing is less than their mean height.
+    if rule.fmt2 != '':
+        size[1] += 0.5*prop.get_size_in_points()*LINEHEIGHT*(rule.fmt2.count('\n') + 1)
+    return spacing >= size[1] + gap
@@ -0,0 +1,208 @@
+import functools
+from collections import namedtuple
+from datetime import datetime, timezone
+import numpy as np
+
+import matplotlib.dates as mpld
+
+from datetick.rules import _rule, _labels, LABELCACHE
+from datetick.ticks import ticks, _todatetime64, MAXTICKS, _SECONDS
+from datetick.zones import _zone
+from datetick.epochs import _epoch
+
+TickPlan = namedtuple('TickPlan', ['major', 'minor', 'labels', 'rule'])
+TickPlan.__doc__ = '''Tick plan returned by tickplan().
+
+    major:  major tick positions
+    minor:  minor tick positions (excluding those at a major tick)
+    labels: major tick labels, including the fmt2 context row
+    rule:   the Rule used (None if tmin == tmax)
+'''
+
+def tickplan(tmin, tmax, units='datenum', dir='x', rules=None, length=None, tz=None, epoch=None):
+    '''
+    tickplan(tmin, tmax) returns the major and minor tick positions and the
+    major tick labels that datetick() would use for an axis with limits
+    tmin and tmax. No figure is created.
+
+    tmin and tmax may be Matplotlib datenums, datetime64 values, or
+    datetimes. Use units='s' if they are seconds since 1970-01-01, or
+    epoch=... if they are seconds since another epoch, e.g., epoch='gps'
+    (see datetick.epochs.EPOCHS).
+
+    Positions are returned as NumPy arrays in the units of the input
+    (datetime64[us] if the input is datetime64 or datetime). Only ticks
+    between tmin and tmax are returned.
+
+    rules is a RuleTable from load_rules() or compile_rules(); the default
+    is datetick.rules.RULES.
+
+    If length, the axis length in points (pixels*72/dpi), is given, a rule
+    for a larger span is used when the major tick labels would overlap, as
+    datetick() does for a figure. The tick label font size is taken from
+    rcParams.
+
+    With tz (a tzinfo or a name such as 'America/New_York'), ticks are
+    aligned to and labeled in local time in tz, e.g., day ticks are at
+    local midnight. Positions are still UTC.
+
+    Example:
+    --------
+        import numpy as np
+        from datetick import tickplan
+        plan = tickplan(np.datetime64('2001-01-01'), np.datetime64('2001-01-02T01'))
+        plan.labels
+        # array(['00\\n2001-01-01', '04', '08', '12', '16', '20', '00\\n2001-01-02'])
+    '''
+
+    if units not in ('datenum', 's'):
+        raise ValueError("units must be 'datenum' or 's'")
+    if epoch is not None:
+        units = 's'
+    if units == 's':
+        epoch = _epoch(epoch or 'unix')
+
+    zone = _zone(tz)
+    dt64 = isinstance(tmin, (np.datetime64, datetime))
+    lim = (_todatenum(tmin, epoch), _todatenum(tmax, epoch))
+    if not np.isfinite(lim[0]):
+        raise ValueError('Lower limit %s is not a valid time' % (tmin,))
+    if not np.isfinite(lim[1]):
+        raise ValueError('Upper limit %s is not a valid time' % (tmax,))
+    if lim[0] > lim[1]:
+        lim = (lim[1], lim[0])
+
+    if lim[0] == lim[1]:
+        tzinfo = None if zone is None else zone.tz
+        label = datetime.strftime(mpld.num2date(lim[0], tz=tzinfo), '%Y-%m-%dT%H:%M:%S')
+        major = np.array([lim[0]])
+        return TickPlan(_fromdatenum(major, epoch, dt64),
+                        _fromdatenum(np.array([]), epoch, dt64),
+                        np.array([label]),
+                        None)
+
+    rule = _rule(*lim, rules=rules, length=length, dir=dir, zone=zone)
+
+    time = _todatetime64(np.array(lim))
+    major = _ticks(time, rule.major, zone)
+    minor = _ticks(time, rule.minor, zone)
+
+    labels = _labels(major, rule.fmt1, zone)
+    labels = _context(labels, major, lim, rule.fmt2, dir=dir, zone=zone)
+
+    keep = (major >= lim[0]) & (major <= lim[1])
+    major = major[keep]
+    labels = np.array(labels)[keep]
+
+    # Matplotlib does not draw a minor tick where there is a major tick.
+    tol = 1e-5*(lim[1] - lim[0])
+    minor = minor[(minor >= lim[0]) & (minor <= lim[1])]
+    if len(major) > 0:
+        minor = minor[np.min(np.abs(minor[:, None] - major[None, :]), axis=1) > tol]
+
+    return TickPlan(_fromdatenum(major, epoch, dt64),
+                    _fromdatenum(minor, epoch, dt64),
+                    labels,
+                    rule)
+
+def _todatenum(t, epoch):
+    if isinstance(t, (np.datetime64, datetime)):
+        return float(mpld.date2num(t))
+    if epoch is not None:
+        return float(epoch.todatenum(t))
+    return float(t)
+
+def _fromdatenum(x, epoch, dt64):
+    if dt64:
+        return _todatetime64(x)
+    if epoch is not None:
+        return epoch.fromdatenum(x)
+    return x
+
+def _context(labels, ticks, lim, fmt2, dir='x', zone=None):
+    '''
+    Adds fmt2 to first label and labels where there is a major change in
+    local time in _Zone zone (None for UTC)
+    '''
+
+    labels = list(labels)
+    if fmt2 == '' or len(labels) == 0:
+        return labels
+
+    first = 0
+    if ticks[0] < lim[0]:
+        # Work-around for bug in Matplotlib where left-most tick is less than
+        # lower x-limit.
+        first = 1
+    if first >= len(labels):
+        return labels
+
+    span = _todatetime64(np.asarray(lim, dtype=float))
+    nSecs = (span[1] - span[0])/np.timedelta64(1, 's')
+
+    # A label after the first is modified if the tick is in a different
+    # year than the previous tick, or, depending on the span, a different
+    # month, day, hour, or second. Because ticks are increasing, this is
+    # the same as comparing the ticks truncated to the finest such unit.
+    unit = _contextunit(nSecs)
+
+    time = _todatetime64(np.asarray(ticks, dtype=float))
+    if zone is None:
+        trunc = time.astype('datetime64[%s]' % unit)
+    else:
+        trunc = zone.tolocal(time).astype('datetime64[%s]' % unit)
+
+    # Always apply fmt2 to first tick label
+    modify = np.zeros(len(time), dtype=bool)
+    modify[first] = True
+    modify[first+1:] = trunc[first+1:] != trunc[first:-1]
+
+    if first + 1 < len(time) and dir == 'x':
+        # If first two major tick labels have fmt2 applied, the will
+        # likely run together. This keeps fmt2 label for second major
+        # tick.
+        modify[first+1] = False
+
+    index = np.flatnonzero(modify)
+    for i, t in zip(index, time[index].tolist()):
+        labels[i] = '%s\n%s' % (labels[i], _stamp(t, fmt2, zone))
+
+    return labels
+
+def _contextunit(nSecs):
+    '''
+    Returns the NumPy unit code of the calendar field whose change adds
+    fmt2 to a label, for an axis span of nSecs seconds
+    '''
+
+    if nSecs < 1:
+        return 's'
+    if nSecs < 60*30:
+        return 'h'
+    nDays = nSecs//86400
+    if nDays < 4:
+        return 'D'
+    if nDays < 60:
+        return 'M'
+    return 'Y'
+
+@functools.lru_cache(maxsize=LABELCACHE)
+def _stamp(t, fmt2, zone=None):
+    '''Returns UTC datetime t formatted with fmt2 in local time in _Zone zone'''
+
+    if zone is not None:
+        t = t.replace(tzinfo=timezone.utc).astimezone(zone.tz)
+    return t.strftime(fmt2)
+
+def _ticks(lim, spec, zone=None):
+    '''
+    Returns datenums of ticks for a (unit, step[, anchor]) spec within lim;
+    none if there would be more than MAXTICKS, as for a CalendarLocator
+    '''
+
+    nSecs = abs(float((lim[1] - lim[0])/np.timedelta64(1, 'us')))/1e6
+    if nSecs/(spec[1]*_SECONDS[spec[0]]) > MAXTICKS:
+        return np.array([])
+    # Without a figure, the data start is taken to be the lower limit.
+    anchor = lim[0] if spec[2:] == ('start',) else None
+    return mpld.date2num(ticks(lim[0], lim[1], spec[0], spec[1], anchor=anchor, tz=zone))
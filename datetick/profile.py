@@ -0,0 +1,114 @@
+import os
+import json
+import time
+import threading
+
+class Collector:
+    '''
+    Collects the records passed to the profile=... hook of datetick().
+
+    Each record is a dict with keys
+
+        dir:      'x' or 'y'
+        start:    time.perf_counter() at start of call
+        seconds:  duration of call
+        phases:   list of {'name', 'start', 'seconds'} dicts; names are
+                  setup, draw, validate, rule, plan, locate, labels,
+                  decorate, apply, and callbacks
+        draws:    number of canvas draws
+        rule:     dict with the span, major, minor, fmt1, and fmt2 of the
+                  rule used
+        major_ticks, minor_ticks: number of ticks
+        unchanged: True if the ticks and labels were those already applied,
+                  so the axis was not modified
+
+    Example:
+    --------
+        from datetick import datetick
+        from datetick.profile import Collector
+        collector = Collector()
+        datetick('x', axes=ax, profile=collector)
+        collector.save('datetick.trace.json') # Open in chrome://tracing
+    '''
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            self.records.append(record)
+
+    def chrome_trace(self):
+        '''Returns records in Chrome trace event format'''
+
+        events = []
+        for record in self.records:
+            args = {key: record[key] for key in record if key not in ('phases', 'start', 'seconds', 'pid', 'tid')}
+            events.append(_event('datetick', record['start'], record['seconds'], record, args))
+            for phase in record['phases']:
+                events.append(_event(phase['name'], phase['start'], phase['seconds'], record, {}))
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def save(self, path, format='chrome'):
+        '''Writes records to path as a Chrome trace (default) or as JSON'''
+
+        if format == 'chrome':
+            data = self.chrome_trace()
+        else:
+            data = self.records
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=1)
+
+def _event(name, start, seconds, record, args):
+    return {
+        'name': name,
+        'ph': 'X',
+        'ts': 1e6*start,
+        'dur': 1e6*seconds,
+        'pid': record['pid'],
+        'tid': record['tid'],
+        'args': args
+    }
+
+class _Recorder:
+    '''Records phase timings for one datetick() call if hook is not None'''
+
+    def __init__(self, hook, dir):
+        self.hook = hook
+        if hook is None:
+            return
+        self._t = time.perf_counter()
+        self.record = {
+            'dir': dir,
+            'start': self._t,
+            'seconds': 0.0,
+            'phases': [],
+            'draws': 0,
+            'rule': None,
+            'major_ticks': 0,
+            'minor_ticks': 0,
+            'unchanged': False,
+            'pid': os.getpid(),
+            'tid': threading.get_ident()
+        }
+
+    def mark(self, name):
+        '''Ends phase `name`, which started at the previous mark'''
+        if self.hook is None:
+            return
+        t = time.perf_counter()
+        self.record['phases'].append({'name': name, 'start': self._t, 'seconds': t - self._t})
+        if name == 'draw':
+            self.record['draws'] += 1
+        self._t = t
+
+    def set(self, **kwargs):
+        if self.hook is not None:
+            self.record.update(kwargs)
+
+    def finish(self):
+        if self.hook is None:
+            return
+        self.record['seconds'] = time.perf_counter() - self.record['start']
+        self.hook(self.record)
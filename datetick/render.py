@@ -0,0 +1,169 @@
+import os
+import json
+import time
+import functools
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import dateutil.parser
+import matplotlib.dates as mpld
+
+from datetick.datetick import datetick
+from datetick.epochs import _epoch
+from datetick.rules import load_rules
+
+# datetick() options that may be given in a job's options. Others (e.g.,
+# debug, which prints) are rejected so that output stays valid JSONL.
+DATETICK_OPTIONS = ['draw', 'lazy', 'tz', 'epoch', 'rules']
+
+# Figure reused for every job rendered by a worker process, and its
+# initial dpi.
+_figure = None
+_dpi = None
+
+def render(jobs, processes=None):
+    '''
+    render(jobs) renders each job in `jobs` to an image file and yields a
+    result dict for each job as it completes (not necessarily in order).
+
+    A job is a dict with keys start, end, output, and (optionally) options,
+    a [start, end, output, options] list, or either as a JSON string.
+    start and end are ISO 8601 strings. options is a dict with keys
+
+        figsize:  figure size in inches (default [8, 4])
+        dpi:      dpi of the image (default: Matplotlib default)
+        compare:  if True (default), add a panel with the default
+                  Matplotlib ticks above the datetick panel, as in
+                  datetick_test.py
+        draw, lazy, tz, epoch: passed to datetick()
+        rules:    path of a JSON or TOML rule file (see load_rules())
+
+    Jobs are rendered with the Agg canvas in `processes` worker processes
+    (default: number of CPUs). Each worker reuses one figure. A result
+    has keys index (position of job in jobs), output, ok, seconds, and,
+    if ok is False (e.g., the job is not valid JSON), error.
+
+    Example:
+    --------
+        from datetick.render import render
+        jobs = [{'start': '2001-01-01', 'end': '2001-01-02', 'output': 'a.svg'}]
+        for result in render(jobs):
+            print(result)
+    '''
+
+    if processes == 1:
+        _init()
+        for index, job in enumerate(jobs):
+            yield _render(index, job)
+        return
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(processes, initializer=_init) as pool:
+        # Limit the number of queued jobs so that memory use does not grow
+        # with the number of jobs.
+        pending = set()
+        for index, job in enumerate(jobs):
+            pending.add(pool.submit(_render, index, job))
+            if len(pending) >= 4*processes:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+def plot(fig, start, end, compare=True, **kwargs):
+    '''
+    Plots two points at times start and end in figure `fig` and applies
+    datetick(**kwargs). If compare=True, a panel with the default
+    Matplotlib ticks is placed above. Returns the datetick axes.
+    '''
+
+    x = [dateutil.parser.parse(start), dateutil.parser.parse(end)]
+    y = [0.0, 0.0]
+    # With epoch, datetick axis values are seconds since the epoch.
+    epoch = _epoch(kwargs.get('epoch'))
+    t = x if epoch is None else epoch.fromdatenum(mpld.date2num(x))
+
+    if compare:
+        axes = fig.subplots(2)
+        axes[0].set_title(start + ' - ' + end)
+        axes[0].plot(x, y, '*')
+        axes[0].text(x[0], 0.04, 'matplotlib')
+        axes[0].grid()
+        ax = axes[1]
+    else:
+        ax = fig.subplots(1)
+        ax.set_title(start + ' - ' + end)
+
+    ax.plot(t, y, '*')
+    ax.text(t[0], 0.04, 'datetick')
+    datetick('x', axes=ax, **kwargs)
+    ax.grid()
+
+    return ax
+
+def _init():
+    global _figure, _dpi
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    _figure = Figure()
+    _dpi = _figure.dpi
+    FigureCanvasAgg(_figure)
+
+@functools.lru_cache(maxsize=None)
+def _rules(path):
+    '''Returns the RuleTable in file `path`, read once per process'''
+
+    return load_rules(path)
+
+def _render(index, job):
+    t = time.perf_counter()
+    result = {'index': index, 'output': None}
+
+    try:
+        if isinstance(job, str):
+            job = json.loads(job)
+        if isinstance(job, dict):
+            output = job.get('output')
+        else:
+            output = job[2]
+        result['output'] = output
+
+        if isinstance(job, dict):
+            start, end, options = job['start'], job['end'], job.get('options')
+        else:
+            start, end, options = job[0], job[1], (job[3] if len(job) > 3 else None)
+        options = dict(options or {})
+
+        figsize = options.pop('figsize', [8, 4])
+        dpi = options.pop('dpi', None)
+        compare = options.pop('compare', True)
+        for key in options:
+            if key not in DATETICK_OPTIONS:
+                raise ValueError('Option "%s" is not valid' % key)
+        if options.get('rules') is not None:
+            options['rules'] = _rules(options['rules'])
+
+        # The figure is reused, so every job sets its size and dpi.
+        fig = _figure
+        fig.clear()
+        fig.set_size_inches(figsize)
+        fig.set_dpi(_dpi if dpi is None else dpi)
+
+        plot(fig, start, end, compare=compare, **options)
+
+        directory = os.path.dirname(output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # savefig() uses rcParams['savefig.dpi'] unless dpi is given.
+        fig.savefig(output, dpi=fig.dpi, bbox_inches='tight')
+        result['ok'] = True
+    except Exception as e:
+        result['ok'] = False
+        result['error'] = '%s: %s' % (type(e).__name__, e)
+
+    result['seconds'] = time.perf_counter() - t
+    return result
@@ -0,0 +1,280 @@
+import bisect
+import json
+import datetime
+import functools
+from collections import namedtuple
+
+import numpy as np
+
+import matplotlib.dates as mpld
+from matplotlib.ticker import FuncFormatter
+
+from datetick.ticks import CalendarLocator, MAXTICKS, _SECONDS, _todatetime64, _todatetime
+from datetick.epochs import _EpochFormatter
+
+# A rule applies to axis spans (in seconds) that are less than `span` and
+# not covered by an earlier rule.
+#
+# major and minor are (unit, step) pairs. For example, ('hour', 3) places
+# ticks at hours 0, 3, ..., 21 and ('year', 5) places ticks every 5 years.
+# For 'microsecond', step is the tick interval in microseconds. A third
+# element of 'start' counts the steps from the first unit boundary at or
+# after the start of the data instead; e.g., ('year', 2, 'start') for data
+# starting in 2001 places ticks at 2001, 2003, .... See datetick.ticks.
+#
+# fmt1 is format of the tick labels
+# fmt2 contains additional information that is used for the first tick label
+# or when there is a major change. For example, if
+#   fmt1 = %M:%S and fmt2 = %H,
+# the labels will have only minute and hour and the first tick will have a
+# label of %M:%S\n%H. If there is a change in hour somewhere on the axis,
+# that label will include the new hour.
+#
+# fmt1 = 'millis' labels ticks with fractional seconds, e.g., '.25'.
+
+MINUTE = 60
+HOUR = 60*MINUTE
+DAY = 24*HOUR
+
+DEFAULT_RULES = [
+    # span         major                  minor                  fmt1      fmt2
+    (0.1,          ('microsecond', 10000), ('microsecond', 2000), 'millis', '%H:%M:%S\n%Y-%m-%d'),
+    (0.5,          ('microsecond', 50000), ('microsecond', 10000), 'millis', '%H:%M:%S\n%Y-%m-%d'),
+    (1,            ('microsecond', 100000), ('microsecond', 20000), 'millis', '%H:%M:%S\n%Y-%m-%d'),
+    (5,            ('second', 1),  ('microsecond', 200000), '%M:%S', '%Y-%m-%dT%H'),
+    (10,           ('second', 1),  ('microsecond', 500000), '%M:%S', '%Y-%m-%dT%H'),
+    (20,           ('second', 2),  ('second', 1),   '%M:%S', '%Y-%m-%dT%H'),
+    (30,           ('second', 5),  ('second', 1),   '%M:%S', '%Y-%m-%dT%H'),
+    (MINUTE,       ('second', 10), ('second', 2),   '%M:%S', '%Y-%m-%dT%H'),
+    (2*MINUTE,     ('second', 20), ('second', 5),   '%M:%S', '%Y-%m-%dT%H'),
+    (3*MINUTE,     ('second', 20), ('second', 5),   '%M:%S', '%Y-%m-%dT%H'),
+    (5*MINUTE,     ('second', 30), ('second', 10),  '%M:%S', '%Y-%m-%dT%H'),
+    (10*MINUTE,    ('minute', 1),  ('second', 15),  '%M:%S', '%Y-%m-%dT%H'),
+    (20*MINUTE,    ('minute', 2),  ('second', 30),  '%M:%S', '%Y-%m-%dT%H'),
+    (30*MINUTE,    ('minute', 5),  ('minute', 1),   '%H:%M', '%Y-%m-%d'),
+    (HOUR,         ('minute', 10), ('minute', 2),   '%H:%M', '%Y-%m-%d'),
+    (2*HOUR,       ('minute', 15), ('minute', 5),   '%H:%M', '%Y-%m-%d'),
+    (4*HOUR,       ('minute', 20), ('minute', 5),   '%H:%M', '%Y-%m-%d'),
+    (6*HOUR,       ('hour', 1),    ('minute', 10),  '%H:%M', '%Y-%m-%d'),
+    (12*HOUR,      ('hour', 2),    ('minute', 30),  '%H:%M', '%Y-%m-%d'),
+    (DAY,          ('hour', 3),    ('hour', 1),     '%H',    '%Y-%m-%d'),
+    (2*DAY,        ('hour', 4),    ('hour', 2),     '%H',    '%Y-%m-%d'),
+    (3*DAY,        ('hour', 6),    ('hour', 3),     '%H',    '%Y-%m-%d'),
+    (4*DAY,        ('hour', 12),   ('hour', 3),     '%H',    '%Y-%m-%d'),
+    (8*DAY,        ('day', 1),     ('hour', 4),     '%d',    '%Y-%m'),
+    (16*DAY,       ('day', 1),     ('day', 1),      '%d',    '%Y-%m'),
+    (32*DAY,       ('day', 4),     ('day', 1),      '%d',    '%Y-%m'),
+    (60*DAY,       ('day', 7),     ('day', 1),      '%d',    '%Y-%m'),
+    (183*DAY,      ('month', 1),   ('day', 7),      '%m',    '%Y'),
+    (367*DAY,      ('month', 1),   ('month', 1),    '%m',    '%Y'),
+    (366*2*DAY,    ('month', 2),   ('month', 1),    '%m',    '%Y'),
+    (366*8*DAY,    ('year', 1),    ('month', 4),    '%Y',    ''),
+    (366*15*DAY,   ('year', 2, 'start'), ('year', 1), '%Y',    ''),
+    (366*40*DAY,   ('year', 5),    ('year', 1),     '%Y',    ''),
+    (366*100*DAY,  ('year', 10),   ('year', 2),     '%Y',    ''),
+    (366*200*DAY,  ('year', 20),   ('year', 5),     '%Y',    ''),
+    (float('inf'), ('year', 50),   ('year', 10),    '%Y',    ''),
+]
+
+# Most ticks (major plus minor) that a rule may place on an axis: one per
+# MINSPACING points of axis length, but at least MINTICKS. MAXTICKS is used
+# if the axis length is not known. If a rule would place more, the rule
+# for the next larger span is used.
+MINSPACING = 2
+MINTICKS = 10
+
+# Most tick labels kept by _label(). Labels are formatted again on every
+# pan and zoom, mostly for ticks that were already labeled.
+LABELCACHE = 10000
+
+Rule = namedtuple('Rule', ['span', 'major', 'minor', 'fmt1', 'fmt2', 'Mtick', 'mtick', 'formatter'])
+Rule.__doc__ = '''A compiled span rule.
+
+    span, major, minor, fmt1, fmt2 are as in DEFAULT_RULES. Mtick, mtick
+    and formatter are locator and formatter instances built from them,
+    used for computing tick values and labels. Use _locator() and
+    _formatter() to create instances to attach to an axis.
+'''
+
+RuleTable = namedtuple('RuleTable', ['spans', 'rules'])
+
+def compile_rules(rules):
+    '''
+    compile_rules(rules) returns a RuleTable for use with the rules=...
+    option of datetick(), tickplan(), DatetickLocator and DatetickFormatter.
+
+    Each element of rules is a (span, major, minor, fmt1, fmt2) sequence
+    or a dict with these keys. Spans must be increasing; spans larger than
+    the last span use the last rule. See DEFAULT_RULES.
+    '''
+
+    compiled = []
+    for rule in rules:
+        if isinstance(rule, dict):
+            rule = [rule.get(key) for key in ('span', 'major', 'minor', 'fmt1', 'fmt2')]
+        span, major, minor, fmt1, fmt2 = rule
+        span = float('inf') if span is None else float(span)
+        major = _spec(major)
+        minor = _spec(minor)
+        fmt2 = fmt2 or ''
+        if compiled and span <= compiled[-1].span:
+            raise ValueError('Rule spans must be increasing (%s after %s)' % (span, compiled[-1].span))
+        compiled.append(Rule(span, major, minor, fmt1, fmt2,
+                             _locator(major), _locator(minor), _formatter(fmt1)))
+
+    if len(compiled) == 0:
+        raise ValueError('At least one rule is required')
+
+    return RuleTable(tuple(rule.span for rule in compiled), tuple(compiled))
+
+def load_rules(path):
+    '''
+    load_rules(path) reads a rule table from a JSON or TOML file and
+    returns it compiled. The file has a top-level list named "rules" with
+    elements that have keys span, major, minor, fmt1, and fmt2. A span of
+    null (JSON) or inf (TOML) can be used for the last rule.
+
+    Example (TOML):
+    --------
+        [[rules]]
+        span = 3600
+        major = ["minute", 10]
+        minor = ["minute", 2]
+        fmt1 = "%H:%M"
+        fmt2 = "%Y-%m-%d"
+    '''
+
+    if str(path).endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:
+            import tomli as tomllib
+        with open(path, 'rb') as f:
+            data = tomllib.load(f)
+    else:
+        with open(path, 'r') as f:
+            data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data['rules']
+
+    return compile_rules(data)
+
+def _rule(tmin, tmax, rules=None, length=None, prop=None, dir='x', zone=None):
+    '''
+    Returns the Rule for axis limits tmin and tmax.
+
+    A rule for a larger span is used if the rule would place more ticks
+    than the tick budget for an axis that is `length` points long (see
+    MINSPACING), or, if length is given, if its major tick labels would
+    overlap. prop is the FontProperties of the tick labels and zone the
+    _Zone (None for UTC) in which they are written.
+
+    Ticks are not generated to make this decision.
+    '''
+
+    if rules is None:
+        rules = RULES
+
+    # Rounded to microseconds as by num2date(). abs() for inverted axes.
+    time = _todatetime64(np.array([tmin, tmax], dtype=float))
+    nSecs = abs(float((time[1] - time[0])/np.timedelta64(1, 'us')))/1e6
+    last = len(rules.rules) - 1
+    i = min(bisect.bisect_right(rules.spans, nSecs), last)
+
+    if nSecs == 0:
+        return rules.rules[i]
+
+    if length is None:
+        budget = MAXTICKS
+    else:
+        budget = max(MINTICKS, length/MINSPACING)
+        from datetick.metrics import _fits
+
+    while i < last:
+        rule = rules.rules[i]
+        if _count(rule, nSecs) <= budget:
+            if length is None or _fits(rule, tmin, tmax, nSecs, length, prop, dir, zone):
+                break
+        i += 1
+
+    return rules.rules[i]
+
+def _count(rule, nSecs):
+    '''Returns the approximate number of ticks rule places in nSecs seconds'''
+
+    n = 0
+    for spec in (rule.major, rule.minor):
+        n += nSecs/(spec[1]*_SECONDS[spec[0]]) + 1
+    return n
+
+def _spec(spec):
+    '''Returns (unit, step) or (unit, step, anchor) tuple for a spec from a rule'''
+
+    spec = (str(spec[0]), int(spec[1])) + tuple(str(a) for a in spec[2:])
+    if spec[0] not in _SECONDS:
+        raise ValueError('Unknown tick unit "%s"' % spec[0])
+    if spec[1] < 1:
+        raise ValueError('Tick step must be at least 1 (got %d)' % spec[1])
+    if spec[2:] not in ((), ('start',)):
+        raise ValueError('Tick anchor must be "start" (got "%s")' % spec[2])
+    return spec
+
+def _locator(spec, zone=None, epoch=None):
+    '''
+    Returns a new locator for a (unit, step) or (unit, step, anchor) spec,
+    _Zone zone (None for UTC), and axis values in _Epoch epoch (None for
+    datenums)
+    '''
+
+    return CalendarLocator(*spec, tz=None if zone is None else zone.tz, epoch=epoch)
+
+def _formatter(fmt1, zone=None, epoch=None):
+    '''
+    Returns a new formatter for fmt1, _Zone zone (None for UTC), and axis
+    values in _Epoch epoch (None for datenums)
+    '''
+
+    if fmt1 == 'millis':
+        # Time zone offsets are whole seconds.
+        formatter = FuncFormatter(_millis)
+    elif zone is None:
+        formatter = mpld.DateFormatter(fmt1)
+    else:
+        formatter = mpld.DateFormatter(fmt1, tz=zone.tz)
+    if epoch is not None:
+        formatter = _EpochFormatter(formatter, epoch)
+    return formatter
+
+def _labels(values, fmt1, zone=None):
+    '''Returns list of fmt1 labels for datenums values in _Zone zone'''
+
+    return [_label(x, fmt1, zone) for x in np.asarray(values, dtype=float).tolist()]
+
+@functools.lru_cache(maxsize=LABELCACHE)
+def _label(x, fmt1, zone=None):
+    '''Returns the fmt1 label for datenum x (a float) in _Zone zone'''
+
+    formatter = _shared(fmt1, zone)
+    if isinstance(formatter, mpld.DateFormatter) and not formatter._usetex:
+        # Same as formatter(x), which is slower because of num2date().
+        t = _todatetime(x).replace(tzinfo=datetime.timezone.utc)
+        if formatter.tz is not datetime.timezone.utc:
+            t = t.astimezone(formatter.tz)
+        return t.strftime(fmt1)
+    return formatter(x)
+
+@functools.lru_cache(maxsize=None)
+def _shared(fmt1, zone=None):
+    '''Returns a formatter for fmt1 used only by _label()'''
+
+    return _formatter(fmt1, zone)
+
+def _millis(x, pos=None):
+    x = _todatetime(x)
+    label = x.strftime('.%f')
+    label = label[0:3]
+    #label = label.rstrip(".")
+    return label
+
+RULES = compile_rules(DEFAULT_RULES)
@@ -0,0 +1,304 @@
+import numpy as np
+import matplotlib.dates as mpld
+import matplotlib.transforms as mtransforms
+from matplotlib.ticker import Formatter
+from matplotlib.transforms import Bbox
+
+from datetick.plan import _context
+from datetick.rules import _labels, _label
+from datetick.ticker import _axisrule
+from datetick.metrics import _space
+from datetick.ticks import ticks, _todatetime64, _todatenum, _datenums, MAXTICKS, _SECONDS
+from datetick.zones import _zone
+from datetick.epochs import _epoch
+
+class Scroller:
+    '''
+    Scroller(axes) ticks the x axis of `axes` for a view that slides forward
+    or backward a little at a time, as in a strip chart. Use dir='y' for
+    the y axis, rules=... for a RuleTable from load_rules(), tz=... for
+    ticks and labels in local time, and epoch=... for axis values that are
+    seconds since an epoch (see datetick()).
+
+    The rule is selected as by datetick(), but only again when the width
+    of the view or the length of the axis (e.g., after a resize or a dpi
+    change) changes. While neither does, the ticks still in view and
+    their labels are kept; only ticks that enter the view are generated
+    and labeled, and ticks that leave it are dropped.
+
+    With blit=True, the axis is drawn by blit() instead of by canvas draws,
+    so that a frame only renders the axis and the given (animated)
+    artists. The rest of the figure is restored from a copy made after the
+    last canvas draw. Matplotlib's FuncAnimation(..., blit=True) only
+    blits the area inside the axes, which does not include the tick
+    labels; use blit() from a timer or an update loop instead.
+
+    Example:
+    --------
+        from datetick.scroll import Scroller
+        line, = ax.plot(t, y, animated=True)
+        scroller = Scroller(ax, blit=True)
+        fig.canvas.draw()
+        def update():
+            t, y = ... # New data
+            line.set_data(t, y)
+            scroller.set_lim(t[-1] - window, t[-1])
+            scroller.blit(line)
+        timer = fig.canvas.new_timer(interval=33)
+        timer.add_callback(update)
+        timer.start()
+    '''
+
+    def __init__(self, axes, dir='x', rules=None, blit=False, tz=None, epoch=None):
+        self.axes = axes
+        self.dir = dir
+        self.rules = rules
+        self.zone = _zone(tz)
+        self.epoch = _epoch(epoch)
+        if dir == 'x':
+            self.axis = axes.xaxis
+        else:
+            self.axis = axes.yaxis
+
+        self.rule = None
+        self._width = None
+        self._length = None
+        self._lim = None
+        self._major = None
+        self._minor = None
+        self._labels = {}
+
+        self.axis.set_major_locator(_ScrollLocator(self))
+        self.axis.set_minor_locator(_ScrollLocator(self, minor=True))
+        self.axis.set_major_formatter(_ScrollFormatter(self))
+
+        self._background = None
+        self._region = None
+        if blit:
+            self.axis.set_animated(True)
+            # Same as canvas.mpl_connect(), but kept when the figure is
+            # pickled (Matplotlib versions without _canvas_callbacks drop
+            # it).
+            figure = self.axes.figure
+            callbacks = getattr(figure, '_canvas_callbacks', None)
+            if hasattr(callbacks, '_connect_picklable'):
+                callbacks._connect_picklable('draw_event', self._on_draw)
+            else:
+                figure.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def set_lim(self, vmin, vmax):
+        '''
+        Sets the axis limits; vmin and vmax are datenums (floats),
+        datetimes, or datetime64s, or, with epoch, seconds since the epoch
+        '''
+
+        if self.epoch is None:
+            vmin, vmax = _datenums(vmin, vmax)
+        if self.dir == 'x':
+            self.axes.set_xlim(vmin, vmax)
+        else:
+            self.axes.set_ylim(vmin, vmax)
+
+    def blit(self, *artists):
+        '''
+        Draws the axis and artists over the copy of the figure made after
+        the last canvas draw and blits the area they cover. The canvas is
+        drawn first if no copy has been made.
+        '''
+
+        canvas = self.axes.figure.canvas
+        if self._background is None:
+            canvas.draw()
+        renderer = canvas.get_renderer()
+
+        # Restore the area of the axes and the axis, including the labels
+        # of the previous frame, which may have been larger.
+        bbox = self.axis.get_tightbbox(renderer)
+        region = self.axes.bbox if bbox is None else Bbox.union([self.axes.bbox, bbox])
+        if self._region is not None:
+            region = Bbox.union([region, self._region])
+        # Whole pixels, so that antialiased edges are included.
+        region = Bbox(np.array([np.floor(region.p0) - 1, np.ceil(region.p1) + 1]))
+        self._region = region
+
+        # The background is a copy of the whole figure, so its lower left
+        # corner is at (0, 0).
+        canvas.restore_region(self._background, bbox=region, xy=(0, 0))
+        # Draw in the same order as a canvas draw.
+        for artist in sorted((self.axis,) + artists, key=lambda a: a.get_zorder()):
+            artist.axes.draw_artist(artist)
+        canvas.blit(region)
+
+    def __getstate__(self):
+        # The copy of the figure is not picklable; it is made again by the
+        # next canvas draw.
+        return {**self.__dict__, '_background': None, '_region': None}
+
+    def _on_draw(self, event):
+        canvas = self.axes.figure.canvas
+        self._background = canvas.copy_from_bbox(self.axes.figure.bbox)
+        self._region = None
+
+    def _update(self, vmin, vmax):
+        '''Updates the rule and the tick and label caches for view limits vmin < vmax'''
+
+        # Axis length in points; changes when the figure is resized or its
+        # dpi is changed.
+        length = _space(self.axis)[0]
+        if self._lim == (vmin, vmax) and self._length == length:
+            return
+        self._lim = (vmin, vmax)
+
+        width = vmax - vmin
+        if (self._width is None or length != self._length
+                or abs(width - self._width) > 1e-6*self._width + 1e-10):
+            # 1e-10 days (~10 us) allows for rounding when the limits are
+            # advanced by adding the same amount each frame.
+            self.rule = _axisrule(self.axis, vmin, vmax, self.rules, self.zone)
+            self._width = width
+            self._length = length
+            anchor = self._anchor(vmin)
+            self._major = _Window(self.rule.major, anchor, self.zone)
+            self._minor = _Window(self.rule.minor, anchor, self.zone)
+            self._labels = {}
+
+        self._major.update(vmin, vmax)
+        self._minor.update(vmin, vmax)
+
+    def _anchor(self, vmin):
+        '''Returns the datetime64 that 'start' specs count from'''
+
+        # Kept while the width is unchanged so that ticks do not jump when
+        # old data is removed from the axis.
+        dmin, dmax = self.axis.get_data_interval()
+        if np.isfinite(dmin) and np.isfinite(dmax) and dmin <= dmax:
+            vmin = dmin if self.epoch is None else self.epoch.todatenum(dmin)
+        return _todatetime64(np.array([vmin], dtype=float))[0]
+
+    def _labeled(self, values):
+        '''Returns fmt1 labels for values, formatting only those not cached'''
+
+        new = [x for x in values if x not in self._labels]
+        if len(new) > 0:
+            self._labels.update(zip(new, _labels(new, self.rule.fmt1, self.zone)))
+        labels = [self._labels[x] for x in values]
+        # Drop labels of ticks that left the view.
+        self._labels = dict(zip(values, labels))
+        return labels
+
+class _Window:
+    '''Ticks for a (unit, step[, anchor]) spec between datenums lo and hi'''
+
+    def __init__(self, spec, anchor, zone=None):
+        self.spec = spec
+        self.anchor = anchor if spec[2:] == ('start',) else None
+        self.zone = zone
+        self.lo = None
+        self.hi = None
+        self.values = np.array([])
+
+    def update(self, vmin, vmax):
+        if abs(vmax - vmin)*86400/(self.spec[1]*_SECONDS[self.spec[0]]) > MAXTICKS:
+            self.lo = None
+            self.values = np.array([])
+            return
+
+        if self.lo is None or vmin > self.hi or vmax < self.lo:
+            self.values = self._ticks(vmin, vmax)
+        else:
+            keep = self.values[(self.values >= vmin) & (self.values <= vmax)]
+            parts = [keep]
+            if vmin < self.lo:
+                old = self._ticks(vmin, self.lo)
+                if len(keep) > 0:
+                    old = old[old < keep[0]]
+                parts.insert(0, old)
+            if vmax > self.hi:
+                new = self._ticks(self.hi, vmax)
+                if len(keep) > 0:
+                    new = new[new > keep[-1]]
+                parts.append(new)
+            self.values = np.concatenate(parts)
+
+        self.lo = vmin
+        self.hi = vmax
+
+    def _ticks(self, vmin, vmax):
+        lim = _todatetime64(np.array([vmin, vmax], dtype=float))
+        return _todatenum(ticks(lim[0], lim[1], self.spec[0], self.spec[1],
+                                anchor=self.anchor, tz=self.zone))
+
+class _ScrollLocator(mpld.DateLocator):
+    '''Locator that returns the ticks cached by a Scroller'''
+
+    def __init__(self, scroller, minor=False):
+        super().__init__()
+        self.scroller = scroller
+        self.minor = minor
+
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        return self._values(vmin, vmax)
+
+    def tick_values(self, vmin, vmax):
+        if self.scroller.epoch is None:
+            vmin, vmax = _datenums(vmin, vmax)
+        return self._values(vmin, vmax)
+
+    def nonsingular(self, vmin, vmax):
+        if self.scroller.epoch is None:
+            return super().nonsingular(vmin, vmax)
+        return mtransforms.nonsingular(vmin, vmax, expander=0.05)
+
+    def _values(self, vmin, vmax):
+        '''Returns ticks in axis units for limits vmin and vmax in axis units'''
+
+        if vmin > vmax:
+            vmin, vmax = vmax, vmin
+        if vmin == vmax:
+            return [vmin]
+        epoch = self.scroller.epoch
+        if epoch is not None:
+            vmin, vmax = epoch.todatenum([vmin, vmax])
+        self.scroller._update(vmin, vmax)
+        window = self.scroller._minor if self.minor else self.scroller._major
+        if epoch is not None:
+            return epoch.fromdatenum(window.values)
+        return window.values
+
+class _ScrollFormatter(Formatter):
+    '''Formatter that returns the labels cached by a Scroller'''
+
+    def __init__(self, scroller):
+        self.scroller = scroller
+
+    def __call__(self, x, pos=None):
+        self.scroller._update(*self._view())
+        if self.scroller.epoch is not None:
+            x = self.scroller.epoch.todatenum(x)
+        if self.scroller.zone is not None or self.scroller.epoch is not None:
+            return _label(float(x), self.scroller.rule.fmt1, self.scroller.zone)
+        return self.scroller.rule.formatter(x, pos)
+
+    def format_ticks(self, values):
+        self.set_locs(values)
+        if len(values) == 0:
+            return []
+        if self.scroller.epoch is not None:
+            values = self.scroller.epoch.todatenum(values)
+        lim = self._view()
+        self.scroller._update(*lim)
+        rule = self.scroller.rule
+        labels = self.scroller._labeled(list(values))
+        if rule.fmt2 != '':
+            labels = _context(labels, values, lim, rule.fmt2, dir=self.scroller.dir,
+                              zone=self.scroller.zone)
+        return labels
+
+    def _view(self):
+        '''Returns view limits as increasing datenums'''
+
+        vmin, vmax = self.axis.get_view_interval()
+        if self.scroller.epoch is not None:
+            vmin, vmax = self.scroller.epoch.todatenum([vmin, vmax])
+        return (min(vmin, vmax), max(vmin, vmax))
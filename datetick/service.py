@@ -0,0 +1,142 @@
+import json
+import datetime
+import functools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from datetick.plan import tickplan
+from datetick.rules import load_rules
+
+# Pixels per inch of a request's width_px; 96 is the CSS pixel. Widths are
+# converted to points (1/72 inch) for the label overlap check.
+DPI = 96
+
+def plan(request, rules=None, dpi=DPI):
+    '''
+    plan(request) returns the tick plan for one request as a
+    JSON-serializable dict, for front ends that draw their own axes.
+
+    request is a dict with keys start and end (ISO 8601 strings; a time
+    zone offset is converted to UTC), and, optionally, width_px, the
+    length of the axis in pixels (dpi pixels per inch, > 0), tz, a time zone
+    name such as 'America/New_York' for ticks and labels in local time,
+    and id, which is copied to the result. Without width_px, labels are
+    not checked for overlap.
+
+    The result has keys major and minor (ISO 8601 UTC strings with
+    microseconds), labels (one per major tick; the fmt2 context row, if
+    any, follows a newline), and ok. If the request is invalid, ok is
+    False and error is set.
+
+    Example:
+    --------
+        from datetick.service import plan
+        plan({'start': '2001-01-01T00:00:00Z', 'end': '2001-01-02T01:00:00Z', 'width_px': 600})
+        # {'major': ['2001-01-01T00:00:00.000000Z', ...],
+        #  'labels': ['00\\n2001-01-01', '04', ...], ...}
+    '''
+
+    result = {}
+    try:
+        if 'id' in request:
+            result['id'] = request['id']
+        length = None
+        if request.get('width_px') is not None:
+            width = float(request['width_px'])
+            if not width > 0:
+                raise ValueError('width_px must be positive, got %s' % request['width_px'])
+            length = 72.0*width/dpi
+        p = tickplan(_datetime64(request['start']), _datetime64(request['end']),
+                     rules=rules, length=length, tz=request.get('tz'))
+        result['major'] = np.datetime_as_string(p.major, unit='us', timezone='UTC').tolist()
+        result['minor'] = np.datetime_as_string(p.minor, unit='us', timezone='UTC').tolist()
+        result['labels'] = [str(label) for label in p.labels]
+        result['ok'] = True
+    except Exception as e:
+        result['ok'] = False
+        result['error'] = '%s: %s' % (type(e).__name__, e)
+
+    return result
+
+def plans(lines, rules=None, dpi=DPI, processes=1, chunksize=1000):
+    '''
+    plans(lines) yields one JSON tick plan (a string) for each JSON
+    request in `lines`, in order. See plan() for the format. Blank lines
+    are skipped; a line that is not valid JSON gives a result with ok
+    False.
+
+    rules is the path of a rule file for load_rules() (default:
+    datetick.rules.DEFAULT_RULES).
+
+    With processes > 1, lines are sent in chunks of `chunksize` to a pool
+    of worker processes. At most 2*processes chunks are pending, so
+    memory use does not grow with the number of lines.
+
+    Example:
+    --------
+        import sys
+        from datetick.service import plans
+        for line in plans(sys.stdin, processes=8):
+            print(line)
+    '''
+
+    if processes == 1:
+        table = _table(rules)
+        for line in lines:
+            if line.strip():
+                yield _plan(line, table, dpi)
+        return
+
+    with ProcessPoolExecutor(processes) as pool:
+        pending = deque()
+        for chunk in _chunks(lines, chunksize):
+            pending.append(pool.submit(_plans, chunk, rules, dpi))
+            if len(pending) >= 2*processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+def _plans(lines, rules, dpi):
+    table = _table(rules)
+    return [_plan(line, table, dpi) for line in lines]
+
+def _plan(line, table, dpi):
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return json.dumps({'ok': False, 'error': 'ValueError: %s' % e})
+    return json.dumps(plan(request, rules=table, dpi=dpi))
+
+@functools.lru_cache(maxsize=None)
+def _table(rules):
+    '''Returns the RuleTable in file `rules`, read once per process'''
+
+    if rules is None:
+        return None
+    return load_rules(rules)
+
+def _chunks(lines, size):
+    chunk = []
+    for line in lines:
+        if line.strip():
+            chunk.append(line)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _datetime64(s):
+    '''Returns ISO 8601 string s as datetime64[us] in UTC'''
+
+    try:
+        t = datetime.datetime.fromisoformat(s)
+    except ValueError:
+        # Forms that fromisoformat() does not accept, e.g., '2001-001'.
+        import dateutil.parser
+        t = dateutil.parser.parse(s)
+    if t.tzinfo is not None:
+        t = t.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return np.datetime64(t, 'us')
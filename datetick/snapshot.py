@@ -0,0 +1,64 @@
+import numpy as np
+import dateutil.parser
+
+from datetick.plan import tickplan
+
+def snapshot(start, end, rules=None):
+    '''
+    snapshot(start, end) returns a JSON-serializable dict with the rule,
+    major and minor tick positions, and labels that datetick() uses for
+    axis limits start and end (ISO 8601 strings). No figure is created.
+
+    Positions are ISO 8601 strings with microseconds.
+
+    Example:
+    --------
+        from datetick.snapshot import snapshot
+        snapshot('2001-01-01T00:00:00Z', '2001-01-02T01:00:00Z')
+    '''
+
+    plan = tickplan(_datetime64(start), _datetime64(end), rules=rules)
+
+    rule = None
+    if plan.rule is not None:
+        rule = {
+            'span': plan.rule.span,
+            'major': list(plan.rule.major),
+            'minor': list(plan.rule.minor),
+            'fmt1': plan.rule.fmt1,
+            'fmt2': plan.rule.fmt2
+        }
+
+    return {
+        'start': start,
+        'end': end,
+        'rule': rule,
+        'major': [str(t) for t in plan.major],
+        'minor': [str(t) for t in plan.minor],
+        'labels': [str(label) for label in plan.labels]
+    }
+
+def compare(expected, actual):
+    '''
+    Returns a list of strings describing the differences between
+    snapshots `expected` and `actual`. The list is empty if they match.
+    '''
+
+    diffs = []
+    for key in ['rule', 'major', 'minor', 'labels']:
+        a = expected.get(key)
+        b = actual.get(key)
+        if a == b:
+            continue
+        if isinstance(a, list) and isinstance(b, list) and len(a) == len(b):
+            for i in range(len(a)):
+                if a[i] != b[i]:
+                    diffs.append('%s[%d]: expected %r, got %r' % (key, i, a[i], b[i]))
+        else:
+            diffs.append('%s: expected %r, got %r' % (key, a, b))
+    return diffs
+
+def _datetime64(s):
+    # Parse as datetick_test.py does; drop the time zone (all times are UTC).
+    t = dateutil.parser.parse(s).replace(tzinfo=None)
+    return np.datetime64(t, 'us')
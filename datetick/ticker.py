@@ -0,0 +1,117 @@
+import matplotlib.dates as mpld
+import matplotlib.transforms as mtransforms
+from matplotlib.ticker import Formatter
+
+from datetick.plan import _context
+from datetick.rules import _rule, _labels, _label, _locator
+from datetick.ticks import _datenums
+from datetick.metrics import _space
+from datetick.zones import _zone
+from datetick.epochs import _epoch
+
+class DatetickLocator(mpld.DateLocator):
+    '''
+    Locator that places ticks using the datetick() span rules.
+
+    The rule is selected from the axis view limits each time Matplotlib
+    asks for ticks, so the ticks follow pan and zoom without callbacks.
+    rules is a RuleTable from load_rules() or compile_rules(). With tz (a
+    tzinfo or a name such as 'America/New_York'), ticks are aligned to
+    local time in tz; use the same tz for the DatetickFormatter. With
+    epoch (e.g., 'gps'), axis values are seconds since epoch (see
+    datetick()); use the same epoch for the DatetickFormatter.
+
+    Example:
+    --------
+        from datetick import DatetickLocator, DatetickFormatter
+        ax.xaxis.set_major_locator(DatetickLocator())
+        ax.xaxis.set_minor_locator(DatetickLocator(minor=True))
+        ax.xaxis.set_major_formatter(DatetickFormatter())
+    '''
+
+    def __init__(self, minor=False, tz=None, rules=None, epoch=None):
+        super().__init__(tz=tz)
+        self.minor = minor
+        self.rules = rules
+        self.zone = _zone(tz)
+        self.epoch = _epoch(epoch)
+
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+
+    def tick_values(self, vmin, vmax):
+        if self.epoch is None:
+            vmin, vmax = _datenums(vmin, vmax)
+        if vmin > vmax:
+            vmin, vmax = vmax, vmin
+        if vmin == vmax:
+            return [vmin]
+        if self.epoch is not None:
+            vmin, vmax = self.epoch.todatenum([vmin, vmax])
+        rule = _axisrule(self.axis, vmin, vmax, self.rules, self.zone)
+        locator = rule.mtick if self.minor else rule.Mtick
+        if self.zone is not None or self.epoch is not None:
+            locator = _locator(rule.minor if self.minor else rule.major, self.zone, self.epoch)
+        values = locator._values(vmin, vmax, self.axis)
+        if self.epoch is not None:
+            return self.epoch.fromdatenum(values)
+        return values
+
+    def nonsingular(self, vmin, vmax):
+        if self.epoch is None:
+            return super().nonsingular(vmin, vmax)
+        return mtransforms.nonsingular(vmin, vmax, expander=0.05)
+
+class DatetickFormatter(Formatter):
+    '''
+    Formatter that labels ticks using the datetick() span rules.
+
+    The first label and labels where there is a major change (e.g., a new
+    day) include the fmt2 context row. Labels are in local time in tz, if
+    given. With epoch, axis values are seconds since epoch.
+    '''
+
+    def __init__(self, rules=None, tz=None, epoch=None):
+        self.rules = rules
+        self.zone = _zone(tz)
+        self.epoch = _epoch(epoch)
+
+    def __call__(self, x, pos=None):
+        vmin, vmax = self._view()
+        rule = _axisrule(self.axis, vmin, vmax, self.rules, self.zone)
+        if self.epoch is not None:
+            x = self.epoch.todatenum(x)
+        if self.zone is not None or self.epoch is not None:
+            return _label(float(x), rule.fmt1, self.zone)
+        return rule.formatter(x, pos)
+
+    def format_ticks(self, values):
+        self.set_locs(values)
+        if len(values) == 0:
+            return []
+        if self.epoch is not None:
+            values = self.epoch.todatenum(values)
+        lim = self._view()
+        rule = _axisrule(self.axis, *lim, self.rules, self.zone)
+        labels = _labels(values, rule.fmt1, self.zone)
+        if rule.fmt2 != '':
+            dir = getattr(self.axis, 'axis_name', 'x')
+            labels = _context(labels, values, lim, rule.fmt2, dir=dir, zone=self.zone)
+        return labels
+
+    def _view(self):
+        '''Returns view limits as increasing datenums'''
+
+        vmin, vmax = self.axis.get_view_interval()
+        if self.epoch is not None:
+            vmin, vmax = self.epoch.todatenum([vmin, vmax])
+        return (min(vmin, vmax), max(vmin, vmax))
+
+def _axisrule(axis, vmin, vmax, rules, zone=None):
+    '''Returns the Rule for view limits vmin and vmax of axis (may be None)'''
+
+    if axis is None:
+        return _rule(vmin, vmax, rules=rules, zone=zone)
+    length, prop = _space(axis)
+    return _rule(vmin, vmax, rules=rules, length=length, prop=prop, dir=axis.axis_name, zone=zone)
@@ -0,0 +1,264 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import matplotlib.dates as mpld
+import matplotlib.transforms as mtransforms
+
+from datetick.zones import _zone
+from datetick.epochs import _epoch
+
+# Most ticks that a CalendarLocator generates. If more would be placed
+# (e.g., the view limits grew by a large factor before datetick() was
+# re-applied), no ticks are placed.
+MAXTICKS = 1000
+
+# Approximate length of tick units in seconds.
+_SECONDS = {
+    'microsecond': 1e-6,
+    'second': 1,
+    'minute': 60,
+    'hour': 3600,
+    'day': 86400,
+    'month': 30.44*86400,
+    'year': 365.25*86400
+}
+
+# NumPy datetime64 unit codes.
+_CODES = {
+    'microsecond': 'us',
+    'second': 's',
+    'minute': 'm',
+    'hour': 'h',
+    'day': 'D',
+    'month': 'M',
+    'year': 'Y'
+}
+
+# Number of units after which the unit's calendar field repeats (e.g., the
+# second of the minute repeats after 60 seconds), and the field value of
+# the 1970-01-01 epoch. Days are handled separately because months have
+# different lengths.
+_CYCLES = {
+    'microsecond': (86400*10**6, 0),
+    'second': (60, 0),
+    'minute': (60, 0),
+    'hour': (24, 0),
+    'month': (12, 0),
+    'year': (None, 1970)
+}
+
+def ticks(tmin, tmax, unit, step=1, anchor=None, tz=None):
+    '''
+    ticks(tmin, tmax, unit, step) returns the calendar-aligned tick times
+    between datetime64 values tmin and tmax (inclusive) as datetime64[us].
+
+    unit is one of 'microsecond', 'second', 'minute', 'hour', 'day',
+    'month', and 'year'. Ticks are at unit boundaries where the calendar
+    field is a multiple of step, as for the Matplotlib locators, e.g.,
+    ('hour', 3) places ticks at hours 0, 3, ..., 21, ('day', 7) at days of
+    the month 1, 8, 15, 22, 29, ('year', 5) at years 2000, 2005, ..., and
+    ('microsecond', 50000) at multiples of 50 ms since the start of the
+    day.
+
+    If anchor (a datetime64) is given, ticks are instead every step units
+    from the first unit boundary at or after anchor; e.g., ('year', 2) with
+    an anchor of 2001-03-01 places ticks at 2002, 2004, ...
+
+    If tz (a tzinfo or a name such as 'America/New_York') is given, ticks
+    are at the unit boundaries of local time in tz, e.g., at local
+    midnight for ('day', 1). tmin, tmax, anchor, and the ticks are UTC.
+    Around a change to or from daylight saving time, the ticks follow the
+    local clock: a skipped local hour has no ticks and a repeated one has
+    ticks for both occurrences.
+
+    Ticks are computed with NumPy datetime64 arithmetic.
+
+    Example:
+    --------
+        import numpy as np
+        from datetick.ticks import ticks
+        ticks(np.datetime64('2001-01-01'), np.datetime64('2001-01-02'), 'hour', 6)
+        # array(['2001-01-01T00:00:00.000000', '2001-01-01T06:00:00.000000', ...
+    '''
+
+    code = _CODES[unit]
+    tmin = np.datetime64(tmin, 'us')
+    tmax = np.datetime64(tmax, 'us')
+    if tmin > tmax:
+        tmin, tmax = tmax, tmin
+
+    zone = _zone(tz)
+    if zone is not None:
+        return _zoned(tmin, tmax, unit, step, anchor, zone)
+
+    # First and last unit boundary in [tmin, tmax]. astype() truncates
+    # towards -inf.
+    lo = _ceil(tmin, code).astype(np.int64)
+    hi = tmax.astype('datetime64[%s]' % code).astype(np.int64)
+    if hi < lo:
+        return np.array([], dtype='datetime64[us]')
+
+    if anchor is not None:
+        a = _ceil(np.datetime64(anchor, 'us'), code).astype(np.int64)
+        first = lo + (a - lo) % step
+        index = np.arange(first, hi + 1, step)
+    elif unit == 'day':
+        days = np.arange(lo, hi + 1).astype('datetime64[D]')
+        day = (days - days.astype('datetime64[M]')).astype(np.int64)
+        return days[day % step == 0].astype('datetime64[us]')
+    else:
+        cycle, offset = _CYCLES[unit]
+        if cycle is None or cycle % step == 0:
+            # Field is a multiple of step if and only if the number of units
+            # since the epoch (plus the field value at the epoch) is.
+            first = lo + (-(lo + offset)) % step
+            index = np.arange(first, hi + 1, step)
+        else:
+            # e.g., ('second', 7) places ticks at seconds 0, 7, ..., 56 of
+            # each minute.
+            index = np.arange(lo, hi + 1)
+            index = index[((index + offset) % cycle) % step == 0]
+
+    return index.astype('datetime64[%s]' % code).astype('datetime64[us]')
+
+def _zoned(tmin, tmax, unit, step, anchor, zone):
+    '''ticks() for local time in _Zone zone'''
+
+    if anchor is not None:
+        anchor = zone.tolocal(np.datetime64(anchor, 'us'))
+    segments = zone.segments(tmin, tmax)
+    if segments is None:
+        # Ticks are at least months apart, so they are rarely near a change
+        # of offset.
+        lim = zone.tolocal(np.array([tmin, tmax]))
+        return np.unique(zone.toutc(ticks(lim[0], lim[1], unit, step, anchor=anchor)))
+
+    # Ticks in local time for each interval of constant offset. The end of
+    # an interval other than the last is the time of a change of offset,
+    # which the local clock does not show (e.g., it goes from 01:59:59 EDT
+    # to 01:00:00 EST), so it is excluded.
+    parts = []
+    for start, end, offset in segments:
+        local = ticks(start + offset, end + offset, unit, step, anchor=anchor)
+        if end != tmax:
+            local = local[local < end + offset]
+        parts.append(local - offset)
+    if len(parts) == 1:
+        return parts[0]
+    return np.unique(np.concatenate(parts))
+
+def _ceil(t, code):
+    '''Returns the first boundary of unit `code` at or after datetime64 t'''
+
+    c = t.astype('datetime64[%s]' % code)
+    if c < t:
+        c = c + 1
+    return c
+
+def _todatetime64(x):
+    '''Converts datenums to datetime64[us], rounding as mpld.num2date() does'''
+
+    us = np.round(x*86400e6)
+    # num2date() rounds to the nearest 20 microseconds far from the epoch.
+    far = np.abs(x) > 70*365
+    us[far] = np.round(us[far]/20)*20
+    return np.datetime64(mpld.get_epoch(), 'us') + us.astype('timedelta64[us]')
+
+def _todatetime(x):
+    '''Converts a datenum to a naive UTC datetime as mpld.num2date() does'''
+
+    t = datetime.fromisoformat(mpld.get_epoch()) + timedelta(microseconds=round(x*86400e6))
+    if abs(x) > 70*365:
+        us = round(t.microsecond/20)*20
+        t = t.replace(microsecond=0) + timedelta(microseconds=us)
+    return t
+
+def _datenums(vmin, vmax):
+    '''
+    Returns limits vmin and vmax as datenums. Floats, which Matplotlib
+    passes to tick_values(), are kept; datetimes and datetime64s are
+    converted.
+    '''
+
+    return tuple(float(mpld.date2num(v)) if isinstance(v, (datetime, np.datetime64)) else float(v)
+                 for v in (vmin, vmax))
+
+def _todatenum(t):
+    '''Converts datetime64 values to datenums'''
+
+    return mpld.date2num(np.asarray(t, dtype='datetime64[us]'))
+
+class CalendarLocator(mpld.DateLocator):
+    '''
+    Locator that places ticks using ticks(), e.g., CalendarLocator('hour', 3)
+    places ticks at hours 0, 3, ..., 21.
+
+    With anchor='start', ticks are every step units from the first unit
+    boundary at or after the start of the axis data (or the view, if the
+    axis has no data), e.g., CalendarLocator('year', 2, anchor='start').
+
+    With tz (a tzinfo or a name), ticks are at unit boundaries of local
+    time in tz; see ticks(). The default is UTC.
+
+    With epoch (e.g., 'unix' or 'gps'; see datetick.epochs.EPOCHS), axis
+    values are seconds since epoch instead of datenums.
+
+    As for Matplotlib locators, tick_values(vmin, vmax) takes limits in
+    axis units (floats); datetimes and datetime64s are also accepted.
+
+    No ticks are placed if there would be more than MAXTICKS.
+    '''
+
+    def __init__(self, unit, step=1, anchor=None, tz=None, epoch=None):
+        super().__init__(tz=tz)
+        if unit not in _CODES:
+            raise ValueError('Unknown tick unit "%s"' % unit)
+        self.unit = unit
+        self.step = step
+        self.anchor = anchor
+        self.zone = _zone(tz)
+        self.epoch = _epoch(epoch)
+
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        if self.epoch is None:
+            return self._values(vmin, vmax, self.axis)
+        vmin, vmax = self.epoch.todatenum([vmin, vmax])
+        return self.epoch.fromdatenum(self._values(vmin, vmax, self.axis))
+
+    def tick_values(self, vmin, vmax):
+        if self.epoch is None:
+            return self._values(*_datenums(vmin, vmax))
+        vmin, vmax = self.epoch.todatenum([vmin, vmax])
+        return self.epoch.fromdatenum(self._values(vmin, vmax))
+
+    def nonsingular(self, vmin, vmax):
+        if self.epoch is None:
+            return super().nonsingular(vmin, vmax)
+        return mtransforms.nonsingular(vmin, vmax, expander=0.05)
+
+    def _values(self, vmin, vmax, axis=None):
+        '''
+        Returns ticks as datenums for datenum limits vmin and vmax. axis is
+        used for the data start with anchor='start'.
+        '''
+
+        if abs(vmax - vmin)*86400/(self.step*_SECONDS[self.unit]) > MAXTICKS:
+            return np.array([])
+        lim = _todatetime64(np.array([vmin, vmax], dtype=float))
+        anchor = None
+        if self.anchor == 'start':
+            anchor = min(lim)
+            if axis is not None:
+                dmin, dmax = axis.get_data_interval()
+                if np.isfinite(dmin) and np.isfinite(dmax) and dmin <= dmax:
+                    if self.epoch is not None:
+                        dmin = self.epoch.todatenum(dmin)
+                    anchor = _todatetime64(np.array([dmin]))[0]
+        return _todatenum(ticks(lim[0], lim[1], self.unit, self.step, anchor=anchor, tz=self.zone))
+
+    def _get_unit(self):
+        return _SECONDS[self.unit]/86400
+
+    def _get_interval(self):
+        return self.step
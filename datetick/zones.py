@@ -0,0 +1,172 @@
+import datetime
+import threading
+
+import numpy as np
+import dateutil.tz
+
+# UTC offsets are looked up in a table of the transitions (changes of UTC
+# offset) of each year, computed once per zone and year, so converting an
+# array of times costs a few NumPy operations. For times spread over
+# MAXYEARS or more years, the offset of each time is computed instead and
+# kept (up to POINTS times per zone), as these are usually the same year or
+# month boundaries on each call.
+MAXYEARS = 10
+POINTS = 10000
+
+_UTC = datetime.timezone.utc
+
+# _Zone for each time zone, keyed by the tzinfo or, for tzinfo classes that
+# are not hashable (e.g., those of dateutil), by its id(); the tzinfo is
+# kept so that the id is not reused.
+_ZONES = {}
+_LOCK = threading.Lock()
+
+def _zone(tz):
+    '''
+    Returns the _Zone for tz, a tzinfo or a name such as 'America/New_York'.
+    Returns None if tz is None (UTC).
+    '''
+
+    if tz is None or isinstance(tz, _Zone):
+        return tz
+    if isinstance(tz, str):
+        name = tz
+        tz = dateutil.tz.gettz(name)
+        if tz is None:
+            raise ValueError('Unknown time zone "%s"' % name)
+    try:
+        hash(tz)
+        key = tz
+    except TypeError:
+        key = id(tz)
+    with _LOCK:
+        if key not in _ZONES:
+            _ZONES[key] = (tz, _Zone(tz))
+        return _ZONES[key][1]
+
+class _Zone:
+    '''UTC offsets of tzinfo tz for datetime64[us] times'''
+
+    def __init__(self, tz):
+        self.tz = tz
+        self._years = {}
+        self._points = {}
+        self._last = None
+
+    def tolocal(self, t):
+        '''Converts UTC times to local (wall clock) times'''
+
+        t = np.asarray(t, dtype='datetime64[us]')
+        return t + self.offsets(t)
+
+    def toutc(self, t):
+        '''
+        Converts local times to UTC. A local time that occurs twice is taken
+        to be the earlier one, usually; one that does not occur (in the gap
+        of a change to daylight saving time) is shifted by the gap.
+        '''
+
+        t = np.asarray(t, dtype='datetime64[us]')
+        return t - self.offsets(t - self.offsets(t))
+
+    def offsets(self, t):
+        '''Returns UTC offsets as timedelta64[us] at UTC times t'''
+
+        t = np.asarray(t, dtype='datetime64[us]')
+        if t.size == 0:
+            return np.zeros(t.shape, dtype='timedelta64[us]')
+        years = t.astype('datetime64[Y]').astype(np.int64) + 1970
+        lo, hi = int(years.min()), int(years.max())
+        if hi - lo >= MAXYEARS:
+            points = self._points
+            if len(points) > POINTS:
+                points = self._points = {}
+            offsets = []
+            for x in t.ravel().tolist():
+                offset = points.get(x)
+                if offset is None:
+                    offset = points[x] = self._offset(x)
+                offsets.append(offset)
+            return np.array(offsets, dtype='timedelta64[us]').reshape(t.shape)
+        starts, offsets = self._table(lo, hi)
+        i = np.searchsorted(starts, t, side='right') - 1
+        return offsets[np.maximum(i, 0)]
+
+    def segments(self, tmin, tmax):
+        '''
+        Returns a list of (start, end, offset) for the intervals of constant
+        UTC offset that cover UTC times tmin <= tmax, or None if they are
+        MAXYEARS or more years apart.
+        '''
+
+        years = np.array([tmin, tmax], dtype='datetime64[Y]').astype(np.int64) + 1970
+        if years[1] - years[0] >= MAXYEARS:
+            return None
+        starts, offsets = self._table(int(years[0]), int(years[1]))
+        i = max(int(np.searchsorted(starts, tmin, side='right')) - 1, 0)
+        j = int(np.searchsorted(starts, tmax, side='right'))
+        bounds = [tmin] + list(starts[i+1:j]) + [tmax]
+        return [(bounds[k], bounds[k+1], offsets[i+k]) for k in range(len(bounds) - 1)]
+
+    def _table(self, lo, hi):
+        '''Returns (starts, offsets) arrays of the transitions in years lo through hi'''
+
+        # datetime supports years 1 through 9999. Offsets before and after
+        # are taken to be those at the start and end of that range.
+        lo = min(max(lo, 2), 9998)
+        hi = min(max(hi, lo), 9998)
+        last = self._last
+        if last is not None and last[0] == (lo, hi):
+            return last[1]
+        years = [self._year(year) for year in range(lo, hi + 1)]
+        starts = np.concatenate([y[0] for y in years])
+        offsets = np.concatenate([y[1] for y in years])
+        # Years start with the offset of the previous year's end.
+        keep = np.concatenate(([True], offsets[1:] != offsets[:-1]))
+        table = (starts[keep], offsets[keep])
+        self._last = ((lo, hi), table)
+        return table
+
+    def _year(self, year):
+        '''Returns (starts, offsets) arrays of the start of year and its transitions'''
+
+        table = self._years.get(year)
+        if table is not None:
+            return table
+
+        # Offsets are compared a day apart and a change is located to the
+        # second.
+        start = datetime.datetime(year, 1, 1)
+        days = (start.replace(year=year + 1) - start).days
+        starts = [start]
+        offsets = [self._offset(start)]
+        prev = start
+        for day in range(1, days + 1):
+            t = start + datetime.timedelta(days=day)
+            offset = self._offset(t)
+            if offset != offsets[-1]:
+                a, b = 0, 86400
+                while b - a > 1:
+                    m = (a + b)//2
+                    if self._offset(prev + datetime.timedelta(seconds=m)) == offsets[-1]:
+                        a = m
+                    else:
+                        b = m
+                starts.append(prev + datetime.timedelta(seconds=b))
+                offsets.append(offset)
+            prev = t
+
+        table = (np.array(starts, dtype='datetime64[us]'),
+                 np.array(offsets, dtype='timedelta64[us]'))
+        return self._years.setdefault(year, table)
+
+    def _offset(self, t):
+        '''Returns the UTC offset at naive UTC datetime t as a timedelta'''
+
+        if not isinstance(t, datetime.datetime):
+            # Outside of the years that datetime supports.
+            t = datetime.datetime(2 if t < 0 else 9998, 1, 1)
+        elif not 1 < t.year < 9999:
+            t = t.replace(year=min(max(t.year, 2), 9998))
+        offset = t.replace(tzinfo=_UTC).astimezone(self.tz).utcoffset()
+        return offset if offset is not None else datetime.timedelta(0)
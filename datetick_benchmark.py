@@ -0,0 +1,277 @@
+# Benchmark datetick() for time ranges covering every span rule.
+#
+# For each time range and method, measures the wall time of applying the
+# ticks and of the first render, the number of canvas.draw() calls, the
+# peak memory allocated, and the number of ticks. A pan/zoom sequence,
+# with a render after each limit change, is also timed.
+#
+# Methods:
+#   datetick         datetick('x', axes=ax)
+#   datetick-nodraw  datetick('x', axes=ax, draw=False)
+#   datetick-lazy    datetick('x', axes=ax, lazy=True)
+#   datetick-scroll  datetick('x', axes=ax, scroll=True)
+#   matplotlib       AutoDateLocator + ConciseDateFormatter (baseline)
+#
+# Usage:
+#   python datetick_benchmark.py [-o results.json] [--steps N] [--repeat N] [--quick]
+#                                [--points N,N,...]
+#
+# A full run takes several minutes; --quick uses every fourth time range.
+#
+# The apply time is also measured for an axis holding 10^3 to 10^7 points
+# given as datetime64[ns] (--points), for the first call on a new axes
+# each time. It should not depend on the number of points because only
+# the data and view limits are used. The default method renders the
+# figure, so its time does grow with the number of points.
+#
+# Results are written as JSON so that runs for different versions can be
+# compared.
+
+import sys
+import json
+import time
+import platform
+import argparse
+import datetime
+import tracemalloc
+
+import numpy as np
+import dateutil.parser
+import matplotlib
+import matplotlib.dates as mpld
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from datetick import datetick
+from datetick.rules import RULES
+from datetick_test import RANGES
+
+METHODS = ['datetick', 'datetick-nodraw', 'datetick-lazy', 'datetick-scroll', 'matplotlib']
+
+def cases():
+    '''Returns list of (start, end) ISO 8601 strings to benchmark'''
+
+    ranges = list(RANGES)
+
+    # Just below and just above the upper edge of each span rule.
+    start = datetime.datetime(2001, 1, 1)
+    for span in RULES.spans:
+        if span == float('inf'):
+            continue
+        for f in (0.99, 1.01):
+            end = start + datetime.timedelta(seconds=f*span)
+            ranges.append((start.isoformat(), end.isoformat()))
+
+    return ranges
+
+def apply(method, ax):
+    if method == 'datetick':
+        datetick('x', axes=ax)
+    if method == 'datetick-nodraw':
+        datetick('x', axes=ax, draw=False)
+    if method == 'datetick-lazy':
+        datetick('x', axes=ax, lazy=True)
+    if method == 'datetick-scroll':
+        datetick('x', axes=ax, scroll=True)
+    if method == 'matplotlib':
+        locator = mpld.AutoDateLocator()
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(mpld.ConciseDateFormatter(locator))
+
+def figure(start, end):
+    '''Returns (fig, ax, draws) for a plot of two points from start to end'''
+
+    fig = Figure(figsize=(8, 2))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    x = [dateutil.parser.parse(start), dateutil.parser.parse(end)]
+    ax.plot(x, [0.0, 0.0], '*')
+    ax.set_xlim(min(x), max(x))
+
+    # Count canvas.draw() calls, including those made by datetick().
+    draws = [0]
+    canvas_draw = fig.canvas.draw
+    def draw(*args, **kwargs):
+        draws[0] += 1
+        return canvas_draw(*args, **kwargs)
+    fig.canvas.draw = draw
+
+    return fig, ax, draws
+
+def single(method, start, end):
+    fig, ax, draws = figure(start, end)
+
+    t = time.perf_counter()
+    apply(method, ax)
+    t_apply = time.perf_counter() - t
+    fig.canvas.draw()
+    t_total = time.perf_counter() - t
+
+    # Measure memory separately because tracemalloc slows execution.
+    fig_m, ax_m, _ = figure(start, end)
+    tracemalloc.start()
+    apply(method, ax_m)
+    fig_m.canvas.draw()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        'apply': t_apply,
+        'render': t_total - t_apply,
+        'total': t_total,
+        # Renders in addition to the one made by the user.
+        'draws': draws[0] - 1,
+        'peak_memory': peak,
+        'major_ticks': len(ax.xaxis.get_majorticklocs()),
+        'minor_ticks': len(ax.xaxis.get_minorticklocs())
+    }
+
+def panzoom(method, start, end, steps):
+    fig, ax, draws = figure(start, end)
+    apply(method, ax)
+    fig.canvas.draw()
+    draws[0] = 0
+
+    lim = ax.get_xlim()
+    width = lim[1] - lim[0]
+    ticks = 0
+    t = time.perf_counter()
+    for i in range(steps):
+        # Pan right for the first half of the steps, then zoom out.
+        if i < steps//2:
+            lim = (lim[0] + 0.05*width, lim[1] + 0.05*width)
+        else:
+            lim = (lim[0] - 0.05*width, lim[1] + 0.05*width)
+        ax.set_xlim(lim)
+        fig.canvas.draw()
+        ticks += len(ax.xaxis.get_majorticklocs()) + len(ax.xaxis.get_minorticklocs())
+    elapsed = time.perf_counter() - t
+
+    return {
+        'steps': steps,
+        'total': elapsed,
+        'per_step': elapsed/steps,
+        'draws': draws[0] - steps,
+        'ticks': ticks
+    }
+
+def points(method, n, repeat=3):
+    '''Returns the apply time for an axis with n points spanning 10 years'''
+
+    start = np.datetime64('2001-01-01', 'ns')
+    step = np.timedelta64(10*365*86400, 's').astype('timedelta64[ns]')//max(n - 1, 1)
+    t = start + step*np.arange(n)
+    y = np.zeros(n)
+
+    best = float('inf')
+    for _ in range(repeat):
+        # A new axes for each repetition; on the same axes, a second
+        # datetick() would find the ticks unchanged and do nothing.
+        fig = Figure(figsize=(8, 2))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        ax.plot(t, y)
+        fig.canvas.draw()
+
+        tic = time.perf_counter()
+        apply(method, ax)
+        best = min(best, time.perf_counter() - tic)
+
+    return {'method': method, 'points': n, 'apply': best}
+
+def run(steps=10, repeat=1, methods=METHODS, ranges=None):
+    if ranges is None:
+        ranges = cases()
+
+    results = []
+    for start, end in ranges:
+        for method in methods:
+            best = None
+            for _ in range(repeat):
+                result = {'start': start, 'end': end, 'method': method}
+                result['single'] = single(method, start, end)
+                result['panzoom'] = panzoom(method, start, end, steps)
+                if best is None or result['single']['total'] < best['single']['total']:
+                    best = result
+            results.append(best)
+    return results
+
+def metadata():
+    try:
+        import subprocess
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                capture_output=True, text=True).stdout.strip()
+    except Exception:
+        commit = ''
+    return {
+        'date': datetime.datetime.now().isoformat(),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'matplotlib': matplotlib.__version__,
+        'numpy': np.__version__
+    }
+
+def summary(results):
+    print(f"{'method':16} {'apply ms':>9} {'total ms':>9} {'draws':>6} {'peak kB':>8} {'pan ms/step':>12} {'pan draws':>10}")
+    for method in METHODS:
+        rows = [r for r in results if r['method'] == method]
+        if len(rows) == 0:
+            continue
+        s = [r['single'] for r in rows]
+        p = [r['panzoom'] for r in rows]
+        print(f"{method:16}"
+              f" {1000*np.median([x['apply'] for x in s]):9.2f}"
+              f" {1000*np.median([x['total'] for x in s]):9.2f}"
+              f" {np.sum([x['draws'] for x in s]):6d}"
+              f" {np.max([x['peak_memory'] for x in s])/1024:8.0f}"
+              f" {1000*np.median([x['per_step'] for x in p]):12.2f}"
+              f" {np.sum([x['draws'] for x in p]):10d}")
+    print('(times are medians over time ranges; draws are totals)')
+
+def summary_points(results):
+    sizes = sorted(set(r['points'] for r in results))
+    print(f"{'method':16}" + ''.join(f" {f'{n:.0e} pts ms':>13}" for n in sizes))
+    for method in METHODS:
+        rows = {r['points']: r for r in results if r['method'] == method}
+        if len(rows) == 0:
+            continue
+        print(f"{method:16}" + ''.join(f" {1000*rows[n]['apply']:13.2f}" for n in sizes))
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-o', '--output', default='datetick_benchmark.json')
+    parser.add_argument('--steps', type=int, default=10,
+                        help='number of pan/zoom steps')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='repeat each case and keep the fastest')
+    parser.add_argument('--methods', default=','.join(METHODS))
+    parser.add_argument('--quick', action='store_true',
+                        help='use every fourth time range')
+    parser.add_argument('--points', default='1000,100000,10000000',
+                        help='comma-separated numbers of points for the '
+                             'large series benchmark (empty to skip)')
+    args = parser.parse_args()
+
+    ranges = cases()
+    if args.quick:
+        ranges = ranges[::4]
+
+    methods = args.methods.split(',')
+    results = run(steps=args.steps, repeat=args.repeat,
+                  methods=methods, ranges=ranges)
+
+    results_points = []
+    for n in [int(float(n)) for n in args.points.split(',') if n]:
+        for method in methods:
+            results_points.append(points(method, n, repeat=max(args.repeat, 3)))
+
+    with open(args.output, 'w') as f:
+        json.dump({'metadata': metadata(), 'results': results,
+                   'points': results_points}, f, indent=1)
+
+    summary(results)
+    if results_points:
+        print()
+        summary_points(results_points)
+    print('Wrote', args.output, file=sys.stderr)
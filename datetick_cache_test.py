@@ -0,0 +1,66 @@
+# Check the caches: a limit change that gives the ticks and labels already
+# applied leaves the axis locators and formatter in place (the profile
+# record has unchanged True), one that does not replaces them, and
+# labels from the LRU label cache are those of the formatter itself.
+# pyplot is not used.
+#
+# Run with `python datetick_cache_test.py` or pytest.
+
+import datetime
+
+import numpy as np
+import matplotlib.dates as mpld
+
+from datetick import datetick
+from datetick.rules import RULES, _label, _labels, _formatter
+from datetick.zones import _zone
+from datetick_testing import axes
+
+X = [datetime.datetime(2001, 1, 1), datetime.datetime(2001, 1, 2)]
+
+def installed(ax):
+  return (ax.xaxis.get_major_locator(), ax.xaxis.get_minor_locator(), ax.xaxis.get_major_formatter())
+
+def test_unchanged():
+  for options in ({}, {'draw': False}):
+    ax = axes()
+    ax.plot(X, [0.0, 1.0])
+    ax.set_xlim(X[0] + datetime.timedelta(hours=1), X[1] - datetime.timedelta(hours=1))
+    records = []
+    datetick('x', axes=ax, profile=records.append, **options)
+    before = installed(ax)
+    labels = [t.get_text() for t in ax.get_xticklabels()]
+
+    # A pan by a minute keeps the ticks and their labels.
+    records.clear()
+    ax.set_xlim(X[0] + datetime.timedelta(minutes=61), X[1] - datetime.timedelta(minutes=59))
+    assert records[-1]['unchanged'], options
+    # With draw=True, the figure is rendered once before planning, but
+    # not again to read back the labels.
+    assert records[-1]['draws'] == (0 if options else 1), options
+    assert all(a is b for a, b in zip(installed(ax), before)), options
+    assert [t.get_text() for t in ax.get_xticklabels()] == labels, options
+
+    # A zoom changes the ticks.
+    records.clear()
+    ax.set_xlim(X[0], X[0] + datetime.timedelta(hours=5))
+    assert not records[-1]['unchanged'], options
+    assert all(a is not b for a, b in zip(installed(ax), before)), options
+
+def test_labels():
+  rng = np.random.default_rng(0)
+  x = mpld.date2num(np.datetime64('2001-10-27T22')) + rng.uniform(0, 2, 200)
+  for zone in (None, _zone('America/New_York'), _zone('Asia/Kolkata')):
+    for fmt1 in sorted(set(rule.fmt1 for rule in RULES.rules)):
+      formatter = _formatter(fmt1, zone)
+      expected = [formatter(v) for v in x]
+      _label.cache_clear()
+      assert _labels(x, fmt1, zone) == expected, (zone, fmt1)
+      # Labels from the cache.
+      assert _labels(x, fmt1, zone) == expected, (zone, fmt1)
+      assert _label.cache_info().hits >= len(x), (zone, fmt1)
+
+if __name__ == '__main__':
+  test_unchanged()
+  test_labels()
+  print('cache tests passed')
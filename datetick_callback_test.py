@@ -0,0 +1,64 @@
+# Check the limit-change callback: calling datetick() repeatedly on the
+# same axes leaves a single xlim_changed callback, so a limit change
+# re-ticks the axes once, and with coalesce=s a burst of limit changes
+# re-ticks once, when the timer fires. pyplot is not used.
+#
+# Run with `python datetick_callback_test.py` or pytest.
+
+import datetime
+
+
+from datetick import datetick
+from datetick_testing import axes, ticklabels
+
+X = [datetime.datetime(2001, 1, 1), datetime.datetime(2001, 1, 3)]
+
+def plotted():
+  ax = axes()
+  ax.plot(X, [0.0, 1.0])
+  return ax
+
+def callbacks(ax):
+  return len(ax.callbacks.callbacks.get('xlim_changed', {}))
+
+def test_replace():
+  for options in ({}, {'draw': False}):
+    ax = plotted()
+    records = []
+    for _ in range(5):
+      datetick('x', axes=ax, profile=records.append, **options)
+    assert callbacks(ax) == 1, options
+    for hours in (5, 10, 20):
+      records.clear()
+      ax.set_xlim(X[0], X[0] + datetime.timedelta(hours=hours))
+      assert len(records) == 1, (options, hours)
+    # Same labels as datetick() applied after the last limit change.
+    expected = plotted()
+    expected.set_xlim(ax.get_xlim())
+    datetick('x', axes=expected, **options)
+    assert ticklabels(ax) == ticklabels(expected), options
+
+def test_coalesce():
+  ax = plotted()
+  records = []
+  for _ in range(5):
+    datetick('x', axes=ax, draw=False, coalesce=0.1, profile=records.append)
+  assert callbacks(ax) == 1
+  records.clear()
+  for hours in (5, 10, 20):
+    ax.set_xlim(X[0], X[0] + datetime.timedelta(hours=hours))
+  # Timers do not run with Agg; fire the single-shot timer by hand.
+  assert len(records) == 0
+  ax.__dict__['_datetick']['xtimer'].timer._on_timer()
+  assert len(records) == 1
+  assert callbacks(ax) == 1
+
+  # Without coalesce, the timer is removed.
+  datetick('x', axes=ax, draw=False)
+  assert callbacks(ax) == 1
+  assert 'xtimer' not in ax.__dict__['_datetick']
+
+if __name__ == '__main__':
+  test_replace()
+  test_coalesce()
+  print('callback tests passed')
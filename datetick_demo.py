@@ -1,6 +1,6 @@
 import datetime as dt
 import matplotlib.pyplot as plt
-from datetick import datetick
+from datetick import datetick, datetick_figure
 dt1 = dt.datetime(2011, 1, 2)
 dt2 = dt1 + dt.timedelta(days=1, hours=1, minutes=1)
 x = [dt1, dt2]
@@ -22,5 +22,10 @@ if method == 4:
   axes[1].plot(x, y)
   datetick('x', axes=axes[0])
   datetick('x', axes=axes[1])
+if method == 5:
+  fig, axes = plt.subplots(2, figsize=(8,6))
+  axes[0].plot(x, y)
+  axes[1].plot(x, y)
+  datetick_figure(fig)
 
 plt.show()
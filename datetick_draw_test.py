@@ -0,0 +1,49 @@
+# Check that datetick(..., draw=False) gives the same major and minor
+# ticks and tick label text as datetick() with the default draw=True,
+# before and after a limit change, for each time range in
+# datetick_test.py, without drawing the canvas. pyplot is not used.
+#
+# Run with `python datetick_draw_test.py` or pytest.
+
+import dateutil.parser
+
+from datetick import datetick
+from datetick_testing import axes, count_draws
+from datetick_test import RANGES
+
+def plotted(start, end):
+  ax = axes()
+  x = [dateutil.parser.parse(start), dateutil.parser.parse(end)]
+  ax.plot(x, [0.0, 0.0])
+  ax.set_xlim(x)
+  return ax
+
+def ticks(ax):
+  # get_xticklabels() does not draw the canvas.
+  return (list(ax.get_xticks()), list(ax.xaxis.get_minorticklocs()),
+          [t.get_text() for t in ax.get_xticklabels()])
+
+def check(start, end):
+  drawn = plotted(start, end)
+  datetick('x', axes=drawn)
+  ax = plotted(start, end)
+  draws = count_draws(ax.figure)
+  datetick('x', axes=ax, draw=False)
+  assert ticks(ax) == ticks(drawn), (start, end)
+  assert any(ticks(ax)[2]), (start, end)
+
+  # Zoom out by a half on each side; the callback re-ticks without drawing.
+  lim = ax.get_xlim()
+  width = lim[1] - lim[0]
+  for a in (drawn, ax):
+    a.set_xlim(lim[0] - 0.5*width, lim[1] + 0.5*width)
+  assert ticks(ax) == ticks(drawn), (start, end)
+  assert draws[0] == 0, (start, end, draws[0])
+
+def test_ranges():
+  for start, end in RANGES:
+    check(start, end)
+
+if __name__ == '__main__':
+  test_ranges()
+  print('draw tests passed')
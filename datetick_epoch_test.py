@@ -0,0 +1,57 @@
+# Check axes whose values are seconds since an epoch
+# (datetick(..., epoch=...)): labels match those of the same time ranges
+# plotted as datetimes, for draw=True, draw=False, lazy=True, and
+# scroll=True, and GPS seconds are converted with leap seconds.
+#
+# Run with `python datetick_epoch_test.py` or pytest.
+
+import datetime
+
+import numpy as np
+import matplotlib.dates as mpld
+
+from datetick import datetick, tickplan
+from datetick.rules import RULES
+from datetick.epochs import _Epoch
+from datetick_testing import axes, ticklabels
+
+def labels(x, **options):
+  ax = axes()
+  ax.plot(x, [0.0, 0.0], '*')
+  ax.set_xlim(x[0], x[1])
+  datetick('x', axes=ax, **options)
+  return ticklabels(ax)
+
+def test_gps():
+  gps = _Epoch('gps')
+  # 2017-01-01T00:00:00 UTC, after 18 leap seconds since 1980-01-06.
+  assert mpld.num2date(gps.todatenum(1167264018)) == mpld.num2date(mpld.date2num(datetime.datetime(2017, 1, 1)))
+  assert gps.fromdatenum(gps.todatenum(1167264018.25)) == 1167264018.25
+  plan = tickplan(1167264018 - 3600, 1167264018 + 3600, epoch='gps')
+  assert list(plan.major[3:5]) == [1167264018, 1167264018 + 900]
+  assert plan.labels[3] == '00:00\n2017-01-01'
+
+def test_tickplan():
+  start = datetime.datetime(2001, 12, 31, 23, 59, 59, 500000)
+  t0 = (start - datetime.datetime(2000, 1, 1)).total_seconds()
+  for span in RULES.spans[:-1]:
+    end = start + datetime.timedelta(seconds=0.99*span)
+    expected = tickplan(np.datetime64(start), np.datetime64(end))
+    plan = tickplan(t0, t0 + 0.99*span, epoch='2000-01-01')
+    assert list(plan.labels) == list(expected.labels), span
+
+def test_datetick():
+  start = datetime.datetime(2001, 1, 1)
+  for span in RULES.spans[:-1]:
+    end = start + datetime.timedelta(seconds=0.99*span)
+    x = np.array([start, end], dtype='datetime64[us]')
+    seconds = (x - np.datetime64('1970-01-01')).astype(np.int64)/1e6
+    expected = labels(x)
+    for options in ({}, {'draw': False}, {'lazy': True}, {'scroll': True}):
+      assert labels(seconds, epoch='unix', **options) == expected, (span, options)
+
+if __name__ == '__main__':
+  test_gps()
+  test_tickplan()
+  test_datetick()
+  print('epoch tests passed')
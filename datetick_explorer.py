@@ -3,8 +3,27 @@
 Created on Wed Oct  3 17:09:42 2018
 
 @author: Brendan
+
+Compare Matplotlib's default date ticks (top) with datetick() (bottom) for
+time ranges set with sliders.
+
+Usage:
+  python datetick_explorer.py [--record ranges.jsonl]
+  python datetick_explorer.py --replay ranges.jsonl [-o results.json] [--options JSON]
+  python datetick_explorer.py --generate N [--seed S] [-o results.json] [--options JSON]
+
+--record appends each time range set with the sliders to a file, one
+{"start": ..., "end": ...} per line. --replay applies the time ranges in
+such a file, and --generate those of N simulated slider moves, to the two
+panels without a display (Agg) and reports per-frame latency percentiles
+and canvas draw counts for each panel. --options are the datetick()
+keyword options for the datetick panel, e.g., '{"draw": false}'.
 """
 
+import sys
+import json
+import time
+import argparse
 import dateutil.parser
 import numpy as np
 import matplotlib.pyplot as plt
@@ -87,9 +106,144 @@ def plotit(xlow, xhigh):
     ax2.set_title('datetick', loc='left', y=1, pad=-14)
     ax2.set_xlim(xlow, xhigh)
 
+    if record is not None:
+        record.write(json.dumps({'start': xlow.isoformat(), 'end': xhigh.isoformat()}) + '\n')
+        record.flush()
+
+# Slider (name, min, max) and initial values of the start and end sliders.
+# The plot initially shows x (see below).
+SLIDERS = [('Year', 1900, 2100), ('Month', 1, 12), ('Day', 1, 31),
+           ('Hour', 0, 23), ('Minute', 0, 59), ('Second', 0, 59)]
+INITIAL = [(1999, 1, 1, 1, 0, 0), (1999, 1, 1, 2, 0, 0)]
+
+def generate(n, seed=0):
+    '''
+    Returns list of n (xlow, xhigh) datetimes set by simulated slider moves.
+
+    Each move changes one of the twelve sliders, mostly by a step or two as
+    when a slider is dragged and sometimes to any value as when it is
+    clicked. Moves that give an invalid date or xlow >= xhigh are not
+    counted, as plotit() ignores them.
+    '''
+
+    rng = np.random.default_rng(seed)
+    values = [list(v) for v in INITIAL]
+    ranges = []
+    while len(ranges) < n:
+        side = rng.integers(2)
+        i = rng.integers(len(SLIDERS))
+        _, lo, hi = SLIDERS[i]
+        if rng.random() < 0.8:
+            v = values[side][i] + rng.choice([-2, -1, 1, 2])
+        else:
+            v = rng.integers(lo, hi + 1)
+        values[side][i] = int(min(max(v, lo), hi))
+        try:
+            xlow = datetime.datetime(*values[0])
+            xhigh = datetime.datetime(*values[1])
+        except ValueError:
+            continue
+        if xlow < xhigh:
+            ranges.append((xlow, xhigh))
+    return ranges
+
+def load(path):
+    '''Returns list of (xlow, xhigh) datetimes in a file written with --record'''
+
+    ranges = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                r = json.loads(line)
+                xlow = dateutil.parser.parse(r['start']).replace(tzinfo=None)
+                xhigh = dateutil.parser.parse(r['end']).replace(tzinfo=None)
+                ranges.append((xlow, xhigh))
+    return ranges
+
+def replay(ranges, x, options=None):
+    '''
+    Applies time ranges to a Matplotlib and a datetick panel, each in its
+    own Agg figure with points at times x, as plotit() does, and returns
+    a dict of per-frame measurements for each panel:
+
+      limits: seconds for set_xlim(), including the xlim_changed callback
+              that re-applies datetick()
+      frame:  seconds until the frame is rendered (limits plus a canvas
+              draw). Matplotlib computes its ticks while rendering, so
+              compare frame times.
+      draws:  number of canvas draws, including the one for the frame
+    '''
+
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    if options is None:
+        options = {}
+
+    panels = {}
+    for name in ('matplotlib', 'datetick'):
+        fig = Figure(figsize=(16, 3))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+        line, = ax.plot(x, [0.0, 0.0], '*')
+        ax.grid()
+        if name == 'datetick':
+            datetick('x', axes=ax, **options)
+        fig.canvas.draw()
+
+        # Count canvas.draw() calls, including those made by datetick().
+        draws = [0]
+        canvas_draw = fig.canvas.draw
+        def draw(*args, canvas_draw=canvas_draw, draws=draws, **kwargs):
+            draws[0] += 1
+            return canvas_draw(*args, **kwargs)
+        fig.canvas.draw = draw
+        panels[name] = (fig, ax, line, draws, {'limits': [], 'frame': [], 'draws': []})
+
+    for xlow, xhigh in ranges:
+        x = np.array([xlow, xhigh], dtype=object)
+        for fig, ax, line, draws, result in panels.values():
+            n = draws[0]
+            tic = time.perf_counter()
+            line.set_xdata(x)
+            ax.set_xlim(xlow, xhigh)
+            toc = time.perf_counter()
+            fig.canvas.draw()
+            result['limits'].append(toc - tic)
+            result['frame'].append(time.perf_counter() - tic)
+            result['draws'].append(draws[0] - n)
+
+    return {name: panel[4] for name, panel in panels.items()}
+
+def report(results):
+    '''Prints latency percentiles in ms and draw counts for each panel'''
+
+    print(f"{'panel':11} {'frames':>6} {'limits p50':>10} {'p90':>7} {'p99':>7}"
+          f" {'frame p50':>10} {'p90':>7} {'p99':>7} {'max':>7} {'draws':>6} {'/frame':>6}")
+    for name, r in results.items():
+        limits = 1000*np.percentile(r['limits'], [50, 90, 99])
+        frame = 1000*np.percentile(r['frame'], [50, 90, 99, 100])
+        print(f"{name:11} {len(r['frame']):6d} {limits[0]:10.2f} {limits[1]:7.2f} {limits[2]:7.2f}"
+              f" {frame[0]:10.2f} {frame[1]:7.2f} {frame[2]:7.2f} {frame[3]:7.2f}"
+              f" {sum(r['draws']):6d} {np.mean(r['draws']):6.2f}")
+
+def summarize(results):
+    '''Returns results with percentiles (in seconds) instead of per-frame lists'''
+
+    summary = {}
+    for name, r in results.items():
+        summary[name] = {
+            'frames': len(r['frame']),
+            'limits': dict(zip(['p50', 'p90', 'p99', 'max'], np.percentile(r['limits'], [50, 90, 99, 100]).tolist())),
+            'frame': dict(zip(['p50', 'p90', 'p99', 'max'], np.percentile(r['frame'], [50, 90, 99, 100]).tolist())),
+            'draws': sum(r['draws'])
+        }
+    return summary
+
 # Globals
 ax1 = None
 t1 = None
+record = None
 
 
 y = [0.0, 0.0]
@@ -100,6 +254,37 @@ dt1 = dateutil.parser.parse(ds1)
 dt2 = dateutil.parser.parse(ds2)
 x = np.array([dt1,dt2], dtype=object)
 
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--record', default=None,
+                        help='append time ranges set with the sliders to this file')
+    parser.add_argument('--replay', default=None,
+                        help='replay time ranges in this file without a display')
+    parser.add_argument('--generate', type=int, default=0,
+                        help='replay this many simulated slider moves without a display')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--options', default='{}',
+                        help='datetick() options as JSON for the datetick panel')
+    parser.add_argument('-o', '--output', default=None,
+                        help='write results as JSON to this file')
+    args = parser.parse_args()
+
+    if args.replay or args.generate:
+        ranges = load(args.replay) if args.replay else generate(args.generate, seed=args.seed)
+        options = json.loads(args.options)
+        results = replay(ranges, x, options=options)
+        report(results)
+        if args.output:
+            from datetick_benchmark import metadata
+            with open(args.output, 'w') as f:
+                json.dump({'metadata': metadata(), 'options': options,
+                           'results': summarize(results)}, f, indent=1)
+            print('Wrote', args.output, file=sys.stderr)
+        sys.exit(0)
+
+    if args.record:
+        record = open(args.record, 'a')
+
 plt.subplots_adjust(bottom=0.4)
 fig, (ax1, ax2, ax3) = plt.subplots(3, figsize=(16,9))
 
@@ -135,32 +320,18 @@ axEnd = plt.axes([0.63, 0.27, 0.15, 0.03])
 
 axreset = plt.axes([0.47, 0.29, 0.05, 0.05])
 
-# make sliders and add update function
-sYearI = Slider(axYearI, 'Year', 1900, 2100, valinit=1999, valfmt='%0.0f')
-sYearI.on_changed(update)
-sMonthI = Slider(axMonthI, 'Month', 1, 12, valinit=1, valfmt='%0.0f')
-sMonthI.on_changed(update)
-sDayI = Slider(axDayI, 'Day', 1, 31, valinit=1, valfmt='%0.0f')
-sDayI.on_changed(update)
-sHourI = Slider(axHourI, 'Hour', 0, 23, valinit=1, valfmt='%0.0f')
-sHourI.on_changed(update)
-sMinuteI = Slider(axMinuteI, 'Minute', 0, 59, valinit=0, valfmt='%0.0f')
-sMinuteI.on_changed(update)
-sSecondI = Slider(axSecondI, 'Second', 0, 59, valinit=0, valfmt='%0.0f')
-sSecondI.on_changed(update)
-
-sYearF = Slider(axYearF, 'Year', 1900, 2100, valinit=1999, valfmt='%0.0f')
-sYearF.on_changed(update)
-sMonthF = Slider(axMonthF, 'Month', 1, 12, valinit=1, valfmt='%0.0f')
-sMonthF.on_changed(update)
-sDayF = Slider(axDayF, 'Day', 1, 31, valinit=1, valfmt='%0.0f')
-sDayF.on_changed(update)
-sHourF = Slider(axHourF, 'Hour', 0, 23, valinit=2, valfmt='%0.0f')
-sHourF.on_changed(update)
-sMinuteF = Slider(axMinuteF, 'Minute', 0, 59, valinit=0, valfmt='%0.0f')
-sMinuteF.on_changed(update)
-sSecondF = Slider(axSecondF, 'Second', 0, 59, valinit=0, valfmt='%0.0f')
-sSecondF.on_changed(update)
+# make sliders (SLIDERS and INITIAL) and add update function
+def sliders(axes, initial):
+    s = [Slider(ax, name, lo, hi, valinit=v, valfmt='%0.0f')
+         for ax, (name, lo, hi), v in zip(axes, SLIDERS, initial)]
+    for slider in s:
+        slider.on_changed(update)
+    return s
+
+sYearI, sMonthI, sDayI, sHourI, sMinuteI, sSecondI = sliders(
+    [axYearI, axMonthI, axDayI, axHourI, axMinuteI, axSecondI], INITIAL[0])
+sYearF, sMonthF, sDayF, sHourF, sMinuteF, sSecondF = sliders(
+    [axYearF, axMonthF, axDayF, axHourF, axMinuteF, axSecondF], INITIAL[1])
 
 bStart = Button(axStart, 'Start',color='1.0',hovercolor='1.0')
 bEnd = Button(axEnd, 'End',color='1.0',hovercolor='1.0')
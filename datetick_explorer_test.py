@@ -0,0 +1,50 @@
+# Check that datetick_explorer.py replays simulated slider moves without a
+# display and writes a summary for each panel, with one canvas draw per
+# frame for the Matplotlib panel and for the datetick panel with
+# draw=False. The explorer is run in a subprocess because importing it
+# opens its window.
+#
+# Run with `python datetick_explorer_test.py` or pytest.
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+DIR = os.path.dirname(os.path.abspath(__file__))
+
+FRAMES = 20
+
+def run(*args):
+  path = os.path.join(tempfile.mkdtemp(), 'results.json')
+  env = {**os.environ, 'MPLBACKEND': 'Agg'}
+  subprocess.run([sys.executable, 'datetick_explorer.py', '--generate', str(FRAMES), '--seed', '0',
+                  '-o', path, *args], cwd=DIR, env=env, check=True, capture_output=True)
+  with open(path) as f:
+    return json.load(f)
+
+def test_replay():
+  output = run('--options', '{"draw": false}')
+  assert set(output) == {'metadata', 'options', 'results'}
+  assert output['options'] == {'draw': False}
+  results = output['results']
+  assert set(results) == {'matplotlib', 'datetick'}
+  for name, summary in results.items():
+    assert set(summary) == {'frames', 'limits', 'frame', 'draws'}, name
+    assert summary['frames'] == FRAMES, name
+    for key in ('limits', 'frame'):
+      p = summary[key]
+      assert set(p) == {'p50', 'p90', 'p99', 'max'}, (name, key)
+      assert 0 <= p['p50'] <= p['p90'] <= p['p99'] <= p['max'], (name, key)
+    # One draw per frame, the render of the frame.
+    assert summary['draws'] == FRAMES, name
+
+  # With draw=True, datetick() also draws the canvas when the limits change.
+  results = run()['results']
+  assert results['matplotlib']['draws'] == FRAMES
+  assert results['datetick']['draws'] > FRAMES
+
+if __name__ == '__main__':
+  test_replay()
+  print('explorer tests passed')
@@ -0,0 +1,40 @@
+# Check that `import datetick` stays cheap: no pyplot, no GUI toolkit, and
+# an import time within budget. Run with `python datetick_import_test.py`
+# or pytest.
+
+import sys
+import subprocess
+
+# Seconds allowed for `import datetick` after its dependencies
+# (numpy, matplotlib.dates, matplotlib.ticker) have been imported.
+BUDGET = 0.25
+
+CODE = '''
+import sys, time
+import numpy, matplotlib.dates, matplotlib.ticker
+t = time.perf_counter()
+import datetick
+print(time.perf_counter() - t)
+print(' '.join(sys.modules))
+'''
+
+def run():
+  out = subprocess.run([sys.executable, '-c', CODE], check=True,
+                       capture_output=True, text=True).stdout.split('\n')
+  return float(out[0]), out[1].split()
+
+def test_no_pyplot():
+  _, modules = run()
+  assert 'matplotlib.pyplot' not in modules
+  for gui in ['tkinter', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'gi', 'wx']:
+    assert gui not in modules, gui
+
+def test_import_time():
+  # Best of 3 to reduce sensitivity to machine load.
+  elapsed = min(run()[0] for _ in range(3))
+  print(f'import datetick: {1000*elapsed:.1f} ms (budget {1000*BUDGET:.0f} ms)')
+  assert elapsed < BUDGET
+
+if __name__ == '__main__':
+  test_no_pyplot()
+  test_import_time()
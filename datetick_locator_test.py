@@ -0,0 +1,54 @@
+# Check that the locators take tick_values() limits in axis units, as
+# Matplotlib passes them: float datenums (or seconds since the epoch)
+# give the ticks of ticks() and tickplan(), and datetimes and datetime64s
+# give the same ticks as the corresponding datenums.
+#
+# Run with `python datetick_locator_test.py` or pytest.
+
+import datetime
+
+import numpy as np
+import matplotlib.dates as mpld
+
+from datetick import DatetickLocator, tickplan
+from datetick.rules import RULES
+from datetick.ticks import CalendarLocator, ticks
+
+START = datetime.datetime(2001, 1, 1, 0, 0, 0, 250000)
+
+def limits(span):
+  end = START + datetime.timedelta(seconds=0.99*span)
+  return START, end, float(mpld.date2num(START)), float(mpld.date2num(end))
+
+def inside(values, vmin, vmax):
+  values = np.asarray(values)
+  return values[(values >= vmin) & (values <= vmax)]
+
+def test_calendar():
+  for rule in RULES.rules[:-1]:
+    unit, step = rule.major[:2]
+    start, end, vmin, vmax = limits(rule.span)
+    locator = CalendarLocator(unit, step)
+    expected = mpld.date2num(ticks(np.datetime64(start), np.datetime64(end), unit, step))
+    assert np.array_equal(locator.tick_values(vmin, vmax), expected), rule.span
+    assert np.array_equal(locator.tick_values(start, end), expected), rule.span
+    assert np.array_equal(locator.tick_values(np.datetime64(start), np.datetime64(end)), expected), rule.span
+
+    # Seconds since 1970-01-01.
+    locator = CalendarLocator(unit, step, epoch='unix')
+    seconds = [(t - datetime.datetime(1970, 1, 1)).total_seconds() for t in (start, end)]
+    unix = (expected - mpld.date2num(datetime.datetime(1970, 1, 1)))*86400
+    assert np.allclose(locator.tick_values(*seconds), unix, rtol=0, atol=1e-3), rule.span
+
+def test_datetick():
+  for span in RULES.spans[:-1]:
+    start, end, vmin, vmax = limits(span)
+    expected = tickplan(vmin, vmax).major
+    for locator in (DatetickLocator(), DatetickLocator(tz='UTC')):
+      assert np.array_equal(inside(locator.tick_values(vmin, vmax), vmin, vmax), expected), span
+      assert np.array_equal(inside(locator.tick_values(start, end), vmin, vmax), expected), span
+
+if __name__ == '__main__':
+  test_calendar()
+  test_datetick()
+  print('locator tests passed')
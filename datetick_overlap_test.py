@@ -0,0 +1,96 @@
+# Check that tick labels do not overlap: for the same time range, a
+# narrow axis uses a rule for a larger span than a wide axis, and on
+# rendered figures of several widths, neither the fmt1 rows nor the fmt2
+# context rows of adjacent major tick labels overlap. pyplot is not used.
+#
+# Run with `python datetick_overlap_test.py` or pytest.
+
+import dateutil.parser
+import numpy as np
+import matplotlib.dates as mpld
+
+from datetick import datetick
+from datetick.rules import RULES, _rule
+from datetick.metrics import _space, _mingap
+from datetick_testing import axes
+from datetick_test import RANGES
+
+WIDTHS = [1.5, 3, 8]
+
+def plotted(start, end, width):
+  ax = axes((width, 2))
+  x = [dateutil.parser.parse(start), dateutil.parser.parse(end)]
+  ax.plot(x, [0.0, 0.0])
+  ax.set_xlim(x)
+  return ax
+
+def rows(ax):
+  '''
+  Returns {row: [(x0, x1), ...]} with the extent in pixels of each row of
+  the major tick labels within the axis limits
+  '''
+  renderer = ax.figure.canvas.get_renderer()
+  lim = ax.get_xlim()
+  extents = {}
+  for label, x in zip(ax.get_xticklabels(), ax.get_xticks()):
+    if not (lim[0] <= x <= lim[1]) or label.get_text() == '':
+      continue
+    # Rows are centered on the label.
+    bbox = label.get_window_extent(renderer)
+    center = 0.5*(bbox.x0 + bbox.x1)
+    for i, line in enumerate(label.get_text().split('\n')):
+      w = renderer.get_text_width_height_descent(line, label.get_fontproperties(), ismath=False)[0]
+      extents.setdefault(i, []).append((center - 0.5*w, center + 0.5*w))
+  return extents
+
+def test_narrow():
+  coarser = 0
+  for start, end in RANGES:
+    index = []
+    for width in (1.5, 8):
+      ax = plotted(start, end, width)
+      records = []
+      datetick('x', axes=ax, profile=records.append)
+      length, prop = _space(ax.xaxis)
+      rule = _rule(*ax.get_xlim(), length=length, prop=prop)
+      assert records[-1]['rule']['major'] == rule.major, (start, end, width)
+      index.append(RULES.rules.index(rule))
+    assert index[0] >= index[1], (start, end)
+    coarser += index[0] > index[1]
+  # Most ranges have overlapping labels on the narrow axis with the rule
+  # used for the wide axis.
+  assert coarser > len(RANGES)//2, coarser
+
+def test_overlap():
+  for width in WIDTHS:
+    for start, end in RANGES:
+      ax = plotted(start, end, width)
+      datetick('x', axes=ax)
+      for row, extents in rows(ax).items():
+        extents.sort()
+        for a, b in zip(extents, extents[1:]):
+          assert a[1] <= b[0], (width, start, end, row, a, b)
+
+def test_mingap():
+  def days(spec, start, end):
+    tmin, tmax = mpld.date2num(np.datetime64(start)), mpld.date2num(np.datetime64(end))
+    return _mingap(spec, tmin, tmax)/86400
+  # Days 1, 8, ..., 29 of January, then February 1.
+  assert days(('day', 7), '2001-01-01', '2001-02-10') == 3
+  assert days(('day', 7), '2001-01-01', '2001-01-31') == 7
+  # The 29th is before the range.
+  assert days(('day', 7), '2001-01-30', '2001-02-20') == 7
+  # 2001-02-22 to 2001-03-01; 2004-02-29 to 2004-03-01.
+  assert days(('day', 7), '2001-02-01', '2001-03-10') == 7
+  assert days(('day', 7), '2004-02-01', '2004-03-10') == 1
+  assert days(('day', 1), '2001-01-01', '2001-03-10') == 1
+  # Seconds 0, 7, ..., 56, then 0.
+  assert days(('second', 7), '2001-01-01', '2001-01-02')*86400 == 4
+  assert days(('hour', 3), '2001-01-01', '2001-01-02')*24 == 3
+  assert days(('year', 2, 'start'), '2001-01-01', '2011-01-02') == 2*365.25
+
+if __name__ == '__main__':
+  test_narrow()
+  test_overlap()
+  test_mingap()
+  print('overlap tests passed')
@@ -0,0 +1,87 @@
+# Check that figures configured with datetick() can be pickled: after a
+# round trip, the copy re-ticks on a limit change as the original does,
+# and figures built in this process and rendered in a ProcessPoolExecutor
+# have the labels of figures rendered here. pyplot is not used.
+#
+# Run with `python datetick_pickle_test.py` or pytest.
+
+import pickle
+import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from datetick import datetick
+from datetick.scroll import Scroller
+from datetick_testing import axes, ticklabels
+
+START = datetime.datetime(2001, 10, 27, 22)
+SPANS = [0.5, 90, 3*3600, 5*86400, 400*86400]
+OPTIONS = [{}, {'draw': False}, {'lazy': True}, {'scroll': True},
+           {'tz': 'America/New_York'}, {'epoch': 'gps'}, {'coalesce': 0.1}]
+
+def figure(span, **options):
+  ax = axes()
+  fig = ax.figure
+  x = [START, START + datetime.timedelta(seconds=span)]
+  if 'epoch' in options:
+    # GPS seconds (leap seconds are ignored; only the labels are compared).
+    x = [(t - datetime.datetime(1980, 1, 6)).total_seconds() for t in x]
+  ax.plot(x, [0.0, 1.0])
+  datetick('x', axes=ax, **options)
+  return fig
+
+def labels(fig):
+  # An unpickled figure has no Agg canvas.
+  FigureCanvasAgg(fig)
+  return ticklabels(fig.axes[0])
+
+def zoom(fig):
+  '''Sets the x limits to the middle half of the view'''
+  ax = fig.axes[0]
+  lim = ax.get_xlim()
+  width = lim[1] - lim[0]
+  ax.set_xlim(lim[0] + width/4, lim[1] - width/4)
+
+def render(data):
+  '''Unpickles and renders a figure; returns its labels and image shape'''
+  fig = pickle.loads(data)
+  text = labels(fig)
+  return text, np.asarray(fig.canvas.buffer_rgba()).shape
+
+def test_roundtrip():
+  for options in OPTIONS:
+    for span in SPANS:
+      fig = figure(span, **options)
+      copy = pickle.loads(pickle.dumps(fig))
+      assert labels(copy) == labels(fig), (options, span)
+      if 'coalesce' in options:
+        # Timers do not run with Agg.
+        continue
+      zoom(fig)
+      zoom(copy)
+      assert labels(copy) == labels(fig), (options, span)
+
+def test_blit():
+  fig = figure(3*3600)
+  scroller = Scroller(fig.axes[0], blit=True)
+  fig.canvas.draw()
+  scroller.blit()
+  copy = pickle.loads(pickle.dumps(fig))
+  FigureCanvasAgg(copy)
+  copy.axes[0].xaxis.get_major_locator().scroller.blit()
+
+def test_process():
+  figures = [figure(span, **options) for options in OPTIONS for span in SPANS]
+  with ProcessPoolExecutor(2) as pool:
+    results = list(pool.map(render, [pickle.dumps(fig) for fig in figures]))
+  for fig, (text, shape) in zip(figures, results):
+    assert text == labels(fig)
+    assert shape == (200, 800, 4)
+
+if __name__ == '__main__':
+  test_roundtrip()
+  test_blit()
+  test_process()
+  print('pickle tests passed')
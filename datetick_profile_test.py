@@ -0,0 +1,112 @@
+# Check the profile=... hook of datetick(): each call gives one record
+# with its phases in order, the number of canvas draws made, and the
+# unchanged flag, and Collector writes the records as a Chrome trace
+# (chrome://tracing) or as JSON. pyplot is not used.
+#
+# Run with `python datetick_profile_test.py` or pytest.
+
+import os
+import json
+import datetime
+import tempfile
+
+from datetick import datetick, tickplan
+from datetick.metrics import _space
+from datetick.profile import Collector
+from datetick_testing import axes, count_draws
+
+X = [datetime.datetime(2001, 1, 1), datetime.datetime(2001, 1, 2)]
+
+# Phases of a first call; with draw=True, the figure is also rendered
+# before planning and before the labels are read back.
+PHASES = {
+  True: ['setup', 'draw', 'validate', 'rule', 'plan', 'locate', 'draw',
+         'labels', 'decorate', 'apply', 'callbacks'],
+  False: ['setup', 'validate', 'rule', 'plan', 'locate', 'labels',
+          'decorate', 'apply', 'callbacks']
+}
+
+def plotted():
+  ax = axes()
+  ax.plot(X, [0.0, 1.0])
+  ax.set_xlim(X[0] + datetime.timedelta(hours=1), X[1] - datetime.timedelta(hours=1))
+  return ax
+
+def names(record):
+  return [phase['name'] for phase in record['phases']]
+
+def check(record):
+  assert record['dir'] == 'x'
+  assert record['seconds'] > 0
+  # Phases follow each other and are within the call.
+  t = record['start']
+  for phase in record['phases']:
+    assert abs(phase['start'] - t) < 1e-9, phase
+    assert phase['seconds'] >= 0, phase
+    t = phase['start'] + phase['seconds']
+  assert t <= record['start'] + record['seconds'] + 1e-9
+
+def test_records():
+  for draw in (True, False):
+    options = {} if draw else {'draw': False}
+    ax = plotted()
+    counted = count_draws(ax.figure)
+    collector = Collector()
+    datetick('x', axes=ax, profile=collector, **options)
+    assert len(collector.records) == 1, options
+    record = collector.records[0]
+    check(record)
+    assert names(record) == PHASES[draw], (options, names(record))
+    assert record['draws'] == counted[0] == (2 if draw else 0), options
+    assert not record['unchanged'], options
+    rule = tickplan(*ax.get_xlim(), length=_space(ax.xaxis)[0]).rule
+    assert record['rule'] == {key: getattr(rule, key) for key in record['rule']}, options
+    assert record['major_ticks'] == len(ax.get_xticks()), options
+
+    # A pan by a minute keeps the ticks; the callback's call is recorded.
+    ax.set_xlim(X[0] + datetime.timedelta(minutes=61), X[1] - datetime.timedelta(minutes=59))
+    assert len(collector.records) == 2, options
+    record = collector.records[1]
+    check(record)
+    assert record['unchanged'], options
+    assert 'callbacks' not in names(record), options
+
+def test_trace():
+  ax = plotted()
+  collector = Collector()
+  datetick('x', axes=ax, profile=collector)
+  ax.set_xlim(X[0], X[0] + datetime.timedelta(hours=5))
+
+  trace = json.loads(json.dumps(collector.chrome_trace()))
+  assert trace['displayTimeUnit'] == 'ms'
+  events = trace['traceEvents']
+  calls = [e for e in events if e['name'] == 'datetick']
+  assert len(calls) == len(collector.records) == 2
+  assert len(events) == sum(1 + len(r['phases']) for r in collector.records)
+  for e in events:
+    assert set(e) == {'name', 'ph', 'ts', 'dur', 'pid', 'tid', 'args'}, e
+    assert e['ph'] == 'X' and e['dur'] >= 0, e
+    assert isinstance(e['pid'], int) and isinstance(e['tid'], int), e
+    # Each phase is within a datetick() call in the same thread (times
+    # are in microseconds).
+    assert any(c['tid'] == e['tid'] and c['ts'] <= e['ts'] + 1e-3
+               and e['ts'] + e['dur'] <= c['ts'] + c['dur'] + 1e-3 for c in calls), e
+  for call, record in zip(calls, collector.records):
+    assert call['args']['unchanged'] == record['unchanged']
+    assert call['args']['draws'] == record['draws']
+    assert 'phases' not in call['args']
+
+  path = os.path.join(tempfile.mkdtemp(), 'datetick.trace.json')
+  collector.save(path)
+  with open(path) as f:
+    assert json.load(f) == trace
+  collector.save(path, format='json')
+  with open(path) as f:
+    records = json.load(f)
+  assert [names(r) for r in records] == [names(r) for r in collector.records]
+  assert [r['seconds'] for r in records] == [r['seconds'] for r in collector.records]
+
+if __name__ == '__main__':
+  test_records()
+  test_trace()
+  print('profile tests passed')
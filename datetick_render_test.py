@@ -0,0 +1,60 @@
+# Check python -m datetick render: a line that is not valid JSON gives a
+# result with ok False and the other jobs are still rendered, the dpi
+# option sets the image dpi and does not carry over to later jobs
+# rendered with the same figure, and tz, epoch, and rules are accepted.
+#
+# Run with `python datetick_render_test.py` or pytest.
+
+import io
+import os
+import json
+import struct
+import tempfile
+import contextlib
+
+from datetick.__main__ import main
+
+def size(path):
+  '''Returns (width, height) of PNG file'''
+  with open(path, 'rb') as f:
+    return struct.unpack('>II', f.read(24)[16:24])
+
+def run(lines, *args):
+  '''Runs the render command on lines; returns exit code and results'''
+  directory = tempfile.mkdtemp()
+  path = os.path.join(directory, 'jobs.jsonl')
+  with open(path, 'w') as f:
+    f.write('\n'.join(lines).replace('OUT', directory) + '\n')
+  stdout = io.StringIO()
+  with contextlib.redirect_stdout(stdout):
+    code = main(['render', path] + list(args))
+  results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+  return code, sorted(results, key=lambda r: r['index'])
+
+def job(name, **options):
+  return json.dumps({'start': '2001-01-01T00:00:00', 'end': '2001-01-02T01:00:00',
+                     'output': 'OUT/%s.png' % name, 'options': options})
+
+def test_render():
+  directory = tempfile.mkdtemp()
+  rules = os.path.join(directory, 'rules.json')
+  with open(rules, 'w') as f:
+    json.dump([{'span': None, 'major': ['hour', 6], 'minor': ['hour', 1], 'fmt1': '%H', 'fmt2': ''}], f)
+
+  lines = [job('a'), job('b', dpi=200), '{"start": "2001-01-01", ', job('c'),
+           job('d', tz='America/New_York', epoch='gps', rules=rules)]
+  for processes in ('1', '2'):
+    code, results = run(lines, '-j', processes)
+    assert code == 1
+    assert [r['ok'] for r in results] == [True, True, False, True, True], results
+    assert results[2]['error'].startswith('JSONDecodeError'), results[2]
+    a, b, c = [size(results[i]['output']) for i in (0, 1, 3)]
+    assert c == a
+    assert abs(b[0] - 2*a[0]) < 20 and abs(b[1] - 2*a[1]) < 20, (a, b)
+
+  code, results = run([job('a', debug=True)], '-j', '1')
+  assert code == 1 and 'not valid' in results[0]['error']
+
+if __name__ == '__main__':
+  test_render()
+  print('render tests passed')
@@ -0,0 +1,149 @@
+# Check span rule tables: load_rules() reads the same table from JSON and
+# TOML, the rule for a span is the first whose span is larger (bisect),
+# a rule for a larger span is used when the tick budget is exceeded,
+# tickplan() places no ticks if the last rule would place more than
+# MAXTICKS, and invalid tables and non-finite limits are rejected with a
+# ValueError.
+#
+# Run with `python datetick_rules_test.py` or pytest.
+
+import os
+import json
+import tempfile
+
+import numpy as np
+
+from datetick import load_rules, compile_rules, tickplan
+from datetick.rules import RULES, DEFAULT_RULES, _rule
+
+TABLE = [
+  {'span': 3600, 'major': ['minute', 10], 'minor': ['minute', 2], 'fmt1': '%H:%M', 'fmt2': '%Y-%m-%d'},
+  {'span': 86400, 'major': ['hour', 3], 'minor': ['hour', 1], 'fmt1': '%H', 'fmt2': '%Y-%m-%d'},
+  {'span': None, 'major': ['day', 1], 'minor': ['hour', 6], 'fmt1': '%d', 'fmt2': ''},
+]
+
+TOML = '''
+[[rules]]
+span = 3600
+major = ["minute", 10]
+minor = ["minute", 2]
+fmt1 = "%H:%M"
+fmt2 = "%Y-%m-%d"
+
+[[rules]]
+span = 86400
+major = ["hour", 3]
+minor = ["hour", 1]
+fmt1 = "%H"
+fmt2 = "%Y-%m-%d"
+
+[[rules]]
+span = inf
+major = ["day", 1]
+minor = ["hour", 6]
+fmt1 = "%d"
+fmt2 = ""
+'''
+
+START = np.datetime64('2001-01-01', 's')
+
+def write(name, text):
+  path = os.path.join(tempfile.mkdtemp(), name)
+  with open(path, 'w') as f:
+    f.write(text)
+  return path
+
+def spans(rules):
+  return [(rule.span, rule.major, rule.minor, rule.fmt1, rule.fmt2) for rule in rules.rules]
+
+def fmt1(rules, seconds):
+  return tickplan(START, START + np.timedelta64(seconds, 's'), rules=rules).rule.fmt1
+
+def test_load():
+  rules = load_rules(write('rules.json', json.dumps({'rules': TABLE})))
+  assert spans(rules) == spans(load_rules(write('rules.toml', TOML)))
+  assert spans(rules) == spans(compile_rules(TABLE))
+  assert rules.spans == (3600.0, 86400.0, float('inf'))
+  # A span is covered by the first rule with a larger span; spans past
+  # the last finite span use the last rule.
+  assert fmt1(rules, 3599) == '%H:%M'
+  assert fmt1(rules, 3600) == '%H'
+  assert fmt1(rules, 86399) == '%H'
+  assert fmt1(rules, 86400) == '%d'
+  assert fmt1(rules, 10*86400) == '%d'
+  # A list without the "rules" key is also accepted.
+  assert spans(load_rules(write('rules.json', json.dumps(TABLE)))) == spans(rules)
+
+def test_default():
+  assert len(RULES.rules) == len(DEFAULT_RULES)
+  for i, span in enumerate(RULES.spans[:-1]):
+    below = _rule(0.0, 0.999*span/86400)
+    assert below is RULES.rules[i], span
+    # A span equal to a rule's span is covered by the next rule.
+    assert _rule(0.0, span/86400) is RULES.rules[i + 1], span
+
+def test_budget():
+  # The first rule would place 3*86400/120 ticks for a 3-day span; with
+  # an axis length of 100 points, the budget is 50 ticks.
+  rules = compile_rules([(None, ('minute', 2), ('minute', 1), '%H:%M', '')])
+  assert _rule(0.0, 3.0, rules=rules, length=100) is rules.rules[0]
+  rules = compile_rules([(86400*7, ('minute', 2), ('minute', 1), '%H:%M', ''),
+                         (None, ('day', 1), ('hour', 6), '%d', '')])
+  assert _rule(0.0, 3.0, rules=rules, length=100) is rules.rules[1]
+
+def test_maxticks():
+  # The only rule is too fine for two months: as with a CalendarLocator,
+  # no ticks are placed instead of more than MAXTICKS.
+  rules = compile_rules([(None, ('second', 1), ('microsecond', 100000), '%M:%S', '')])
+  plan = tickplan(START, START + np.timedelta64(59*86400, 's'), rules=rules)
+  assert len(plan.major) == 0 and len(plan.minor) == 0 and len(plan.labels) == 0
+  plan = tickplan(START, START + np.timedelta64(60, 's'), rules=rules)
+  assert len(plan.major) == 61
+
+def test_limits():
+  # NaN, inf, and NaT limits are rejected instead of planning ticks
+  # without end.
+  for tmin, tmax in [(np.nan, 1.0), (0.0, np.inf), (-np.inf, np.nan),
+                     (np.datetime64('NaT'), START), (START, np.datetime64('NaT'))]:
+    try:
+      tickplan(tmin, tmax)
+    except ValueError as e:
+      assert 'not a valid time' in str(e), (tmin, tmax)
+    else:
+      raise AssertionError('%s, %s was not rejected' % (tmin, tmax))
+  try:
+    tickplan(0.0, np.nan, units='s')
+  except ValueError:
+    pass
+  else:
+    raise AssertionError('NaN seconds were not rejected')
+
+def invalid(rules):
+  try:
+    compile_rules(rules)
+  except ValueError as e:
+    return str(e)
+  raise AssertionError('%s was not rejected' % (rules,))
+
+def test_invalid():
+  assert 'increasing' in invalid([TABLE[1], TABLE[0]])
+  assert 'At least one rule' in invalid([])
+  assert 'Unknown tick unit' in invalid([{**TABLE[0], 'major': ['fortnight', 1]}])
+  assert 'at least 1' in invalid([{**TABLE[0], 'minor': ['minute', 0]}])
+  assert 'anchor' in invalid([{**TABLE[0], 'major': ['minute', 10, 'end']}])
+  path = write('rules.json', json.dumps({'rules': [TABLE[2], TABLE[0]]}))
+  try:
+    load_rules(path)
+  except ValueError:
+    pass
+  else:
+    raise AssertionError('%s was not rejected' % path)
+
+if __name__ == '__main__':
+  test_load()
+  test_default()
+  test_budget()
+  test_maxticks()
+  test_limits()
+  test_invalid()
+  print('rules tests passed')
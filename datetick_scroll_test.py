@@ -0,0 +1,97 @@
+# Check the Scroller: set_lim() takes float datenums as well as datetimes,
+# and as the view slides, the ticks kept from earlier frames plus those
+# generated for the part that entered the view are the ticks and labels
+# of tickplan() for the same limits, while only a few ticks are generated
+# per frame. After a resize, the rule is selected again for the new axis
+# length. pyplot is not used.
+#
+# Run with `python datetick_scroll_test.py` or pytest.
+
+import datetime
+
+import numpy as np
+import matplotlib.dates as mpld
+
+from datetick import tickplan
+from datetick.metrics import _space
+from datetick.scroll import Scroller, _Window
+from datetick_testing import axes
+
+START = datetime.datetime(2001, 1, 1, 22)
+
+def scroller():
+  ax = axes()
+  ax.plot([START, START + datetime.timedelta(days=1)], [0.0, 1.0])
+  return Scroller(ax)
+
+def visible(ax, vmin, vmax):
+  '''Returns major ticks and labels of ax between vmin and vmax'''
+  ax.figure.canvas.draw()
+  keep = [vmin <= x <= vmax for x in ax.get_xticks()]
+  labels = [t.get_text() for t in ax.get_xticklabels()]
+  return (np.array([x for x, k in zip(ax.get_xticks(), keep) if k]),
+          [label for label, k in zip(labels, keep) if k])
+
+def test_set_lim():
+  s = scroller()
+  vmin = float(mpld.date2num(np.datetime64('2001-01-01')))
+  vmax = float(mpld.date2num(np.datetime64('2001-01-01T05')))
+  s.set_lim(vmin, vmax)
+  assert s.axes.get_xlim() == (vmin, vmax)
+  s.set_lim(np.datetime64('2001-01-01'), np.datetime64('2001-01-01T05'))
+  assert s.axes.get_xlim() == (vmin, vmax)
+  s.set_lim(datetime.datetime(2001, 1, 1), datetime.datetime(2001, 1, 1, 5))
+  assert s.axes.get_xlim() == (vmin, vmax)
+  # tick_values() takes limits in axis units.
+  locator = s.axis.get_major_locator()
+  assert np.array_equal(locator.tick_values(vmin, vmax), locator())
+
+def test_resize():
+  s = scroller()
+  vmin = float(mpld.date2num(START))
+  lim = (vmin, vmin + 2)
+  s.set_lim(*lim)
+  visible(s.axes, *lim)
+  wide = s.rule
+  # The same limits on a narrower axis use a rule for a larger span.
+  s.axes.figure.set_size_inches(1.5, 2)
+  major, labels = visible(s.axes, *lim)
+  plan = tickplan(*lim, length=_space(s.axis)[0])
+  assert s.rule is plan.rule and s.rule is not wide
+  assert np.allclose(major, plan.major, rtol=0, atol=1e-9)
+  assert labels == list(plan.labels)
+
+def test_reuse():
+  generated = []
+  original = _Window._ticks
+  def count(self, vmin, vmax):
+    values = original(self, vmin, vmax)
+    generated.append(len(values))
+    return values
+  _Window._ticks = count
+  try:
+    s = scroller()
+    length = _space(s.axis)[0]
+    width = 1/24
+    vmin = float(mpld.date2num(START))
+    for frame in range(60):
+      # Slide 1 minute a frame across midnight.
+      lim = (vmin + frame/1440, vmin + frame/1440 + width)
+      s.set_lim(*lim)
+      generated.clear()
+      major, labels = visible(s.axes, *lim)
+      plan = tickplan(*lim, length=length)
+      assert s.rule is plan.rule, frame
+      assert np.allclose(major, plan.major, rtol=0, atol=1e-9), frame
+      assert labels == list(plan.labels), frame
+      if frame > 0:
+        # Only ticks in the minute that entered the view are generated.
+        assert sum(generated) <= 2*3, (frame, generated)
+  finally:
+    _Window._ticks = original
+
+if __name__ == '__main__':
+  test_set_lim()
+  test_resize()
+  test_reuse()
+  print('scroll tests passed')
@@ -0,0 +1,46 @@
+# Check the tick-plan service (python -m datetick plan): plans() gives one
+# result per non-blank line, in order, with ok False for lines that are
+# not valid JSON, requests that are not objects, and requests with
+# missing or invalid keys (including a width_px that is not positive),
+# and the same results with worker processes.
+#
+# Run with `python datetick_service_test.py` or pytest.
+
+import json
+
+from datetick import tickplan
+from datetick.service import plans, _datetime64
+
+LINES = [
+  '{"id": 1, "start": "2001-01-01T00:00:00Z", "end": "2001-01-02T01:00:00Z", "width_px": 600}',
+  '{"id": 2, "start": "2001-01-01", ',
+  '',
+  '[1, 2, 3]',
+  '{"id": 3, "start": "2001-01-01T00:00:00Z"}',
+  '{"id": 4, "start": "not a time", "end": "2001-01-02"}',
+  '{"id": 5, "start": "2001-01-01T00:00:00-05:00", "end": "2001-01-01T06:00:00Z", "tz": "America/New_York"}',
+  '"2001-01-01"',
+  '{"id": 6, "start": "2001-01-01T00:00:00Z", "end": "2001-01-01T00:00:01Z"}',
+  '{"id": 7, "start": "2001-01-01T00:00:00Z", "end": "2001-01-02T01:00:00Z", "width_px": 0}',
+  '{"id": 8, "start": "2001-01-01T00:00:00Z", "end": "2001-01-02T01:00:00Z", "width_px": -600}',
+]
+
+def test_plans():
+  results = [json.loads(line) for line in plans(LINES)]
+  assert [r['ok'] for r in results] == [True, False, False, False, False, True, False, True, False, False]
+  assert [r.get('id') for r in results] == [1, None, None, 3, 4, 5, None, 6, 7, 8]
+  assert 'width_px' in results[8]['error'] and 'width_px' in results[9]['error']
+  for r in results:
+    assert r['ok'] or r['error'], r
+
+  expected = tickplan(_datetime64('2001-01-01T05:00:00Z'), _datetime64('2001-01-01T06:00:00Z'),
+                      tz='America/New_York')
+  assert results[5]['labels'] == [str(label) for label in expected.labels]
+
+  # Chunks of 2 lines sent to 2 worker processes.
+  for processes in (1, 2):
+    assert list(plans(LINES, processes=processes, chunksize=2)) == list(plans(LINES)), processes
+
+if __name__ == '__main__':
+  test_plans()
+  print('service tests passed')
@@ -0,0 +1,63 @@
+# Check datetick() on axes that share an x axis: a limit change re-ticks
+# the group once (one datetick() call and at most two canvas draws, for
+# any number of panels), and the labels are those of a single axes with
+# the same limits. pyplot is not used.
+#
+# Run with `python datetick_shared_test.py` or pytest.
+
+import datetime
+
+
+from datetick import datetick, datetick_figure
+import datetick_testing as testing
+
+X = [datetime.datetime(2001, 1, 1), datetime.datetime(2001, 1, 3)]
+ZOOM = (datetime.datetime(2001, 1, 1), datetime.datetime(2001, 1, 1, 5))
+
+def figure(n, outer=True):
+  '''Returns figure with n axes sharing x and list of canvas draw counts'''
+  fig = testing.figure((8, 2*n))
+  if outer:
+    # Tick labels only on the bottom axes.
+    axes = fig.subplots(n, sharex=True, squeeze=False)[:, 0]
+  else:
+    axes = [fig.add_subplot(n, 1, 1)]
+    for i in range(1, n):
+      axes.append(fig.add_subplot(n, 1, i + 1, sharex=axes[0]))
+  for ax in axes:
+    ax.plot(X, [0.0, 1.0])
+  return fig, list(axes), testing.count_draws(fig)
+
+def expected():
+  fig, axes, _ = figure(1)
+  datetick('x', axes=axes[0])
+  axes[0].set_xlim(*ZOOM)
+  return [t.get_text() for t in axes[0].get_xticklabels()]
+
+def test_group():
+  labels = expected()
+  for outer in (True, False):
+    for options in ({}, {'draw': False}):
+      for n in (2, 6):
+        fig, axes, draws = figure(n, outer=outer)
+        records = []
+        for ax in axes:
+          datetick('x', axes=ax, profile=records.append, **options)
+        records.clear()
+        draws[0] = 0
+        axes[0].set_xlim(*ZOOM)
+        assert len(records) == 1, (outer, options, n)
+        assert draws[0] <= (0 if options else 2), (outer, options, n)
+        assert [t.get_text() for t in axes[-1].get_xticklabels()] == labels, (outer, options, n)
+
+def test_figure():
+  fig, axes, draws = figure(4)
+  records = []
+  datetick_figure(fig, dirs='x', profile=records.append)
+  assert len(records) == 1
+  assert draws[0] == 0
+
+if __name__ == '__main__':
+  test_group()
+  test_figure()
+  print('shared axes tests passed')
@@ -0,0 +1,88 @@
+# Check the ticks and labels that datetick() produces for time ranges
+# covering every span rule against the JSON snapshots in
+# datetick_test/snapshots/. Nothing is rendered, so this runs in well under
+# a second; the SVGs created by datetick_test.py are for visual review.
+#
+# Run with `python datetick_snapshot_test.py` or pytest. After an intended
+# change in ticks or labels, update the snapshots with
+#
+#   python datetick_snapshot_test.py --update
+#
+# and review the diff.
+
+import os
+import sys
+import json
+import time
+import datetime
+
+from datetick.rules import RULES
+from datetick.snapshot import snapshot, compare
+from datetick_test import RANGES
+
+DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datetick_test', 'snapshots')
+
+def cases():
+  '''Returns list of (start, end) ISO 8601 strings'''
+
+  ranges = []
+  for r in RANGES:
+    if r not in ranges:
+      ranges.append(r)
+
+  # Just below and just above the upper edge of each span rule, starting
+  # at a day boundary and just before a year boundary.
+  for start in ['2001-01-01T00:00:00', '2001-12-31T23:59:59.500000']:
+    t = datetime.datetime.fromisoformat(start)
+    for span in RULES.spans:
+      if span == float('inf'):
+        continue
+      for f in (0.99, 1.01):
+        end = t + datetime.timedelta(seconds=f*span)
+        ranges.append((start, end.isoformat(timespec='microseconds')))
+
+  return ranges
+
+def fname(ds1, ds2):
+  ds1 = ds1.replace(":","").replace("-","").replace("T","").replace("Z","")
+  ds2 = ds2.replace(":","").replace("-","").replace("T","").replace("Z","")
+  return os.path.join(DIR, f'{ds1}-{ds2}.json')
+
+def update():
+  os.makedirs(DIR, exist_ok=True)
+  for ds1, ds2 in cases():
+    with open(fname(ds1, ds2), 'w') as f:
+      json.dump(snapshot(ds1, ds2), f, indent=1)
+      f.write('\n')
+
+def check():
+  '''Returns dict of {file: differences} for cases that do not match'''
+  failures = {}
+  for ds1, ds2 in cases():
+    file = fname(ds1, ds2)
+    if not os.path.exists(file):
+      failures[file] = ['snapshot file not found']
+      continue
+    with open(file) as f:
+      expected = json.load(f)
+    diffs = compare(expected, snapshot(ds1, ds2))
+    if diffs:
+      failures[file] = diffs
+  return failures
+
+def test_snapshots():
+  t = time.perf_counter()
+  failures = check()
+  print(f'{len(cases())} snapshots checked in {1000*(time.perf_counter() - t):.0f} ms')
+  for file in failures:
+    print(file)
+    for diff in failures[file]:
+      print('  ' + diff)
+  assert len(failures) == 0
+
+if __name__ == '__main__':
+  if '--update' in sys.argv:
+    update()
+    print(f'Wrote {len(cases())} snapshots to {DIR}')
+  else:
+    test_snapshots()
@@ -6,9 +6,6 @@ import matplotlib.pyplot as plt
 
 from datetick import datetick
 
-if not os.path.exists('datetick_test'):
-    os.makedirs('datetick_test', exist_ok=True)
-
 def append_to_readme(image_links):
 
   with open('README.md', 'r+') as file:
@@ -46,203 +43,215 @@ def plot(ds1, ds2):
   plt.close()
   image_links.append(f'![{fname}]({fname})')
 
-###############################################################################
-# 0.1 <= dt < 0.5 second
-plot('2001-01-01T00:00:00.0Z','2001-01-01T00:00:00.2Z')
-plot('2001-01-01T00:00:00.0Z','2001-01-01T00:00:00.1Z')
+# Time ranges (start, end) that are plotted.
+RANGES = [
+  ###############################################################################
+  # 0.1 <= dt < 0.5 second
+  ('2001-01-01T00:00:00.0Z', '2001-01-01T00:00:00.2Z'),
+  ('2001-01-01T00:00:00.0Z', '2001-01-01T00:00:00.1Z'),
+
+  ###############################################################################
+  # .5 <= dt < 1 second
 
-###############################################################################
-# .5 <= dt < 1 second
+  ('2001-01-01T00:00:00.0Z', '2001-01-01T00:00:00.5Z'),
+  ('2001-01-01T00:00:00.01Z', '2001-01-01T00:00:00.99Z'),
 
-plot('2001-01-01T00:00:00.0Z','2001-01-01T00:00:00.5Z')
-plot('2001-01-01T00:00:00.01Z','2001-01-01T00:00:00.99Z')
+  # Cross minute boundary
+  ('2001-01-01T00:00:59.8Z', '2001-01-01T00:01:00.3Z'),
 
-# Cross minute boundary
-plot('2001-01-01T00:00:59.8Z','2001-01-01T00:01:00.3Z')
+  # Cross hour boundary
+  ('2001-01-01T00:59:59.8Z', '2001-01-01T01:00:03.0Z'),
 
-# Cross hour boundary
-plot('2001-01-01T00:59:59.8Z','2001-01-01T01:00:03.0Z')
+  # Cross day boundary
+  ('2001-01-01T23:59:59.8Z', '2001-01-02T00:00:03.0Z'),
 
-# Cross day boundary
-plot('2001-01-01T23:59:59.8Z','2001-01-02T00:00:03.0Z')
+  ###############################################################################
+  # 1 <= dt < 5 second
 
-###############################################################################
-# 1 <= dt < 5 second
+  ('2001-01-01T00:00:00Z', '2001-01-01T00:00:01Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-01T00:00:05Z'),
 
-plot('2001-01-01T00:00:00Z','2001-01-01T00:00:01Z')
-plot('2001-01-01T00:00:00Z','2001-01-01T00:00:05Z')
+  # Cross minute boundary
+  ('2001-01-01T00:00:59Z', '2001-01-01T00:01:03Z'),
 
-# Cross minute boundary
-plot('2001-01-01T00:00:59Z','2001-01-01T00:01:03Z')
+  # Cross hour boundary
+  ('2001-01-01T00:59:58Z', '2001-01-01T01:00:03Z'),
+  ('2001-01-01T00:59:59Z', '2001-01-01T01:00:04Z'),
 
-# Cross hour boundary
-plot('2001-01-01T00:59:58Z','2001-01-01T01:00:03Z')
-plot('2001-01-01T00:59:59Z','2001-01-01T01:00:04Z')
+  # Cross day boundary
+  ('2001-01-01T23:59:58Z', '2001-01-02T00:00:03Z'),
 
-# Cross day boundary
-plot('2001-01-01T23:59:58Z','2001-01-02T00:00:03Z')
+  ###############################################################################
+  # 5 <= dt < 10 second
 
-###############################################################################
-# 5 <= dt < 10 second
+  ('2001-01-01T00:00:00Z', '2001-01-01T00:00:07Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-01T00:00:09Z'),
+  ('2001-01-01T00:00:01Z', '2001-01-01T00:00:06Z'),
 
-plot('2001-01-01T00:00:00Z','2001-01-01T00:00:07Z')
-plot('2001-01-01T00:00:00Z','2001-01-01T00:00:09Z')
-plot('2001-01-01T00:00:01Z','2001-01-01T00:00:06Z')
+  # Cross day boundary
+  ('2001-01-01T23:59:58Z', '2001-01-02T00:00:05Z'),
 
-# Cross day boundary
-plot('2001-01-01T23:59:58Z','2001-01-02T00:00:05Z')
+  # Cross day boundary
+  # Problem: Second row of labels overlap
+  ('2001-01-01T23:59:59Z', '2001-01-02T00:00:05Z'),
 
-# Cross day boundary
-# Problem: Second row of labels overlap
-plot('2001-01-01T23:59:59Z','2001-01-02T00:00:05Z')
+  # Cross hour boundary only
+  ('2001-01-01T00:59:58Z', '2001-01-01T01:00:05Z'),
 
-# Cross hour boundary only
-plot('2001-01-01T00:59:58Z','2001-01-01T01:00:05Z')
+  # Cross hour boundary/max time span for this tick locator
+  ('2001-01-01T00:59:58Z', '2001-01-01T01:00:07Z'),
 
-# Cross hour boundary/max time span for this tick locator
-plot('2001-01-01T00:59:58Z','2001-01-01T01:00:07Z')
+  # Cross hour boundary/min time span for this tick locator
+  ('2001-01-01T00:59:58Z', '2001-01-01T01:00:03Z'),
 
-# Cross hour boundary/min time span for this tick locator
-plot('2001-01-01T00:59:58Z','2001-01-01T01:00:03Z')
+  ###############################################################################
+  # 10 <= dt < 20 second
 
-###############################################################################
-# 10 <= dt < 20 second
+  # Cross day boundary
+  ('2001-01-01T23:59:56Z', '2001-01-02T00:00:10Z'),
 
-# Cross day boundary
-plot('2001-01-01T23:59:56Z','2001-01-02T00:00:10Z')
+  # Cross day boundary
+  # Problem: Second row of labels overlap
+  ('2001-01-01T23:59:58Z', '2001-01-02T00:00:10Z'),
 
-# Cross day boundary
-# Problem: Second row of labels overlap
-plot('2001-01-01T23:59:58Z','2001-01-02T00:00:10Z')
+  # Cross hour boundary only
+  ('2001-01-01T00:59:56Z', '2001-01-01T01:00:10Z'),
 
-# Cross hour boundary only
-plot('2001-01-01T00:59:56Z','2001-01-01T01:00:10Z')
+  # Cross hour boundary/max time span for this tick locator
+  ('2001-01-01T00:59:56Z', '2001-01-01T01:00:15Z'),
 
-# Cross hour boundary/max time span for this tick locator
-plot('2001-01-01T00:59:56Z','2001-01-01T01:00:15Z')
+  # Cross hour boundary/min time span for this tick locator
+  ('2001-01-01T00:59:56Z', '2001-01-01T01:00:06Z'),
 
-# Cross hour boundary/min time span for this tick locator
-plot('2001-01-01T00:59:56Z','2001-01-01T01:00:06Z')
+  ###############################################################################
+  # 20 <= dt < 30 second
 
-###############################################################################
-# 20 <= dt < 30 second
+  ('2001-01-01T00:00:00Z', '2001-01-01T00:00:21Z'),
 
-plot('2001-01-01T00:00:00Z','2001-01-01T00:00:21Z')
+  ###############################################################################
+  # 6 <= dt < 12 hours
 
-###############################################################################
-# 6 <= dt < 12 hours
+  ('2001-01-01T00:00:00Z', '2001-01-01T06:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-01T09:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-01T11:00:00Z'),
 
-plot('2001-01-01T00:00:00Z','2001-01-01T06:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-01T09:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-01T11:00:00Z')
+  # Cross hour boundary
+  ('2001-01-01T00:59:58Z', '2001-01-01T01:00:28Z'),
 
-# Cross hour boundary
-plot('2001-01-01T00:59:58Z','2001-01-01T01:00:28Z')
+  # Cross minute boundary
+  ('2001-01-01T00:00:58Z', '2001-01-01T00:01:18Z'),
 
-# Cross minute boundary
-plot('2001-01-01T00:00:58Z','2001-01-01T00:01:18Z')
+  ###############################################################################
+  # 12 <= dt < 24 hours
 
-###############################################################################
-# 12 <= dt < 24 hours
+  ('2001-01-01T00:00:00Z', '2001-01-01T18:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-01T12:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-01T23:00:00Z'),
+  ('2001-01-01T02:00:00Z', '2001-01-02T01:00:00Z'),
 
-plot('2001-01-01T00:00:00Z','2001-01-01T18:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-01T12:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-01T23:00:00Z')
-plot('2001-01-01T02:00:00Z','2001-01-02T01:00:00Z')
+  ###############################################################################
+  # 24 <= dt < 48 hours
 
-###############################################################################
-# 24 <= dt < 48 hours
+  ('2001-01-01T00:00:00Z', '2001-01-02T01:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-02T23:00:00Z'),
+  ('2001-01-01T06:00:00Z', '2001-01-02T07:00:00Z'),
+  ('2001-01-01T00:30:00Z', '2001-01-02T01:00:00Z'),
 
-plot('2001-01-01T00:00:00Z','2001-01-02T01:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-02T23:00:00Z')
-plot('2001-01-01T06:00:00Z','2001-01-02T07:00:00Z')
-plot('2001-01-01T00:30:00Z','2001-01-02T01:00:00Z')
+  ###############################################################################
+  # 48 <= dt < 72 hours
 
-###############################################################################
-# 48 <= dt < 72 hours
+  ('2001-01-01T00:00:00Z', '2001-01-03T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-03T12:30:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-03T23:59:59Z'),
 
-plot('2001-01-01T00:00:00Z','2001-01-03T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-03T12:30:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-03T23:59:59Z')
+  ###############################################################################
+  # 4 <= dt < 8 days
 
-###############################################################################
-# 4 <= dt < 8 days
+  ('2001-01-01T00:00:00Z', '2001-01-05T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-05T00:00:00Z'),
+  ('2001-01-30T00:00:00Z', '2001-02-01T23:00:00Z'), # Span month boundary
+  ('2001-12-30T00:00:00Z', '2002-01-01T23:00:00Z'), # Span year boundary
 
-plot('2001-01-01T00:00:00Z','2001-01-05T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-05T00:00:00Z')
-plot('2001-01-30T00:00:00Z','2001-02-01T23:00:00Z') # Span month boundary
-plot('2001-12-30T00:00:00Z','2002-01-01T23:00:00Z') # Span year boundary
+  ###############################################################################
+  # 8 <= dt < 16 days
 
-###############################################################################
-# 8 <= dt < 16 days
+  ('2001-01-01T00:00:00Z', '2001-01-09T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-16T23:00:00Z'),
+  ('2001-01-30T00:00:00Z', '2001-02-04T23:00:00Z'), # Span month boundary
+  ('2001-12-30T00:00:00Z', '2002-01-04T23:00:00Z'), # Span year boundary
 
-plot('2001-01-01T00:00:00Z','2001-01-09T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-16T23:00:00Z')
-plot('2001-01-30T00:00:00Z','2001-02-04T23:00:00Z') # Span month boundary
-plot('2001-12-30T00:00:00Z','2002-01-04T23:00:00Z') # Span year boundary
+  ###############################################################################
+  # 16 <= dt < 32 days
 
-###############################################################################
-# 16 <= dt < 32 days
+  ('2001-01-01T00:00:00Z', '2001-01-31T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-01-16T23:00:00Z'),
+  ('2001-01-30T00:00:00Z', '2001-02-15T23:00:00Z'), # Span month boundary
+  ('2001-12-30T00:00:00Z', '2001-01-15T23:00:00Z'), # Span year boundary
 
-plot('2001-01-01T00:00:00Z','2001-01-31T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-01-16T23:00:00Z')
-plot('2001-01-30T00:00:00Z','2001-02-15T23:00:00Z') # Span month boundary
-plot('2001-12-30T00:00:00Z','2001-01-15T23:00:00Z') # Span year boundary
+  ###############################################################################
+  # 32 <= dt < 60 days
 
-###############################################################################
-# 32 <= dt < 60 days
+  ('2001-01-01T00:00:00Z', '2001-02-02T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-02-27T23:00:00Z'),
+  ('2001-01-15T00:00:00Z', '2001-02-16T23:00:00Z'),
+  ('2001-12-31T00:00:00Z', '2002-02-26T23:00:00Z'), # Span year boundary
 
-plot('2001-01-01T00:00:00Z','2001-02-02T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-02-27T23:00:00Z')
-plot('2001-01-15T00:00:00Z','2001-02-16T23:00:00Z')
-plot('2001-12-31T00:00:00Z','2002-02-26T23:00:00Z') # Span year boundary
+  ###############################################################################
+  # 60 <= dt < 183 days
 
-###############################################################################
-# 60 <= dt < 183 days
+  ('2001-01-01T00:00:00Z', '2001-05-02T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-02-27T23:00:00Z'),
+  ('2001-12-31T00:00:00Z', '2002-02-26T23:00:00Z'),
 
-plot('2001-01-01T00:00:00Z','2001-05-02T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-02-27T23:00:00Z')
-plot('2001-12-31T00:00:00Z','2002-02-26T23:00:00Z')
+  ###############################################################################
+  # 183 <= dt < 367 days
 
-###############################################################################
-# 183 <= dt < 367 days
+  ('2001-01-01T00:00:00Z', '2001-07-02T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2001-12-31T00:00:00Z'),
+  ('2001-02-12T00:00:00Z', '2002-01-31T00:00:00Z'),
 
-plot('2001-01-01T00:00:00Z','2001-07-02T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2001-12-31T00:00:00Z')
-plot('2001-02-12T00:00:00Z','2002-01-31T00:00:00Z')
+  ###############################################################################
+  # 367 <= dt < 366*2 days
 
-###############################################################################
-# 367 <= dt < 366*2 days
+  ('2001-01-01T00:00:00Z', '2002-01-03T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2002-12-31T00:00:00Z'),
+  ('2001-04-01T00:00:00Z', '2002-04-30T00:00:00Z'),
+  ('2001-10-01T00:00:00Z', '2003-10-04T00:00:00Z'),
 
-plot('2001-01-01T00:00:00Z','2002-01-03T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2002-12-31T00:00:00Z')
-plot('2001-04-01T00:00:00Z','2002-04-30T00:00:00Z')
-plot('2001-10-01T00:00:00Z','2003-10-04T00:00:00Z')
+  ###############################################################################
+  # 366*2 days <= dt < 366*8 days
 
-###############################################################################
-# 366*2 days <= dt < 366*8 days
+  ('2001-01-01T00:00:00Z', '2008-12-31T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2003-01-04T00:00:00Z'),
 
-plot('2001-01-01T00:00:00Z','2008-12-31T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2003-01-04T00:00:00Z')
+  ###############################################################################
+  # 366*8 days <= dt < 366*15 days
 
-###############################################################################
-# 366*8 days <= dt < 366*15 days
+  ('2001-01-01T00:00:00Z', '2009-01-04T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2012-01-04T00:00:00Z'),
 
-plot('2001-01-01T00:00:00Z','2009-01-04T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2012-01-04T00:00:00Z')
+  ###############################################################################
+  # 366*15 days <= dt < 366*40 days
 
-###############################################################################
-# 366*15 days <= dt < 366*40 days
+  ('2000-01-01T00:00:00Z', '2017-01-04T00:00:00Z'),
+  ('2001-01-01T00:00:00Z', '2018-01-04T00:00:00Z'),
+  ('2002-01-01T00:00:00Z', '2019-01-04T00:00:00Z'),
+  ('2003-01-01T00:00:00Z', '2020-01-04T00:00:00Z'),
+  ('2004-01-01T00:00:00Z', '2030-01-04T00:00:00Z'),
 
-plot('2000-01-01T00:00:00Z','2017-01-04T00:00:00Z')
-plot('2001-01-01T00:00:00Z','2018-01-04T00:00:00Z')
-plot('2002-01-01T00:00:00Z','2019-01-04T00:00:00Z')
-plot('2003-01-01T00:00:00Z','2020-01-04T00:00:00Z')
-plot('2004-01-01T00:00:00Z','2030-01-04T00:00:00Z')
+  ###############################################################################
+  # > 50 years
 
-###############################################################################
-# > 50 years
+  ('1950-01-01T00:00:00Z', '2012-01-04T00:00:00Z'),
+]
+
+# Plots are only made when run as a script so that other scripts (e.g.,
+# datetick_benchmark.py) can import RANGES.
+if __name__ == '__main__':
+  if not os.path.exists('datetick_test'):
+    os.makedirs('datetick_test', exist_ok=True)
 
-plot('1950-01-01T00:00:00Z','2012-01-04T00:00:00Z')
+  for ds1, ds2 in RANGES:
+    plot(ds1, ds2)
 
-append_to_readme(image_links)
+  append_to_readme(image_links)
@@ -0,0 +1,36 @@
+# Helpers shared by the datetick_*_test.py scripts. Figures have an Agg
+# canvas and pyplot is not used, so tests may render in threads and
+# without a display.
+
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+def figure(figsize=(8, 2)):
+  '''Returns a new figure with an Agg canvas'''
+  fig = Figure(figsize=figsize)
+  FigureCanvasAgg(fig)
+  return fig
+
+def axes(figsize=(8, 2)):
+  '''Returns the axes of a new figure with an Agg canvas'''
+  return figure(figsize).subplots()
+
+def ticklabels(ax, dir='x'):
+  '''Renders the figure of ax and returns the major tick label strings'''
+  ax.figure.canvas.draw()
+  if dir == 'x':
+    return [t.get_text() for t in ax.get_xticklabels()]
+  return [t.get_text() for t in ax.get_yticklabels()]
+
+def count_draws(fig):
+  '''
+  Counts calls to fig.canvas.draw(), including those made by datetick();
+  returns a one-element list with the count
+  '''
+  draws = [0]
+  canvas_draw = fig.canvas.draw
+  def draw(*args, **kwargs):
+    draws[0] += 1
+    return canvas_draw(*args, **kwargs)
+  fig.canvas.draw = draw
+  return draws
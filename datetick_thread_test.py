@@ -0,0 +1,71 @@
+# Check that datetick() can be used from many threads at once on
+# independent matplotlib.figure.Figure objects: figures for time ranges
+# covering every span rule are rendered serially and then in a thread
+# pool, and the tick labels must match. pyplot must not be imported.
+#
+# Run with `python datetick_thread_test.py` or pytest.
+
+import sys
+import datetime
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+
+from datetick import datetick
+from datetick.rules import RULES
+from datetick_testing import axes, ticklabels
+
+THREADS = 8
+
+def cases():
+  '''Returns list of (start, end, options) for about 200 figures'''
+
+  jobs = []
+  for start in ['2001-01-01T00:00:00', '2001-12-31T23:59:59.500000']:
+    t = datetime.datetime.fromisoformat(start)
+    for span in RULES.spans:
+      if span == float('inf'):
+        continue
+      end = t + datetime.timedelta(seconds=0.99*span)
+      for options in ({'draw': False}, {'draw': True}, {'lazy': True}):
+        jobs.append((t, end, options))
+  return jobs
+
+def render(job):
+  '''Returns (major tick labels, minor tick positions) of a rendered figure'''
+
+  start, end, options = job
+  ax = axes()
+  ax.plot([start, end], [0.0, 0.0], '*')
+  ax.set_xlim(start, end)
+  datetick('x', axes=ax, **options)
+  return ticklabels(ax), list(ax.xaxis.get_minorticklocs())
+
+def check(jobs=None):
+  '''Returns list of jobs whose threaded output differs from serial output'''
+
+  if jobs is None:
+    jobs = cases()
+  serial = [render(job) for job in jobs]
+  with ThreadPoolExecutor(THREADS) as pool:
+    threaded = list(pool.map(render, jobs))
+  return [job for job, a, b in zip(jobs, serial, threaded) if a != b]
+
+def test_threads():
+  failures = check()
+  for start, end, options in failures:
+    print(f'{start.isoformat()} - {end.isoformat()} {options}')
+  assert len(failures) == 0
+
+def test_no_pyplot():
+  # In a new process because other tests may have imported pyplot.
+  code = ('import sys, datetick_thread_test as t; t.check(t.cases()[:30]); '
+          'print("matplotlib.pyplot" in sys.modules)')
+  out = subprocess.run([sys.executable, '-c', code], check=True,
+                       capture_output=True, text=True).stdout
+  assert out.strip() == 'False'
+
+if __name__ == '__main__':
+  test_threads()
+  test_no_pyplot()
+  print(f'{len(cases())} figures rendered in {THREADS} threads')
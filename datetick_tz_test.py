@@ -0,0 +1,76 @@
+# Check ticks and labels in local time (datetick(..., tz=...)): day ticks
+# are at local midnight, the local clock is followed across changes to and
+# from daylight saving time, labels match Matplotlib's DateFormatter with
+# the same tz, and datetick() gives the same labels with draw=True,
+# draw=False, and lazy=True. pyplot is not used.
+#
+# Run with `python datetick_tz_test.py` or pytest.
+
+import datetime
+
+import numpy as np
+import dateutil.tz
+import matplotlib.dates as mpld
+
+from datetick import datetick, tickplan
+from datetick.rules import RULES
+from datetick.ticks import ticks
+from datetick_testing import axes, ticklabels
+
+TZ = 'America/New_York'
+
+def local(t, tz=TZ):
+  '''Returns datetime64 t as local time strings'''
+  return [x.astimezone(dateutil.tz.gettz(tz)).strftime('%Y-%m-%dT%H:%M')
+          for x in mpld.num2date(mpld.date2num(t))]
+
+def test_midnight():
+  # Spring change to daylight saving time on 2001-04-01.
+  plan = tickplan(np.datetime64('2001-03-29T12'), np.datetime64('2001-04-03T12'), tz=TZ)
+  assert local(plan.major) == ['2001-03-30T00:00', '2001-03-31T00:00', '2001-04-01T00:00',
+                               '2001-04-02T00:00', '2001-04-03T00:00']
+  assert plan.labels[0] == '30\n2001-03'
+
+def test_clock():
+  # Local 02:00 is skipped on 2001-04-01 ...
+  t = ticks(np.datetime64('2001-04-01T05'), np.datetime64('2001-04-01T08'), 'hour', tz=TZ)
+  assert local(t) == ['2001-04-01T00:00', '2001-04-01T01:00', '2001-04-01T03:00', '2001-04-01T04:00']
+  # ... and 01:00 occurs twice on 2001-10-28.
+  t = ticks(np.datetime64('2001-10-28T04'), np.datetime64('2001-10-28T07'), 'hour', tz=TZ)
+  assert local(t) == ['2001-10-28T00:00', '2001-10-28T01:00', '2001-10-28T01:00', '2001-10-28T02:00']
+  t = ticks(np.datetime64('2001-10-28T05:30'), np.datetime64('2001-10-28T06:30'), 'minute', 15, tz=TZ)
+  assert len(t) == 5
+
+def test_formatter():
+  start = np.datetime64('2001-10-27T22:00', 'us')
+  for tz in [TZ, 'Asia/Kolkata', 'Australia/Lord_Howe']:
+    for span in RULES.spans[:-1]:
+      end = start + np.timedelta64(int(0.99e6*span), 'us')
+      plan = tickplan(start, end, tz=tz)
+      if plan.rule.fmt1 == 'millis':
+        continue
+      formatter = mpld.DateFormatter(plan.rule.fmt1, tz=tz)
+      expected = [formatter(x) for x in mpld.date2num(plan.major)]
+      assert [label.split('\n')[0] for label in plan.labels] == expected, (tz, span)
+
+def labels(start, end, **options):
+  ax = axes()
+  ax.plot([start, end], [0.0, 0.0], '*')
+  ax.set_xlim(start, end)
+  datetick('x', axes=ax, tz=TZ, **options)
+  return ticklabels(ax), list(ax.get_xticks())
+
+def test_datetick():
+  start = datetime.datetime(2001, 10, 27, 22)
+  for span in RULES.spans[:-1]:
+    end = start + datetime.timedelta(seconds=0.99*span)
+    drawn = labels(start, end)
+    assert labels(start, end, draw=False) == drawn, span
+    assert labels(start, end, lazy=True)[0] == drawn[0], span
+
+if __name__ == '__main__':
+  test_midnight()
+  test_clock()
+  test_formatter()
+  test_datetick()
+  print('tz tests passed')